@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
+import os
 import threading
+from copy import deepcopy
 from importlib.metadata import version
 from logging import basicConfig, getLevelName
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from ase.atoms import Atoms
-from pymatgen.io.ase import MSONAtoms
 
-from quacc.settings import QuaccSettings, change_settings
+from quacc.settings import _DEFAULT_CONFIG_FILE_PATH, QuaccSettings, change_settings
 from quacc.types import DefaultSetting
 from quacc.utils.dicts import Remove
 from quacc.wflow_tools.customizers import redecorate, strip_decorator
@@ -41,27 +42,124 @@ __all__ = [
 # Load the quacc version
 __version__ = version("quacc")
 
-# Make Atoms MSONable
-Atoms.as_dict = MSONAtoms.as_dict  # type: ignore[attr-defined]
-Atoms.from_dict = MSONAtoms.from_dict  # type: ignore[attr-defined]
+
+# Make Atoms MSONable. Pymatgen is only imported once (de)serialization is
+# actually needed so that `import quacc` stays cheap on workflow workers.
+def _atoms_as_dict(atoms: Atoms) -> dict[str, Any]:
+    """
+    Serialize an Atoms object via `pymatgen.io.ase.MSONAtoms`.
+
+    Parameters
+    ----------
+    atoms
+        The Atoms object to serialize.
+
+    Returns
+    -------
+    dict
+        The MSONable representation of the Atoms object.
+    """
+    from pymatgen.io.ase import MSONAtoms
+
+    return MSONAtoms.as_dict(atoms)
+
+
+def _atoms_from_dict(dct: dict[str, Any]) -> Atoms:
+    """
+    Deserialize an Atoms object via `pymatgen.io.ase.MSONAtoms`.
+
+    Parameters
+    ----------
+    dct
+        The MSONable representation of the Atoms object.
+
+    Returns
+    -------
+    Atoms
+        The deserialized Atoms object.
+    """
+    from pymatgen.io.ase import MSONAtoms
+
+    return MSONAtoms.from_dict(dct)
+
+
+Atoms.as_dict = _atoms_as_dict  # type: ignore[attr-defined]
+Atoms.from_dict = staticmethod(_atoms_from_dict)  # type: ignore[attr-defined]
 
 # Load the settings
 _thread_local = threading.local()
+_base_settings_lock = threading.Lock()
+_base_settings: tuple[tuple, QuaccSettings] | None = None
+
+
+def _get_config_file_stamp() -> tuple[str, int, int] | None:
+    """
+    Get a cheap fingerprint of the YAML config file that the settings are read from.
+
+    Returns
+    -------
+    tuple[str, int, int] | None
+        The path, modification time (ns), and size of the file, or None if
+        the file does not exist.
+    """
+    config_file = os.environ.get("QUACC_CONFIG_FILE", str(_DEFAULT_CONFIG_FILE_PATH))
+    try:
+        # os.stat is used over pathlib since this is called on every get_settings()
+        stat = os.stat(os.path.expanduser(config_file))  # noqa: PTH111, PTH116
+    except OSError:
+        return None
+    return config_file, stat.st_mtime_ns, stat.st_size
+
+
+def _get_base_settings() -> tuple[tuple, QuaccSettings]:
+    """
+    Get the process-wide base settings. These are only re-instantiated when the
+    `QUACC_` environment variables or the YAML config file (as judged by its
+    modification time) have changed. The returned settings are shared between
+    threads and must never be modified in-place.
+
+    Returns
+    -------
+    tuple
+        The config file stamp that the base settings were generated from.
+    QuaccSettings
+        The cached base settings.
+    """
+    global _base_settings  # noqa: PLW0603
+
+    config_file_stamp = _get_config_file_stamp()
+    quacc_environ = tuple(
+        sorted((k, v) for k, v in os.environ.items() if k.upper().startswith("QUACC_"))
+    )
+    key = (config_file_stamp, quacc_environ)
+    with _base_settings_lock:
+        if _base_settings is None or _base_settings[0] != key:
+            _base_settings = (key, QuaccSettings())
+        return config_file_stamp, _base_settings[1]
 
 
 def _internally_set_settings(
-    changes: dict[str, Any] | None = None, reset: bool = False
+    changes: dict[str, Any] | None = None,
+    reset: bool = False,
+    overrides: dict[str, Any] | None = None,
 ) -> None:
     """
     Set the `.settings` attribute for the current thread. This is not meant to be
     called by users. If you want to change the settings, use `from quacc import change_settings`
 
+    The thread-local settings are a copy of the cached base settings with `changes`
+    overlaid on top. The overlaid values are recorded so that they can be re-applied
+    if the base settings are refreshed.
+
     Parameters
     ----------
     changes
         Changes to the settings, if any
     reset
         Reset the settings to the defaults of QuaccSettings()
+    overrides
+        If provided, replaces the record of overlaid values once `changes` are
+        applied. This is used to restore the prior state in `change_settings`.
 
     Returns
     -------
@@ -69,9 +167,22 @@ def _internally_set_settings(
     """
     changes = changes or {}
     if not hasattr(_thread_local, "settings") or reset:
-        _thread_local.settings = QuaccSettings()
+        config_file_stamp, base_settings = _get_base_settings()
+        # Copy mutable containers so they are never shared between threads
+        _thread_local.settings = base_settings.model_copy(
+            update={
+                key: deepcopy(value)
+                for key, value in base_settings
+                if isinstance(value, dict | list)
+            }
+        )
+        _thread_local.config_file_stamp = config_file_stamp
+        _thread_local.overrides = {}
     for key, value in changes.items():
         setattr(_thread_local.settings, key, value)
+        _thread_local.overrides[key] = getattr(_thread_local.settings, key)
+    if overrides is not None:
+        _thread_local.overrides = dict(overrides)
 
 
 def get_settings() -> QuaccSettings:
@@ -85,6 +196,11 @@ def get_settings() -> QuaccSettings:
     """
     if not hasattr(_thread_local, "settings"):
         _internally_set_settings(reset=True)
+    elif _get_config_file_stamp() != _thread_local.config_file_stamp:
+        # The config file changed on disk, so refresh and re-apply any overrides
+        overrides = _thread_local.overrides
+        _internally_set_settings(reset=True)
+        _internally_set_settings(changes=overrides)
     return _thread_local.settings
 
 
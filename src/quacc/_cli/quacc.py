@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
 
 from rich import print as rich_print
+from rich.markup import escape
 from typer import Exit, Option, Typer
 
 from quacc import get_settings
@@ -144,6 +145,66 @@ quacc settings: {settings}
     )
 
 
+@app.command("bench")
+def bench(
+    output: str = Option(
+        "quacc_bench.json", "--output", "-o", help="JSON file to write results to."
+    ),
+    select: str = Option(
+        "*", "--select", "-s", help="Glob pattern of the benchmarks to run."
+    ),
+    repeat: int = Option(5, "--repeat", "-r", help="Repeats per micro-benchmark."),
+    engines: list[str] | None = Option(  # noqa: B008
+        None,
+        "--engine",
+        "-e",
+        help="Workflow engine(s) for the fan-out benchmark. Defaults to all installed.",
+    ),
+    n_jobs: int = Option(100, "--n-jobs", help="Number of jobs in the fan-out."),
+) -> None:
+    """
+    Benchmark the overhead of quacc itself and write the results to a JSON file.
+
+    Parameters
+    ----------
+    output
+        The JSON file to write the results to.
+    select
+        A glob pattern for the names of the benchmarks to run.
+    repeat
+        The number of times to repeat each micro-benchmark.
+    engines
+        The workflow engines to run the fan-out benchmark with. Use "None" for
+        no workflow engine.
+    n_jobs
+        The number of jobs to fan out in the fan-out benchmark.
+
+    Returns
+    -------
+    None
+    """
+    from quacc.bench import run_benchmarks, write_results
+
+    if engines is not None:
+        engines = [None if engine == "None" else engine for engine in engines]
+
+    results = run_benchmarks(
+        select=select, repeat=repeat, engines=engines, n_jobs=n_jobs
+    )
+    for name, result in results["benchmarks"].items():
+        if "error" in result:
+            rich_print(f"{escape(name)}: failed ({result['error']})")
+        elif "median" in result:
+            rich_print(f"{escape(name)}: {result['median'] * 1e3:.3f} ms")
+        else:
+            rich_print(
+                f"{escape(name)}: {result['time_per_job'] * 1e3:.3f} ms/job "
+                f"({result['warmup_time']:.3f} s warm-up)"
+            )
+    write_results(results, output)
+    rich_print(f"Benchmark results written to {output}")
+
+
 def _parameter_handler(
     parameter: str, settings_dict: dict, value: Any | None = object
 ) -> None:
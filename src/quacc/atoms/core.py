@@ -10,7 +10,6 @@ from typing import TYPE_CHECKING
 import numpy as np
 from ase.filters import Filter
 from ase.io.jsonio import encode
-from pymatgen.io.ase import AseAtomsAdaptor
 
 if TYPE_CHECKING:
     from hashlib import _Hash
@@ -102,6 +101,8 @@ def check_is_metal(atoms: Atoms) -> bool:
     bool
         True if the structure is likely a metal; False otherwise
     """
+    from pymatgen.io.ase import AseAtomsAdaptor
+
     struct = (
         AseAtomsAdaptor().get_structure(atoms)
         if atoms.pbc.any()
@@ -226,6 +227,8 @@ def check_charge_and_spin(
     if charge is None and spin_multiplicity is not None:
         charge = 0
 
+    from pymatgen.io.ase import AseAtomsAdaptor
+
     try:
         mol = AseAtomsAdaptor.get_molecule(atoms)
         if charge is not None:
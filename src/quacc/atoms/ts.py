@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from importlib.util import find_spec
+from inspect import signature
 from typing import TYPE_CHECKING
 
+import numpy as np
 from ase.atoms import Atoms
 from monty.dev import requires
 
-from quacc.atoms.core import copy_atoms
+from quacc.atoms.core import copy_atoms, get_atoms_id
 
 LOGGER = logging.getLogger(__name__)
 
@@ -17,9 +21,14 @@ if has_geodesic_interpolate:
     from geodesic_interpolate.geodesic import Geodesic
     from geodesic_interpolate.interpolation import redistribute
 
+_GEODESIC_CACHE: dict[tuple[str, str, str], list[NDArray]] = {}
+
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from typing import Literal
 
+    from numpy.typing import NDArray
+
 
 @requires(
     has_geodesic_interpolate,
@@ -113,3 +122,130 @@ def geodesic_interpolate_wrapper(
         Atoms(symbols=chemical_symbols, positions=geom)
         for geom in geodesic_smoother.path
     ]
+
+
+@requires(
+    has_geodesic_interpolate,
+    "geodesic-interpolate must be installed. Refer to the quacc documentation.",
+)
+def geodesic_interpolate_batch(
+    pairs: list[tuple[Atoms, Atoms]], max_workers: int | None = None, **geodesic_kwargs
+) -> list[list[Atoms]]:
+    """
+    Interpolate many reactant/product pairs with
+    [quacc.atoms.ts.geodesic_interpolate_wrapper][] in a pool of processes. The paths
+    are cached in memory by the reactant, the product, and the interpolation
+    parameters, so a pair is only interpolated once per process.
+
+    Parameters
+    ----------
+    pairs
+        The (reactant, product) pairs to interpolate.
+    max_workers
+        The number of worker processes. Defaults to the number of CPUs. If 1, the
+        pairs are interpolated in the current process.
+    **geodesic_kwargs
+        Keyword arguments for [quacc.atoms.ts.geodesic_interpolate_wrapper][].
+
+    Returns
+    -------
+    list[list[Atoms]]
+        The interpolated path of each pair, in the order of `pairs`.
+    """
+    parameters = signature(geodesic_interpolate_wrapper).bind(
+        None, None, **geodesic_kwargs
+    )
+    parameters.apply_defaults()
+    parameters_key = repr(
+        sorted(
+            (key, value)
+            for key, value in parameters.arguments.items()
+            if key not in {"reactant", "product"}
+        )
+    )
+    keys = [
+        (get_atoms_id(reactant), get_atoms_id(product), parameters_key)
+        for reactant, product in pairs
+    ]
+
+    missing = {}
+    for key, pair in zip(keys, pairs, strict=True):
+        if key not in _GEODESIC_CACHE:
+            missing.setdefault(key, pair)
+
+    if missing:
+        reactants, products = zip(*missing.values(), strict=True)
+        interpolate = partial(geodesic_interpolate_wrapper, **geodesic_kwargs)
+        if max_workers == 1 or len(missing) == 1:
+            paths = list(map(interpolate, reactants, products))
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                paths = list(executor.map(interpolate, reactants, products))
+        for key, path in zip(missing, paths, strict=True):
+            _GEODESIC_CACHE[key] = [image.positions for image in path]
+
+    return [
+        [
+            Atoms(symbols=reactant.get_chemical_symbols(), positions=positions)
+            for positions in _GEODESIC_CACHE[key]
+        ]
+        for key, (reactant, _) in zip(keys, pairs, strict=True)
+    ]
+
+
+def get_cartesian_hessian(
+    atoms: Atoms, hessian: list[list[float]] | NDArray
+) -> NDArray:
+    """
+    Check a precomputed Hessian and return it as a 3Nx3N array, e.g. to give to Sella
+    as its initial Hessian `H0`.
+
+    Parameters
+    ----------
+    atoms
+        Atoms object
+    hessian
+        The Hessian of `atoms` in eV/Å^2, as a 3Nx3N or Nx3xNx3 array.
+
+    Returns
+    -------
+    NDArray
+        The 3Nx3N Hessian.
+    """
+    hessian = np.asarray(hessian, dtype=float)
+    if hessian.shape == (len(atoms), 3, len(atoms), 3):
+        hessian = hessian.reshape(3 * len(atoms), 3 * len(atoms))
+    if hessian.shape != (3 * len(atoms), 3 * len(atoms)):
+        msg = f"The Hessian must have a shape of {(3 * len(atoms), 3 * len(atoms))}."
+        raise ValueError(msg)
+
+    return hessian
+
+
+def get_hessian_function(
+    atoms: Atoms, hessian: list[list[float]] | NDArray
+) -> Callable[[Atoms], NDArray]:
+    """
+    Get a Sella `hessian_function` that returns a precomputed Hessian. Sella calls its
+    `hessian_function` whenever it re-diagonalizes the Hessian, so this is only
+    suitable where it is called once at `atoms`, such as the initial kick of Sella's
+    IRC. To seed a Sella optimization, use its `H0` instead.
+
+    Parameters
+    ----------
+    atoms
+        Atoms object
+    hessian
+        The Hessian of `atoms` in eV/Å^2.
+
+    Returns
+    -------
+    Callable
+        A function that takes an Atoms object and returns the Hessian.
+    """
+    hessian = get_cartesian_hessian(atoms, hessian)
+
+    def hessian_function(atoms: Atoms) -> NDArray:  # noqa: ARG001
+        return hessian
+
+    return hessian_function
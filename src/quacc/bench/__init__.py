@@ -0,0 +1,7 @@
+"""Benchmarks for the overhead of quacc itself."""
+
+from __future__ import annotations
+
+from quacc.bench.suite import run_benchmarks, write_results
+
+__all__ = ["run_benchmarks", "write_results"]
@@ -0,0 +1,184 @@
+"""
+Measure the overhead of fanning out many tiny jobs with the configured workflow
+engine. This module is meant to be run in a fresh process (since the workflow
+engine is fixed when the decorators are applied) via
+
+```bash
+QUACC_WORKFLOW_ENGINE=local python -m quacc.bench.fanout 100
+```
+
+and prints the timings as JSON.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING
+
+from quacc import flow, get_settings, job
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+@job
+def add_one(val: int) -> int:
+    """
+    Add one to a number.
+
+    Parameters
+    ----------
+    val
+        The number.
+
+    Returns
+    -------
+    int
+        The number plus one.
+    """
+    return val + 1
+
+
+@job
+def gather(vals: list[int]) -> int:
+    """
+    Sum a list of numbers.
+
+    Parameters
+    ----------
+    vals
+        The numbers.
+
+    Returns
+    -------
+    int
+        The sum.
+    """
+    return sum(vals)
+
+
+@flow
+def fanout_flow(n_jobs: int) -> int:
+    """
+    Fan out `n_jobs` independent jobs and gather their results in a final job.
+
+    Parameters
+    ----------
+    n_jobs
+        The number of jobs to fan out.
+
+    Returns
+    -------
+    int
+        The sum of the results.
+    """
+    return gather([add_one(i) for i in range(n_jobs)])
+
+
+def _run_fanout(n_jobs: int, run_dir: str) -> int:
+    """
+    Dispatch `fanout_flow` with the configured workflow engine and wait for its
+    result.
+
+    Parameters
+    ----------
+    n_jobs
+        The number of jobs to fan out.
+    run_dir
+        A scratch directory for any files written by the workflow engine.
+
+    Returns
+    -------
+    int
+        The result of the flow.
+    """
+    engine = get_settings().WORKFLOW_ENGINE
+
+    if engine == "covalent":
+        import covalent as ct
+
+        dispatch_id = ct.dispatch(fanout_flow)(n_jobs)
+        return ct.get_result(dispatch_id, wait=True).result
+    if engine == "dask":
+        from dask.distributed import Client, get_client
+
+        try:
+            client = get_client()
+        except ValueError:
+            client = Client(processes=False)
+        return client.compute(fanout_flow(n_jobs)).result()
+    if engine == "jobflow":
+        import jobflow as jf
+
+        jobs = [add_one(i) for i in range(n_jobs)]
+        final_job = gather([j.output for j in jobs])
+        responses = jf.run_locally(
+            jf.Flow([*jobs, final_job]), root_dir=run_dir, ensure_success=True
+        )
+        return responses[final_job.uuid][1].output
+    if engine == "parsl":
+        import parsl
+        from parsl.config import Config
+        from parsl.dataflow.dependency_resolvers import DEEP_DEPENDENCY_RESOLVER
+        from parsl.errors import NoDataFlowKernelError
+
+        try:
+            parsl.dfk()
+        except NoDataFlowKernelError:
+            parsl.load(
+                Config(dependency_resolver=DEEP_DEPENDENCY_RESOLVER, run_dir=run_dir)
+            )
+        return fanout_flow(n_jobs).result()
+    if engine == "redun":
+        from redun import Scheduler
+
+        return Scheduler().run(fanout_flow(n_jobs))
+    if engine == "local":
+        return fanout_flow(n_jobs).result()
+    return fanout_flow(n_jobs)
+
+
+def run_fanout_benchmark(n_jobs: int) -> dict[str, Any]:
+    """
+    Time the fan-out of `n_jobs` tiny jobs with the configured workflow engine. A
+    single-job warm-up run is timed separately to capture the start-up cost of the
+    engine.
+
+    Parameters
+    ----------
+    n_jobs
+        The number of jobs to fan out.
+
+    Returns
+    -------
+    dict
+        The workflow engine, number of jobs, warm-up time, total time, and time per
+        job (all in seconds).
+    """
+    with TemporaryDirectory() as run_dir:
+        start = time.perf_counter()
+        _run_fanout(1, run_dir)
+        warmup_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = _run_fanout(n_jobs, run_dir)
+        total_time = time.perf_counter() - start
+
+    if result != n_jobs * (n_jobs + 1) // 2:
+        msg = f"Unexpected result from the fan-out flow: {result}"
+        raise ValueError(msg)
+
+    return {
+        "engine": get_settings().WORKFLOW_ENGINE,
+        "n_jobs": n_jobs,
+        "warmup_time": warmup_time,
+        "total_time": total_time,
+        "time_per_job": total_time / max(n_jobs, 1),
+    }
+
+
+if __name__ == "__main__":
+    print(json.dumps(run_fanout_benchmark(int(sys.argv[1]))))  # noqa: T201
@@ -0,0 +1,305 @@
+"""A reproducible benchmark suite for the overhead of quacc itself."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import threading
+import timeit
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from fnmatch import fnmatch
+from importlib.util import find_spec
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+WORKFLOW_ENGINES = ["covalent", "dask", "jobflow", "parsl", "prefect", "redun"]
+
+
+def _make_benchmarks(tmpdir: Path) -> dict[str, Callable[[], Any]]:
+    """
+    Set up the micro-benchmarks. Each benchmark is a function that runs one
+    iteration of the operation being measured.
+
+    Parameters
+    ----------
+    tmpdir
+        A scratch directory to run calculations in.
+
+    Returns
+    -------
+    dict[str, Callable]
+        The benchmarks, keyed by name.
+    """
+    from ase.build import bulk, molecule
+    from ase.calculators.emt import EMT
+    from ase.calculators.lj import LennardJones
+    from ase.md.verlet import VelocityVerlet
+    from ase.units import fs
+
+    from quacc import get_settings
+    from quacc.atoms.core import get_atoms_id
+    from quacc.runners.ase import Runner
+    from quacc.schemas.ase import Summarize
+    from quacc.schemas.atoms import atoms_to_metadata
+    from quacc.settings import QuaccSettings
+    from quacc.utils.dicts import finalize_dict, recursive_dict_merge
+
+    bulk_atoms = bulk("Cu") * (2, 2, 2)
+    mol_atoms = molecule("H2O")
+    static_atoms = Runner(bulk_atoms, EMT()).run_calc()
+    opt_dyn = Runner(mol_atoms, LennardJones()).run_opt(fmax=0.1)
+    md_dyn = Runner(bulk_atoms, EMT()).run_md(
+        VelocityVerlet, dynamics_kwargs={"timestep": 1.0 * fs}, steps=20
+    )
+    task_doc = Summarize().run(static_atoms, bulk_atoms)
+    finalize_dir = tmpdir / "finalize"
+    finalize_dir.mkdir()
+    nested_dict = {
+        f"key{i}": {
+            f"subkey{j}": {"value": j, "list": list(range(5))} for j in range(10)
+        }
+        for i in range(10)
+    }
+    nested_update = {
+        f"key{i}": {f"subkey{j}": {"value": -j} for j in range(0, 10, 2)}
+        for i in range(0, 10, 2)
+    }
+
+    def _runner_setup_cleanup():
+        Runner(bulk_atoms, EMT()).cleanup()
+
+    def _access_settings():
+        for _ in range(100):
+            get_settings()
+
+    def _settings_in_new_thread():
+        thread = threading.Thread(target=_access_settings)
+        thread.start()
+        thread.join()
+
+    def _settings_in_thread_pool():
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for future in [executor.submit(_access_settings) for _ in range(16)]:
+                future.result()
+
+    return {
+        "Runner.setup_cleanup": _runner_setup_cleanup,
+        "Runner.run_calc[EMT]": lambda: Runner(bulk_atoms, EMT()).run_calc(),
+        "Runner.run_opt[LJ]": lambda: Runner(mol_atoms, LennardJones()).run_opt(
+            fmax=0.1
+        ),
+        "Summarize.run": lambda: Summarize().run(static_atoms, bulk_atoms),
+        "Summarize.opt": lambda: Summarize().opt(opt_dyn),
+        "Summarize.md": lambda: Summarize().md(md_dyn),
+        "get_atoms_id": lambda: get_atoms_id(bulk_atoms),
+        "recursive_dict_merge": lambda: recursive_dict_merge(
+            nested_dict, nested_update
+        ),
+        "finalize_dict": lambda: finalize_dict(task_doc, directory=finalize_dir),
+        "atoms_to_metadata": lambda: atoms_to_metadata(bulk_atoms),
+        "atoms_to_metadata[no_pmg]": lambda: atoms_to_metadata(
+            bulk_atoms, store_pmg=False
+        ),
+        "QuaccSettings": QuaccSettings,
+        "get_settings": get_settings,
+        "get_settings[new_thread]": _settings_in_new_thread,
+        "get_settings[thread_pool]": _settings_in_thread_pool,
+    }
+
+
+def _time_benchmark(func: Callable[[], Any], repeat: int) -> dict[str, Any]:
+    """
+    Time a benchmark. The number of iterations per repeat is chosen automatically
+    so that each repeat takes at least ~0.2 s.
+
+    Parameters
+    ----------
+    func
+        The benchmark.
+    repeat
+        The number of repeats.
+
+    Returns
+    -------
+    dict
+        Timing statistics, in seconds per iteration.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    times = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return {
+        "number": number,
+        "repeat": repeat,
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.fmean(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "times": times,
+    }
+
+
+def get_installed_engines() -> list[str | None]:
+    """
+    Get the workflow engines that can be benchmarked in this environment.
+
+    Returns
+    -------
+    list[str | None]
+        The workflow engines, where None means no workflow engine.
+    """
+    return [None, "local"] + [
+        engine for engine in WORKFLOW_ENGINES if find_spec(engine) is not None
+    ]
+
+
+def run_fanout_benchmark(
+    engine: str | None, n_jobs: int, timeout: float = 600
+) -> dict[str, Any]:
+    """
+    Time the fan-out of `n_jobs` tiny jobs with a given workflow engine. This is run
+    in a separate process since the workflow engine is set when quacc is imported.
+
+    Parameters
+    ----------
+    engine
+        The workflow engine, or None to leave `QUACC_WORKFLOW_ENGINE` unset, in which
+        case no workflow engine is used unless the YAML config file sets one.
+    n_jobs
+        The number of jobs to fan out.
+    timeout
+        The maximum time in seconds to wait for the benchmark.
+
+    Returns
+    -------
+    dict
+        The timings from `quacc.bench.fanout.run_fanout_benchmark`, or an `error`
+        entry if the benchmark could not be run.
+    """
+    with TemporaryDirectory() as tmpdir:
+        env = os.environ | {"QUACC_RESULTS_DIR": tmpdir}
+        env.pop("QUACC_SCRATCH_DIR", None)
+        if engine is None:
+            env.pop("QUACC_WORKFLOW_ENGINE", None)
+        else:
+            env["QUACC_WORKFLOW_ENGINE"] = engine
+        try:
+            process = subprocess.run(
+                [sys.executable, "-m", "quacc.bench.fanout", str(n_jobs)],
+                capture_output=True,
+                check=True,
+                cwd=tmpdir,
+                env=env,
+                text=True,
+                timeout=timeout,
+            )
+        except subprocess.CalledProcessError as err:
+            return {"engine": engine, "error": err.stderr.strip().splitlines()[-1:]}
+        except subprocess.TimeoutExpired:
+            return {"engine": engine, "error": f"Timed out after {timeout} s"}
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+
+def run_benchmarks(
+    select: str = "*",
+    repeat: int = 5,
+    engines: list[str | None] | None = None,
+    n_jobs: int = 100,
+) -> dict[str, Any]:
+    """
+    Run the benchmark suite, which measures the overhead of quacc's runners, schemas,
+    and utilities using the EMT and LJ calculators (so that the calculator cost is
+    negligible), along with the overhead of fanning out many tiny jobs with each
+    workflow engine.
+
+    Parameters
+    ----------
+    select
+        A glob pattern for the names of the benchmarks to run (e.g. `"Summarize.*"`).
+        The fan-out benchmarks are named `flow_fanout[<engine>]`.
+    repeat
+        The number of times to repeat each micro-benchmark.
+    engines
+        The workflow engines to run the fan-out benchmark with. Defaults to all
+        installed workflow engines.
+    n_jobs
+        The number of jobs to fan out in the fan-out benchmark.
+
+    Returns
+    -------
+    dict
+        The benchmark results along with metadata about the environment, suitable
+        for serializing to JSON.
+    """
+    from quacc import __version__, change_settings
+
+    engines = get_installed_engines() if engines is None else engines
+    benchmarks = {}
+
+    # Logging to the terminal would dominate the timings of the cheapest operations
+    disable_level = logging.root.manager.disable
+    logging.disable(logging.INFO)
+    try:
+        with (
+            TemporaryDirectory() as tmpdir,
+            change_settings(
+                {
+                    "RESULTS_DIR": Path(tmpdir),
+                    "SCRATCH_DIR": None,
+                    "CREATE_UNIQUE_DIR": True,
+                    "GZIP_FILES": True,
+                    "STORE": None,
+                    "PERF_TELEMETRY": False,
+                }
+            ),
+        ):
+            for name, func in _make_benchmarks(Path(tmpdir)).items():
+                if fnmatch(name, select):
+                    benchmarks[name] = _time_benchmark(func, repeat)
+    finally:
+        logging.disable(disable_level)
+
+    for engine in engines:
+        name = f"flow_fanout[{engine}]"
+        if fnmatch(name, select):
+            benchmarks[name] = run_fanout_benchmark(engine, n_jobs)
+
+    return {
+        "quacc_version": __version__,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "benchmarks": benchmarks,
+    }
+
+
+def write_results(results: dict[str, Any], filename: Path | str) -> None:
+    """
+    Write benchmark results to a JSON file.
+
+    Parameters
+    ----------
+    results
+        The output of `run_benchmarks`.
+    filename
+        The JSON file to write.
+
+    Returns
+    -------
+    None
+    """
+    with Path(filename).expanduser().open("w") as f:
+        json.dump(results, f, indent=2)
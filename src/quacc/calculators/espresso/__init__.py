@@ -2,6 +2,20 @@
 
 from __future__ import annotations
 
-from quacc.calculators.espresso.espresso import Espresso
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from quacc.calculators.espresso.espresso import Espresso
 
 __all__ = ["Espresso"]
+
+_LAZY_IMPORTS = {"Espresso": "quacc.calculators.espresso.espresso"}
+
+
+def __getattr__(name: str):
+    """Lazily import the calculator so that submodules stay cheap to import."""
+    if name in _LAZY_IMPORTS:
+        return getattr(import_module(_LAZY_IMPORTS[name]), name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
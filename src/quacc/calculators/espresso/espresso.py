@@ -4,15 +4,18 @@ from __future__ import annotations
 
 import os
 import re
+from copy import deepcopy
 from logging import getLogger
 from pathlib import Path
 from typing import TYPE_CHECKING
+from uuid import uuid4
 
 import numpy as np
 from ase.atoms import Atoms
 from ase.calculators.espresso import EspressoProfile
 from ase.calculators.espresso import EspressoTemplate as EspressoTemplate_
 from ase.calculators.genericfileio import GenericFileIOCalculator
+from ase.calculators.socketio import SocketIOCalculator
 from ase.io import read, write
 from ase.io.espresso import (
     Namelist,
@@ -24,8 +27,11 @@ from ase.io.espresso_namelist.keys import ALL_KEYS
 
 from quacc import get_settings
 from quacc.calculators.espresso.utils import (
+    espresso_plan_parallel,
     espresso_prepare_dir,
+    get_espresso_ncores,
     get_pseudopotential_info,
+    link_shared_save_dirs,
     remove_conflicting_kpts_kspacing,
 )
 from quacc.utils.dicts import Remove, recursive_dict_merge, remove_dict_entries
@@ -49,6 +55,7 @@ class EspressoTemplate(EspressoTemplate_):
         test_run: bool = False,
         autorestart: bool = False,
         outdir: str | Path | None = None,
+        shared_outdir: str | Path | None = None,
     ) -> None:
         """
         Initialize the Espresso template.
@@ -67,6 +74,11 @@ class EspressoTemplate(EspressoTemplate_):
         outdir
             The directory that will be used as `outdir` in the input_data. If
             None, the directory will be set to the current working directory.
+        shared_outdir
+            The `outdir` of a previous calculation whose save directories will be
+            symlinked (rather than copied) into the `outdir`, e.g. to share the pw.x
+            data between the jobs of a grid phonon calculation. The save directories
+            are read-only for this calculation and must already be decompressed.
 
         Returns
         -------
@@ -83,6 +95,8 @@ class EspressoTemplate(EspressoTemplate_):
         self.nruns = 0
         self.autorestart = autorestart
         self.outdir = outdir
+        self.shared_outdir = shared_outdir
+        self.parallel_flags: dict[str, int] = {}
 
     def write_input(
         self,
@@ -120,9 +134,24 @@ class EspressoTemplate(EspressoTemplate_):
         if self.outdir:
             safe_decompress_dir(self.outdir)
 
+        if self.shared_outdir:
+            link_shared_save_dirs(self.shared_outdir, self.outdir or directory)
+
         if self.test_run:
             self._test_run(parameters, directory)
 
+        if get_settings().ESPRESSO_AUTO_PARALLEL:
+            self.parallel_flags = espresso_plan_parallel(
+                self.binary,
+                parameters,
+                atoms,
+                get_espresso_ncores(profile.command),
+                command=profile.command,
+            )
+            LOGGER.info(
+                f"Parallelization flags for {self.binary}.x: {self.parallel_flags}"
+            )
+
         if self.binary == "pw":
             if self.autorestart and self.nruns > 0:
                 parameters["input_data"]["electrons"]["startingpot"] = "file"
@@ -147,8 +176,26 @@ class EspressoTemplate(EspressoTemplate_):
                     **parameters,
                 )
 
-    def execute(self, *args: Any, **kwargs: Any) -> None:
-        super().execute(*args, **kwargs)
+    def execute(self, directory: Path | str, profile: EspressoProfile) -> None:
+        """
+        Run the espresso binary, appending the parallelization flags picked in
+        `write_input` (if any) to the command.
+
+        Parameters
+        ----------
+        directory
+            The directory in which to run the binary.
+        profile
+            The profile to use.
+
+        Returns
+        -------
+        None
+        """
+        if self.parallel_flags:
+            flags = " ".join(f"-{k} {v}" for k, v in self.parallel_flags.items())
+            profile = EspressoProfile(f"{profile.command} {flags}", profile.pseudo_dir)
+        super().execute(directory, profile)
         self.nruns += 1
 
     @staticmethod
@@ -360,6 +407,7 @@ class Espresso(GenericFileIOCalculator):
         input_atoms: Atoms | None = None,
         preset: str | Path | None = None,
         template: EspressoTemplate | None = None,
+        use_socket: bool = False,
         **kwargs,
     ) -> None:
         """
@@ -380,6 +428,14 @@ class Espresso(GenericFileIOCalculator):
             ASE calculator templace which can be used to specify which espresso
             binary will be used in the calculation. This is taken care of by recipe
             in most cases.
+        use_socket
+            Whether to keep a single pw.x process alive across calls to the
+            calculator by running it as an i-PI client (`pw.x --ipi`). New positions
+            and cells are passed to pw.x over a UNIX socket, so ASE-driven
+            optimizations do not pay for the pseudopotential setup and initial guess
+            at every step and start each SCF from the previous wavefunction and
+            charge density. Only supported for pw.x. Call `close()` to stop pw.x,
+            which [quacc.runners.ase.Runner][] does at the end of each calculation.
         **kwargs
             Additional arguments to be passed to the Espresso calculator. Takes all valid
             ASE calculator arguments, such as `input_data` and `kpts`. Refer to
@@ -398,6 +454,10 @@ class Espresso(GenericFileIOCalculator):
         self._settings = get_settings()
         template = template or EspressoTemplate("pw")
         self._binary = template.binary
+        if use_socket and self._binary != "pw":
+            raise ValueError("Socket mode is only supported for pw.x.")
+        self.use_socket = use_socket
+        self._socket_calc: SocketIOCalculator | None = None
         full_path = Path(
             self._settings.ESPRESSO_BIN_DIR,
             self._settings.ESPRESSO_BINARIES[self._binary],
@@ -436,6 +496,68 @@ class Espresso(GenericFileIOCalculator):
             parameters=self.user_calc_params,
         )
 
+    def calculate(
+        self, atoms: Atoms, properties: list[str], system_changes: list[str]
+    ) -> None:
+        """
+        Run an Espresso calculation. In socket mode, the first call launches pw.x as
+        an i-PI client and subsequent calls pass the new positions and cell to it.
+
+        Parameters
+        ----------
+        atoms
+            The Atoms object to run the calculation on.
+        properties
+            The properties to calculate.
+        system_changes
+            The changes to the Atoms object since the last calculation.
+
+        Returns
+        -------
+        None
+        """
+        if not self.use_socket:
+            super().calculate(atoms, properties, system_changes)
+            return
+
+        if self._socket_calc is not None and (
+            bad_changes := set(system_changes) - SocketIOCalculator.supported_changes
+        ):
+            LOGGER.info(
+                f"Restarting pw.x because {', '.join(bad_changes)} changed, but only "
+                "new positions and cells can be passed over the socket."
+            )
+            self.close()
+
+        if self._socket_calc is None:
+            self._socket_calc = self.template.socketio_calculator(
+                profile=self.profile,
+                parameters=deepcopy(self.parameters),
+                directory=Path(self.directory),
+                unixsocket=f"quacc_{uuid4().hex}",
+            )
+
+        self._socket_calc.calculate(atoms, properties, system_changes)
+        self.results = dict(self._socket_calc.results)
+
+    def close(self) -> None:
+        """
+        Stop a pw.x process running in socket mode. This is a no-op if pw.x is not
+        running.
+
+        Returns
+        -------
+        None
+        """
+        if self._socket_calc is None:
+            return
+
+        server = self._socket_calc.server
+        if server is not None and server.protocol is not None:
+            server.protocol.end()
+        self._socket_calc.close()
+        self._socket_calc = None
+
     def _cleanup_params(self) -> None:
         """
         Function that handles the kwargs. It will merge the user-supplied kwargs with
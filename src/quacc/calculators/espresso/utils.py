@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import re
+import shlex
 from logging import getLogger
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import numpy as np
+from ase.calculators.calculator import kpts2ndarray, kpts2sizeandoffsets
+from ase.io.espresso import kspacing_to_grid
+from ase.units import Bohr
 
 from quacc.utils.dicts import Remove
 
@@ -58,10 +63,16 @@ def grid_copy_files(
     directory: str | Path,
     qnum: int,
     qpt: tuple[float, float, float],
+    share_outdir: bool = False,
 ) -> dict[SourceDirectory, Filenames]:
     """
     Function that returns a dictionary of files to copy for the grid calculation.
 
+    If `share_outdir` is True, the pw.x save directories are not copied since they
+    are linked from the shared `outdir` instead (see `link_shared_save_dirs`). Only
+    the small `_ph0` control files that each grid job needs to write its own
+    fragments are copied.
+
     Parameters
     ----------
     ph_input_data
@@ -72,6 +83,9 @@ def grid_copy_files(
         The q-point number
     qpt
         The q-point coordinates in QE units
+    share_outdir
+        Whether the save directories are linked from a shared `outdir` rather than
+        copied.
 
     Returns
     -------
@@ -90,6 +104,8 @@ def grid_copy_files(
     }
 
     if lqdir or qpt == (0.0, 0.0, 0.0):
+        if share_outdir:
+            return files_to_copy
         files_to_copy[directory].extend(
             [
                 Path("pwscf.save", "charge-density.*"),
@@ -113,6 +129,64 @@ def grid_copy_files(
     return files_to_copy
 
 
+def get_shared_save_dirs(outdir: str | Path) -> list[Path]:
+    """
+    Function that finds the save directories of a previous calculation that can be
+    shared read-only between the jobs of a grid calculation. These are the pw.x save
+    directory and, if `lqdir` was used, the save directory of each q-point. The
+    `_ph0/{prefix}.save` directory is not included since ph.x writes to it when
+    `lqdir` is False.
+
+    Parameters
+    ----------
+    outdir
+        The `outdir` of the previous calculation
+
+    Returns
+    -------
+    list[Path]
+        The save directories
+    """
+    outdir = Path(outdir).expanduser()
+    return sorted(
+        save_dir
+        for pattern in ["*.save", "_ph0/*.q_*/*.save"]
+        for save_dir in outdir.glob(pattern)
+        if save_dir.is_dir() and not save_dir.is_symlink()
+    )
+
+
+def link_shared_save_dirs(shared_outdir: str | Path, outdir: str | Path) -> None:
+    """
+    Function that symlinks the save directories of a shared `outdir` into the `outdir`
+    of a calculation, keeping their relative paths. The parent directories are created
+    as real directories so that anything written next to the save directories stays
+    local to the calculation. Existing files and directories are left untouched.
+
+    Since only directories are linked, gzipping the calculation directory afterwards
+    does not follow the links and leaves the shared `outdir` untouched.
+
+    Parameters
+    ----------
+    shared_outdir
+        The `outdir` of the previous calculation to link from
+    outdir
+        The `outdir` of the current calculation
+
+    Returns
+    -------
+    None
+    """
+    shared_outdir = Path(shared_outdir).expanduser().resolve()
+    for save_dir in get_shared_save_dirs(shared_outdir):
+        link = Path(outdir, save_dir.relative_to(shared_outdir))
+        if link.exists() or link.is_symlink():
+            LOGGER.debug(f"{link} already exists. Not linking {save_dir}.")
+            continue
+        link.parent.mkdir(parents=True, exist_ok=True)
+        link.symlink_to(save_dir, target_is_directory=True)
+
+
 def grid_prepare_repr(patterns: dict[str, Any], nblocks: int) -> list:
     """
     Function that prepares the representations for the grid calculation.
@@ -355,3 +429,218 @@ def remove_conflicting_kpts_kspacing(
         to_change_dict.pop("kpts", None)
 
     return to_change_dict
+
+
+def get_espresso_ncores(command: str) -> int:
+    """
+    Function that finds the number of MPI processes from the MPI launcher in an
+    espresso command, e.g. `mpirun -np 16` or `srun --ntasks=16`.
+
+    Parameters
+    ----------
+    command
+        The command used to run the espresso binary
+
+    Returns
+    -------
+    int
+        The number of MPI processes. Defaults to 1 if it cannot be found.
+    """
+    tokens = shlex.split(command)
+    for i, token in enumerate(tokens):
+        flag, _, value = token.partition("=")
+        if flag not in ["-np", "-n", "--np", "--ntasks", "-ntasks"]:
+            continue
+        if not value and i + 1 < len(tokens):
+            value = tokens[i + 1]
+        if value.isdigit():
+            return int(value)
+    return 1
+
+
+def espresso_plan_parallel(
+    binary: str,
+    parameters: dict[str, Any],
+    atoms: Atoms,
+    ncores: int,
+    command: str = "",
+) -> dict[str, int]:
+    """
+    Function that picks the parallelization flags of an espresso binary based on the
+    prepared input and the number of MPI processes. The k-points are distributed over
+    pools (`-nk`) as far as possible. For pw.x, FFT task groups (`-nt`) are used when
+    there are more processes per pool than FFT planes, and the subspace
+    diagonalization is distributed (`-nd`) only for systems with many bands. For ph.x
+    and projwfc.x, the number of k-points is read from the pw.x save directory.
+    Flags that are already part of the command are left untouched.
+
+    Parameters
+    ----------
+    binary
+        The espresso binary, e.g. "pw", "ph", "matdyn", or "projwfc"
+    parameters
+        The prepared parameters of the calculation, including `input_data`
+    atoms
+        The atoms of the calculation
+    ncores
+        The number of MPI processes
+    command
+        The command used to run the binary, to check for user-provided flags
+
+    Returns
+    -------
+    dict[str, int]
+        The parallelization flags, e.g. `{"nk": 4, "nd": 1}` for `-nk 4 -nd 1`
+    """
+    if ncores <= 1 or binary not in ["pw", "ph", "projwfc"]:
+        return {}
+
+    input_data = parameters.get("input_data", {})
+    if binary == "pw":
+        nkpts = _estimate_nkpts(atoms, parameters)
+        if input_data.get("system", {}).get("nspin") == 2:
+            nkpts *= 2
+    else:
+        section = input_data.get("inputph" if binary == "ph" else binary, {})
+        nkpts = _read_nkpts(
+            Path(section.get("outdir", "."), f"{section.get('prefix', 'pwscf')}.save")
+        )
+        if nkpts is None:
+            return {}
+        if binary == "ph" and parameters.get("qpts") not in [None, (0, 0, 0)]:
+            # The k+q points are distributed over the pools as well
+            nkpts *= 2
+
+    tokens = shlex.split(command)
+    user_plan = {
+        flag: int(tokens[i + 1])
+        for i, token in enumerate(tokens[:-1])
+        for flag, aliases in _PARALLEL_FLAG_ALIASES.items()
+        if token in aliases and tokens[i + 1].isdigit()
+    }
+
+    plan = {"nk": user_plan.get("nk", _largest_divisor(ncores, nkpts))}
+    nproc_pool = ncores // plan["nk"]
+
+    if binary == "pw" and nproc_pool > 1:
+        system = input_data.get("system", {})
+        nbnd = system.get("nbnd", 4 * len(atoms))
+        plan["nd"] = (
+            int(np.sqrt(nproc_pool)) ** 2 if nbnd >= 100 and nproc_pool >= 4 else 1
+        )
+        if ecutwfc := system.get("ecutwfc"):
+            ecutrho = system.get("ecutrho", 4 * ecutwfc)
+            nr3 = _estimate_nr3(atoms, ecutrho)
+            if nproc_pool > nr3:
+                plan["nt"] = _largest_divisor(nproc_pool, -(-nproc_pool // nr3))
+
+    return {
+        flag: value
+        for flag, value in plan.items()
+        if (value > 1 or flag == "nd") and flag not in user_plan
+    }
+
+
+_PARALLEL_FLAG_ALIASES = {
+    "nk": {"-nk", "-npool", "-npools", "-nkpools"},
+    "nd": {"-nd", "-ndiag", "-northo", "-nproc_diag", "-nproc_ortho"},
+    "nt": {"-nt", "-ntg", "-ntask_groups"},
+}
+
+
+def _largest_divisor(n: int, upper: int) -> int:
+    """
+    Find the largest divisor of `n` that is not larger than `upper`.
+
+    Parameters
+    ----------
+    n
+        The number to divide
+    upper
+        The upper bound on the divisor
+
+    Returns
+    -------
+    int
+        The largest divisor
+    """
+    return max(d for d in range(1, min(n, max(upper, 1)) + 1) if n % d == 0)
+
+
+def _estimate_nkpts(atoms: Atoms, parameters: dict[str, Any]) -> int:
+    """
+    Estimate the number of irreducible k-points of a pw.x calculation, assuming that
+    time-reversal symmetry halves a Monkhorst-Pack grid.
+
+    Parameters
+    ----------
+    atoms
+        The atoms of the calculation
+    parameters
+        The parameters of the calculation, with `kpts` or `kspacing`
+
+    Returns
+    -------
+    int
+        The estimated number of k-points
+    """
+    kspacing = parameters.get("kspacing")
+    kpts = parameters.get("kpts")
+
+    if kspacing is not None:
+        kgrid = kspacing_to_grid(atoms, kspacing)
+    elif kpts is None:
+        return 1
+    elif isinstance(kpts, dict) and "path" not in kpts:
+        kgrid, _ = kpts2sizeandoffsets(atoms=atoms, **kpts)
+    elif isinstance(kpts, dict) or hasattr(kpts, "kpts"):
+        return len(kpts2ndarray(kpts, atoms=atoms))
+    elif np.ndim(kpts) == 2:
+        return len(kpts)
+    else:
+        kgrid = kpts
+
+    return max(1, (int(np.prod(kgrid)) + 1) // 2)
+
+
+def _estimate_nr3(atoms: Atoms, ecutrho: float) -> int:
+    """
+    Estimate the number of FFT planes along the third lattice vector.
+
+    Parameters
+    ----------
+    atoms
+        The atoms of the calculation
+    ecutrho
+        The charge density cutoff in Ry
+
+    Returns
+    -------
+    int
+        The estimated number of FFT planes
+    """
+    return int(np.ceil(np.sqrt(ecutrho) * atoms.cell.lengths()[2] / Bohr / np.pi)) + 1
+
+
+def _read_nkpts(save_dir: Path) -> int | None:
+    """
+    Read the number of k-points (including spin) from a pw.x save directory.
+
+    Parameters
+    ----------
+    save_dir
+        The save directory
+
+    Returns
+    -------
+    int | None
+        The number of k-points, or None if the save directory cannot be read
+    """
+    xml_file = Path(save_dir, "data-file-schema.xml")
+    if not xml_file.exists():
+        return None
+    text = xml_file.read_text()
+    if not (nks := re.search(r"<nks>\s*(\d+)\s*</nks>", text)):
+        return None
+    lsda = re.search(r"<lsda>\s*true\s*</lsda>", text)
+    return int(nks.group(1)) * (2 if lsda else 1)
@@ -2,20 +2,20 @@
 
 from __future__ import annotations
 
-import struct
+import re
 import warnings
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import numpy as np
 from ase import units
 from emmet.core.qc_tasks import TaskDoc
-from pymatgen.io.qchem.outputs import (
-    gradient_parser,
-    hessian_parser,
-    orbital_coeffs_parser,
-)
+from monty.io import zopen
+from monty.os.path import zpath
 
 if TYPE_CHECKING:
+    from typing import Any
+
     from numpy.typing import NDArray
     from pymatgen.io.qchem.inputs import QCInput
 
@@ -23,9 +23,7 @@ if TYPE_CHECKING:
 
 
 def write_qchem(
-    qc_input: QCInput,
-    directory: Path | str,
-    prev_orbital_coeffs: list[float] | None = None,
+    qc_input: QCInput, directory: Path | str, prev_orbital_coeffs: NDArray | None = None
 ) -> None:
     """
     Write the Q-Chem input files.
@@ -45,16 +43,15 @@ def write_qchem(
     """
     directory = Path(directory)
 
-    if prev_orbital_coeffs:
-        with Path(directory / "53.0").open(mode="wb") as file:
-            for val in prev_orbital_coeffs:
-                data = struct.pack("d", val)
-                file.write(data)
+    if prev_orbital_coeffs is not None and len(prev_orbital_coeffs):
+        np.asarray(prev_orbital_coeffs, dtype=np.float64).tofile(directory / "53.0")
 
     qc_input.write_file(directory / "mol.qin")
 
 
-def read_qchem(directory: Path | str) -> tuple[QchemResults, NDArray | None]:
+def read_qchem(
+    directory: Path | str, parse_taskdoc: bool = True, n_atoms: int | None = None
+) -> tuple[QchemResults, NDArray | None]:
     """
     Read Q-Chem log files.
 
@@ -62,6 +59,13 @@ def read_qchem(directory: Path | str) -> tuple[QchemResults, NDArray | None]:
     ----------
     directory
         The directory in which the Q-Chem calculation was run.
+    parse_taskdoc
+        Whether to parse the full `emmet.core.qc_tasks.TaskDoc`. If False, only the
+        final energy is read from the output file, which is much cheaper for the
+        intermediate steps of an ASE-driven optimization.
+    n_atoms
+        The number of atoms, which is needed to read the Hessian when
+        `parse_taskdoc` is False.
 
     Returns
     -------
@@ -71,32 +75,104 @@ def read_qchem(directory: Path | str) -> tuple[QchemResults, NDArray | None]:
     """
     directory = Path(directory)
 
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore", category=UserWarning)
-        task_doc = TaskDoc.from_directory(directory, validate_lot=False).model_dump()
-
-    results: QchemResults = {
-        "energy": task_doc["output"]["final_energy"] * units.Hartree,
-        "taskdoc": task_doc,
-    }
-
-    # Read the gradient scratch file in 8 byte chunks
+    if parse_taskdoc:
+        task_doc = read_taskdoc(directory)
+        results: QchemResults = {
+            "energy": task_doc["output"]["final_energy"] * units.Hartree,
+            "taskdoc": task_doc,
+        }
+        n_atoms = task_doc["natoms"]
+    else:
+        results = {"energy": read_final_energy(directory) * units.Hartree}
+
+    # Read the gradient scratch file
     grad_scratch = directory / "131.0"
     if grad_scratch.exists() and grad_scratch.stat().st_size > 0:
-        gradient = gradient_parser(directory / "131.0")
-
+        gradient = read_scratch(grad_scratch)
+        gradient = gradient[: len(gradient) // 3 * 3].reshape(-1, 3)
         results["forces"] = gradient * (-units.Hartree / units.Bohr)
 
-    # Read Hessian scratch file in 8 byte chunks
+    # Read the Hessian scratch file
     hessian_scratch = directory / "132.0"
     if hessian_scratch.exists() and hessian_scratch.stat().st_size > 0:
-        reshaped_hess = hessian_parser(hessian_scratch, n_atoms=task_doc["natoms"])
+        hessian = read_scratch(hessian_scratch)
+        reshaped_hess = (
+            hessian.reshape(n_atoms * 3, n_atoms * 3) if n_atoms else hessian
+        )
         results["hessian"] = reshaped_hess * (units.Hartree / units.Bohr**2)
 
-    # Read orbital coefficients scratch file in 8 byte chunks
+    # Read the orbital coefficients scratch file
     orb_scratch = directory / "53.0"
     prev_orbital_coeffs = None
     if orb_scratch.exists() and orb_scratch.stat().st_size > 0:
-        prev_orbital_coeffs = orbital_coeffs_parser(orb_scratch).tolist()
+        prev_orbital_coeffs = read_scratch(orb_scratch)
 
     return results, prev_orbital_coeffs
+
+
+def read_scratch(filename: Path | str) -> NDArray:
+    """
+    Read a Q-Chem binary scratch file of doubles, e.g. the gradient (131.0), Hessian
+    (132.0), or orbital coefficients (53.0), in a single read.
+
+    Parameters
+    ----------
+    filename
+        The scratch file.
+
+    Returns
+    -------
+    NDArray
+        The flat array of values.
+    """
+    return np.fromfile(filename, dtype=np.float64)
+
+
+def read_taskdoc(directory: Path | str) -> dict[str, Any]:
+    """
+    Read the full task document of a Q-Chem calculation.
+
+    Parameters
+    ----------
+    directory
+        The directory in which the Q-Chem calculation was run.
+
+    Returns
+    -------
+    dict
+        The `emmet.core.qc_tasks.TaskDoc` as a dictionary.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=UserWarning)
+        return TaskDoc.from_directory(directory, validate_lot=False).model_dump()
+
+
+def read_final_energy(directory: Path | str) -> float:
+    """
+    Read only the final energy from a Q-Chem output file, in the same way as
+    `pymatgen.io.qchem.outputs.QCOutput`.
+
+    Parameters
+    ----------
+    directory
+        The directory in which the Q-Chem calculation was run.
+
+    Returns
+    -------
+    float
+        The final energy in Hartree.
+    """
+    with zopen(
+        zpath(str(Path(directory, "mol.qout"))), mode="rt", encoding="utf-8"
+    ) as f:
+        text = f.read()
+
+    if match := re.search(r"Final\senergy\sis\s+([\d\-\.]+)", text):
+        return float(match[1])
+    matches = re.findall(
+        r"\s*Total\s+energy in the final basis set\s+=\s*([\d\-\.]+)", text
+    ) or re.findall(r"\s+Total energy\s+=\s+([\d\-\.]+)", text)
+    if not matches:
+        msg = f"Could not find the final energy in the Q-Chem output in {directory}"
+        raise ValueError(msg)
+    return float(matches[-1])
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from ase.calculators.calculator import FileIOCalculator
 
-from quacc.calculators.qchem.io import read_qchem, write_qchem
+from quacc.calculators.qchem.io import (
+    read_qchem,
+    read_scratch,
+    read_taskdoc,
+    write_qchem,
+)
 from quacc.calculators.qchem.params import cleanup_attrs, make_qc_input
 from quacc.calculators.qchem.qchem_custodian import run_custodian
 
@@ -50,6 +56,7 @@ class QChem(FileIOCalculator):
         svp: dict | None = None,
         pcm_nonels: dict | None = None,
         qchem_dict_set_params: dict[str, Any] | None = None,
+        parse_taskdoc: bool = True,
         **fileiocalculator_kwargs,
     ) -> None:
         """
@@ -208,6 +215,12 @@ class QChem(FileIOCalculator):
             `job_type`, `basis_set`, and `scf_algorithm` will be pulled from the `rem`
             kwarg if not specified in `qchem_dict_set_params`. `qchem_version` will
             default to 6 if not specified in `qchem_dict_set_params`.
+        parse_taskdoc
+            Whether to parse the full `emmet.core.qc_tasks.TaskDoc` every time the
+            results are read. If False, only the final energy and the scratch files
+            are read, which is much cheaper for the intermediate steps of an
+            ASE-driven optimization, and the TaskDoc of the last calculation can be
+            read with `QChem.read_taskdoc`.
         **fileiocalculator_kwargs
             Additional arguments to be passed to
             [ase.calculators.calculator.FileIOCalculator][].
@@ -236,10 +249,12 @@ class QChem(FileIOCalculator):
         self.svp = svp
         self.pcm_nonels = pcm_nonels
         self.qchem_dict_set_params = qchem_dict_set_params or {}
+        self.parse_taskdoc = parse_taskdoc
         self.fileiocalculator_kwargs = fileiocalculator_kwargs
 
         # Instantiate previous orbital coefficients
         self.prev_orbital_coeffs = None
+        self._taskdoc_deferred = False
 
         # Clean up parameters
         cleanup_attrs(self)
@@ -264,7 +279,9 @@ class QChem(FileIOCalculator):
         system_changes: list[str] | None = None,
     ) -> None:
         """
-        Write the Q-Chem input files.
+        Write the Q-Chem input files. If there are no orbital coefficients from a
+        previous calculation but a `53.0` file was staged in the directory, e.g. with
+        `copy_files`, it is used as the initial SCF guess.
 
         Parameters
         ----------
@@ -281,6 +298,15 @@ class QChem(FileIOCalculator):
         """
         FileIOCalculator.write_input(self, atoms, properties, system_changes)
 
+        # Use the orbital coefficients of a prior job staged in the directory
+        orb_scratch = Path(self.directory, "53.0")
+        if (
+            self.prev_orbital_coeffs is None
+            and orb_scratch.exists()
+            and orb_scratch.stat().st_size > 0
+        ):
+            self.prev_orbital_coeffs = read_scratch(orb_scratch)
+
         qc_input = make_qc_input(self, atoms)
 
         write_qchem(
@@ -308,9 +334,26 @@ class QChem(FileIOCalculator):
         -------
         None
         """
-        results, prev_orbital_coeffs = read_qchem(self.directory)
+        results, prev_orbital_coeffs = read_qchem(
+            self.directory, parse_taskdoc=self.parse_taskdoc, n_atoms=len(self.atoms)
+        )
         self.results = results
         self.prev_orbital_coeffs = prev_orbital_coeffs
+        self._taskdoc_deferred = not self.parse_taskdoc
+
+    def read_taskdoc(self) -> None:
+        """
+        Read the full TaskDoc of the last calculation into `.results["taskdoc"]` if it
+        was deferred because the calculator was instantiated with
+        `parse_taskdoc=False`.
+
+        Returns
+        -------
+        None
+        """
+        if self._taskdoc_deferred:
+            self.results["taskdoc"] = read_taskdoc(self.directory)
+            self._taskdoc_deferred = False
 
     def _set_default_params(self) -> None:
         """
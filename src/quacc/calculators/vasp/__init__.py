@@ -2,6 +2,20 @@
 
 from __future__ import annotations
 
-from quacc.calculators.vasp.vasp import Vasp
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from quacc.calculators.vasp.vasp import Vasp
 
 __all__ = ["Vasp"]
+
+_LAZY_IMPORTS = {"Vasp": "quacc.calculators.vasp.vasp"}
+
+
+def __getattr__(name: str):
+    """Lazily import the calculator so that submodules stay cheap to import."""
+    if name in _LAZY_IMPORTS:
+        return getattr(import_module(_LAZY_IMPORTS[name]), name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
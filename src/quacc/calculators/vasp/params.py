@@ -12,7 +12,13 @@ from ase.calculators.vasp import Vasp as Vasp_
 from monty.dev import requires
 from pymatgen.io.ase import AseAtomsAdaptor
 
+from quacc import get_settings
 from quacc.atoms.core import check_is_metal
+from quacc.calculators.vasp.tuning import (
+    get_mpi_ranks,
+    get_nkpts,
+    recommend_parallel_params,
+)
 from quacc.utils.dicts import sort_dict
 from quacc.utils.kpts import convert_pmg_kpts
 
@@ -184,14 +190,43 @@ def get_param_swaps(
         calc.set(lorbit=11)
 
     if not calc.int_params["npar"] and not calc.int_params["ncore"]:
-        ncores = psutil.cpu_count(logical=False) or 1
-        for ncore in range(int(np.sqrt(ncores)), ncores):
-            if ncores % ncore == 0:
-                LOGGER.info(
-                    f"Recommending NCORE = {ncore} per the sqrt(# cores) suggestion by VASP."
-                )
-                calc.set(ncore=ncore)
-                break
+        settings = get_settings()
+        ncores = (
+            settings.VASP_MPI_RANKS
+            or get_mpi_ranks(settings.VASP_PARALLEL_CMD)
+            or psutil.cpu_count(logical=False)
+            or 1
+        )
+        history = settings.VASP_PARALLEL_HISTORY
+        nkpts = get_nkpts(calc, input_atoms) if history else None
+        recommended = (
+            recommend_parallel_params(
+                history,
+                len(input_atoms),
+                nkpts,
+                ncores,
+                bool(calc.bool_params["lhfcalc"]),
+                explore=settings.VASP_PARALLEL_EXPLORE,
+            )
+            if nkpts
+            else None
+        )
+        if recommended:
+            LOGGER.info(
+                f"Recommending NCORE = {recommended['ncore']} and KPAR = "
+                f"{recommended['kpar']} per the performance history in {history}."
+            )
+            calc.set(ncore=recommended["ncore"])
+            if not calc.int_params["kpar"]:
+                calc.set(kpar=recommended["kpar"])
+        else:
+            for ncore in range(int(np.sqrt(ncores)), ncores):
+                if ncores % ncore == 0:
+                    LOGGER.info(
+                        f"Recommending NCORE = {ncore} per the sqrt(# cores) suggestion by VASP."
+                    )
+                    calc.set(ncore=ncore)
+                    break
 
     if (
         (calc.int_params["ncore"] and calc.int_params["ncore"] > 1)
@@ -357,6 +392,40 @@ def set_auto_dipole(
     return user_calc_params
 
 
+def set_interactive_params(user_calc_params: dict[str, Any]) -> dict[str, Any]:
+    """
+    Sets the flags needed to drive a single, persistent VASP process from ASE via
+    VASP's interactive mode, where VASP reads new positions from stdin after every
+    ionic step.
+
+    Parameters
+    ----------
+    user_calc_params
+        The user-provided calculator parameters.
+
+    Returns
+    -------
+    dict
+        The updated user-provided calculator parameters.
+    """
+    interactive_params = {"interactive": True, "ibrion": -1, "potim": 0.0}
+    for k, v in interactive_params.items():
+        if user_calc_params.get(k) not in (None, v):
+            LOGGER.warning(
+                f"Setting {k.upper()} = {v} because VASP is run in interactive mode."
+            )
+    user_calc_params |= interactive_params
+
+    # VASP stops asking for new positions after NSW steps
+    user_calc_params["nsw"] = max(user_calc_params.get("nsw") or 0, 2000)
+
+    # Symmetry operations found for the first structure may not hold for later steps
+    if user_calc_params.get("isym") is None:
+        user_calc_params["isym"] = 0
+
+    return user_calc_params
+
+
 def set_pmg_kpts(
     user_calc_params: PmgKpts,
     pmg_kpts: dict[Literal["line_density", "kppvol", "kppa"], float],
@@ -0,0 +1,332 @@
+"""History-driven tuning of the NCORE and KPAR parallelization of VASP."""
+
+from __future__ import annotations
+
+import re
+import shlex
+import sqlite3
+from datetime import datetime, timezone
+from logging import getLogger
+from pathlib import Path
+from statistics import fmean
+from typing import TYPE_CHECKING
+
+import numpy as np
+from monty.io import zopen
+from monty.os.path import zpath
+from pymatgen.io.ase import AseAtomsAdaptor
+from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from ase.atoms import Atoms
+    from ase.calculators.vasp import Vasp as Vasp_
+
+LOGGER = getLogger(__name__)
+
+_OUTCAR_PATTERNS = {
+    "natoms": r"NIONS\s*=\s*(\d+)",
+    "nbands": r"NBANDS\s*=\s*(\d+)",
+    "nkpts": r"NKPTS\s*=\s*(\d+)",
+    "ncores": r"running on\s+(\d+) total cores|running\s+(\d+) mpi-ranks",
+    "ncore": r"one band on\s+(?:\w+=\s*)?(\d+) cores",
+    "kpar": r"each k-point on\s+\d+ cores,\s+(\d+) groups",
+    "lhfcalc": r"LHFCALC\s*=\s*([TF])",
+}
+_TOTAL_RANKS_FLAGS = ("-n", "-np", "--np", "--ntasks")
+_RANKS_PER_NODE_FLAGS = ("--ntasks-per-node", "-ppn", "-npernode", "--npernode")
+_NODES_FLAGS = ("-N", "--nodes")
+
+
+def get_mpi_ranks(parallel_cmd: str) -> int | None:
+    """
+    Get the total number of MPI ranks from a parallel launch command, such as
+    `VASP_PARALLEL_CMD`. Both a total number of ranks (e.g. `mpirun -np 64` or
+    `srun -n 64`) and a number of nodes times ranks per node (e.g.
+    `srun -N 2 --ntasks-per-node 32`) are understood.
+
+    Parameters
+    ----------
+    parallel_cmd
+        The parallel launch command.
+
+    Returns
+    -------
+    int | None
+        The total number of MPI ranks, or None if it cannot be determined.
+    """
+    tokens = shlex.split(parallel_cmd)
+    values = {}
+    for i, token in enumerate(tokens):
+        flag, _, value = token.partition("=")
+        if not value and i + 1 < len(tokens):
+            value = tokens[i + 1]
+        if value.isdigit():
+            values.setdefault(flag, int(value))
+
+    total = next((values[f] for f in _TOTAL_RANKS_FLAGS if f in values), None)
+    if total:
+        return total
+    per_node = next((values[f] for f in _RANKS_PER_NODE_FLAGS if f in values), None)
+    nodes = next((values[f] for f in _NODES_FLAGS if f in values), None)
+    return nodes * per_node if nodes and per_node else None
+
+
+def read_parallel_stats(directory: Path | str) -> dict[str, Any] | None:
+    """
+    Read the system size, parallelization settings, and time per electronic step of
+    a completed VASP run from its OUTCAR.
+
+    Parameters
+    ----------
+    directory
+        The directory of the VASP run.
+
+    Returns
+    -------
+    dict | None
+        The number of atoms, bands, irreducible k-points, and cores, the NCORE and
+        KPAR values, whether it was a hybrid calculation, the number of electronic
+        steps, and the mean wall time per electronic step in seconds. None if the
+        OUTCAR is missing or incomplete.
+    """
+    outcar = Path(zpath(str(Path(directory, "OUTCAR"))))
+    if not outcar.exists():
+        return None
+    with zopen(outcar, mode="rt", encoding="utf-8", errors="replace") as f:
+        text = f.read()
+
+    stats = {}
+    for key, pattern in _OUTCAR_PATTERNS.items():
+        match = re.search(pattern, text)
+        stats[key] = (
+            next((group for group in match.groups() if group), None) if match else None
+        )
+    step_times = [
+        float(t)
+        for t in re.findall(r"LOOP:\s+cpu time\s+[\d.]+:\s+real time\s+([\d.]+)", text)
+    ]
+    if not step_times or None in [stats[k] for k in ["natoms", "nbands", "nkpts"]]:
+        return None
+
+    return {
+        "natoms": int(stats["natoms"]),
+        "nbands": int(stats["nbands"]),
+        "nkpts": int(stats["nkpts"]),
+        "ncores": int(stats["ncores"] or 1),
+        "ncore": int(stats["ncore"] or 1),
+        "kpar": int(stats["kpar"] or 1),
+        "lhfcalc": stats["lhfcalc"] == "T",
+        "nsteps": len(step_times),
+        "time_per_step": fmean(step_times),
+    }
+
+
+def record_parallel_stats(directory: Path | str, database: Path | str) -> None:
+    """
+    Record the parallelization settings and timings of a completed VASP run in the
+    performance history database. Runs that cannot be parsed are skipped.
+
+    Parameters
+    ----------
+    directory
+        The directory of the VASP run.
+    database
+        The SQLite database of the performance history.
+
+    Returns
+    -------
+    None
+    """
+    stats = read_parallel_stats(directory)
+    if stats is None:
+        LOGGER.debug(f"Not recording the performance of the VASP run in {directory}.")
+        return
+
+    with _connect(database) as connection:
+        connection.execute(
+            "INSERT INTO vasp_runs VALUES (:natoms, :nbands, :nkpts, :ncores, :ncore, "
+            ":kpar, :lhfcalc, :nsteps, :time_per_step, :directory, :timestamp)",
+            stats
+            | {
+                "directory": str(Path(directory).resolve()),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+            },
+        )
+    connection.close()
+
+
+def recommend_parallel_params(
+    database: Path | str,
+    natoms: int,
+    nkpts: int,
+    ncores: int,
+    lhfcalc: bool,
+    explore: bool = False,
+) -> dict[str, int] | None:
+    """
+    Recommend NCORE and KPAR from the performance history of similar runs, i.e. runs
+    on the same number of MPI ranks and of the same kind (hybrid or not) with between
+    half and twice as many atoms and irreducible k-points. Since the similar runs can
+    still differ in size, their timings are compared per atom squared and k-point.
+
+    On its own, this only ever recommends settings that have already been run. With
+    `explore`, it instead recommends the first untried neighbor of the fastest
+    settings (NCORE or KPAR halved or doubled), so that repeated runs hill-climb to
+    the best settings.
+
+    Parameters
+    ----------
+    database
+        The SQLite database of the performance history.
+    natoms
+        The number of atoms.
+    nkpts
+        The number of irreducible k-points.
+    ncores
+        The number of MPI ranks.
+    lhfcalc
+        Whether it is a hybrid calculation.
+    explore
+        Whether to try an untried neighbor of the fastest settings.
+
+    Returns
+    -------
+    dict | None
+        The recommended `ncore` and `kpar`, or None if there are no similar runs.
+    """
+    if not Path(database).exists():
+        return None
+
+    with _connect(database) as connection:
+        rows = connection.execute(
+            "SELECT ncore, kpar, time_per_step / (natoms * natoms * nkpts) "
+            "FROM vasp_runs WHERE ncores = ? AND lhfcalc = ? "
+            "AND natoms BETWEEN ? AND ? AND nkpts BETWEEN ? AND ? AND kpar <= ?",
+            (ncores, lhfcalc, natoms / 2, natoms * 2, nkpts / 2, nkpts * 2, nkpts),
+        ).fetchall()
+    connection.close()
+    if not rows:
+        return None
+
+    costs = {}
+    for ncore, kpar, cost in rows:
+        costs.setdefault((ncore, kpar), []).append(cost)
+    ncore, kpar = min(costs, key=lambda params: fmean(costs[params]))
+    if explore:
+        for neighbor in [
+            (ncore * 2, kpar),
+            (ncore // 2, kpar),
+            (ncore, kpar * 2),
+            (ncore, kpar // 2),
+        ]:
+            if neighbor not in costs and _is_valid_layout(*neighbor, ncores, nkpts):
+                LOGGER.info(
+                    f"Exploring NCORE = {neighbor[0]} and KPAR = {neighbor[1]}."
+                )
+                ncore, kpar = neighbor
+                break
+    return {"ncore": ncore, "kpar": kpar}
+
+
+def get_nkpts(calc: Vasp_, atoms: Atoms) -> int | None:
+    """
+    Get the number of irreducible k-points that VASP will use.
+
+    Parameters
+    ----------
+    calc
+        The ASE Vasp calculator with the k-point settings.
+    atoms
+        The input atoms.
+
+    Returns
+    -------
+    int | None
+        The number of irreducible k-points, or None if it cannot be determined
+        from the k-point settings.
+    """
+    from ase.calculators.calculator import kpts2sizeandoffsets
+
+    kpts = calc.kpts
+    if kspacing := calc.float_params["kspacing"]:
+        mesh = np.ceil(
+            np.linalg.norm(atoms.cell.reciprocal(), axis=1) * 2 * np.pi / kspacing
+        )
+    elif kpts is None:
+        return None
+    elif isinstance(kpts, dict):
+        try:
+            mesh = kpts2sizeandoffsets(atoms=atoms, **kpts)[0]
+        except (TypeError, ValueError):
+            return None
+    elif np.ndim(kpts) == 0:
+        # VASP's fully automatic mesh with a length of `kpts`
+        mesh = np.floor(kpts * np.linalg.norm(atoms.cell.reciprocal(), axis=1) + 0.5)
+    elif np.ndim(kpts) == 2:
+        return len(kpts)
+    elif np.ndim(kpts) == 1 and len(kpts) == 3:
+        mesh = kpts
+    else:
+        return None
+    mesh = [max(int(n), 1) for n in mesh]
+    if np.prod(mesh) == 1 or not atoms.pbc.all():
+        return int(np.prod(mesh))
+
+    return len(
+        SpacegroupAnalyzer(AseAtomsAdaptor.get_structure(atoms)).get_ir_reciprocal_mesh(
+            mesh
+        )
+    )
+
+
+def _is_valid_layout(ncore: int, kpar: int, ncores: int, nkpts: int) -> bool:
+    """
+    Check whether NCORE and KPAR evenly divide the MPI ranks.
+
+    Parameters
+    ----------
+    ncore
+        The number of ranks per band.
+    kpar
+        The number of k-point groups.
+    ncores
+        The number of MPI ranks.
+    nkpts
+        The number of irreducible k-points.
+
+    Returns
+    -------
+    bool
+        Whether the layout is valid.
+    """
+    return (
+        ncore >= 1
+        and 1 <= kpar <= nkpts
+        and ncores % kpar == 0
+        and (ncores // kpar) % ncore == 0
+    )
+
+
+def _connect(database: Path | str) -> sqlite3.Connection:
+    """
+    Connect to the performance history database, creating it if needed.
+
+    Parameters
+    ----------
+    database
+        The SQLite database of the performance history.
+
+    Returns
+    -------
+    sqlite3.Connection
+        The connection to the database.
+    """
+    connection = sqlite3.connect(Path(database).expanduser(), timeout=30)
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS vasp_runs (natoms INTEGER, nbands INTEGER, "
+        "nkpts INTEGER, ncores INTEGER, ncore INTEGER, kpar INTEGER, lhfcalc INTEGER, "
+        "nsteps INTEGER, time_per_step REAL, directory TEXT, timestamp TEXT)"
+    )
+    return connection
@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
 import subprocess
+from logging import getLogger
 from pathlib import Path
+from shutil import copyfile
 from typing import TYPE_CHECKING
+from uuid import uuid4
 
 import numpy as np
+from ase.calculators import calculator
+from ase.calculators.calculator import Calculator
 from ase.calculators.vasp import Vasp as Vasp_
 from ase.calculators.vasp import setups as ase_setups
+from ase.calculators.vasp.vasp import check_atoms
 from ase.constraints import FixAtoms
 
 from quacc import QuaccDefault, get_settings
@@ -19,9 +26,11 @@ from quacc.calculators.vasp.params import (
     normalize_params,
     remove_unused_flags,
     set_auto_dipole,
+    set_interactive_params,
     set_pmg_kpts,
 )
-from quacc.calculators.vasp.vasp_custodian import run_custodian
+from quacc.calculators.vasp.tuning import record_parallel_stats
+from quacc.calculators.vasp.vasp_custodian import run_custodian, write_continuation
 from quacc.schemas.prep import set_magmoms
 from quacc.utils.dicts import sort_dict
 
@@ -32,6 +41,8 @@ if TYPE_CHECKING:
 
     from quacc.types import DefaultSetting
 
+LOGGER = getLogger(__name__)
+
 
 class Vasp(Vasp_):
     """This is a wrapper around the ASE Vasp calculator that adjusts INCAR parameters
@@ -44,6 +55,7 @@ class Vasp(Vasp_):
         input_atoms: Atoms,
         preset: None | str | Path = None,
         use_custodian: bool | DefaultSetting = QuaccDefault,
+        use_interactive: bool = False,
         incar_copilot: Literal["off", "on", "aggressive"]
         | DefaultSetting = QuaccDefault,
         copy_magmoms: bool | DefaultSetting = QuaccDefault,
@@ -74,6 +86,18 @@ class Vasp(Vasp_):
             override any corresponding preset values.
         use_custodian
             Whether to use Custodian to run VASP. Default is True in settings.
+        use_interactive
+            Whether to keep a single VASP process alive across calls to the
+            calculator using VASP's interactive mode (`INTERACTIVE = True`). New
+            positions are passed to VASP via stdin, so ASE-driven optimizations do
+            not pay the VASP start-up cost at every step and start each SCF from the
+            previous wavefunction. Custodian is not used in this mode. VASP only
+            accepts new positions, so any change to the cell restarts the VASP
+            process. This makes the mode slower than the default for volume
+            relaxations, which the VASP recipes therefore reject. Call `close()` to
+            stop VASP, which [quacc.runners.ase.Runner][] does at the end of each
+            calculation. Stopping VASP costs one electronic step at the final
+            positions.
         incar_copilot
             Controls VASP co-pilot mode for automated INCAR parameter handling.
 
@@ -138,10 +162,15 @@ class Vasp(Vasp_):
             self._settings.VASP_MAG_CUTOFF if mag_cutoff == QuaccDefault else mag_cutoff
         )
 
+        if use_interactive and use_custodian:
+            LOGGER.info("Not using Custodian because VASP is run in interactive mode.")
+            use_custodian = False
+
         # Assign variables to self
         self.input_atoms = input_atoms
         self.preset = preset
         self.use_custodian = use_custodian
+        self.use_interactive = use_interactive
         self.incar_copilot = incar_copilot
         self.copy_magmoms = copy_magmoms
         self.preset_mag_default = preset_mag_default
@@ -153,6 +182,7 @@ class Vasp(Vasp_):
 
         # Initialize for later
         self.user_calc_params: dict[str, Any] = {}
+        self._process: subprocess.Popen | None = None
 
         # Cleanup parameters
         self._cleanup_params()
@@ -274,6 +304,10 @@ class Vasp(Vasp_):
             mag_cutoff=self.mag_cutoff,
         )
 
+        # Set up interactive mode
+        if self.use_interactive:
+            self.user_calc_params = set_interactive_params(self.user_calc_params)
+
         # Handle INCAR swaps
         self.user_calc_params = get_param_swaps(
             self.user_calc_params, self.pmg_kpts, self.input_atoms, self.incar_copilot
@@ -315,7 +349,8 @@ class Vasp(Vasp_):
             directory = self.directory
 
         if self.use_custodian:
-            run_custodian(directory=directory)
+            run_log = run_custodian(directory=directory)
+            write_continuation(directory, run_log=run_log)
             return 0, None
 
         result = subprocess.run(
@@ -328,4 +363,209 @@ class Vasp(Vasp_):
         )
         if out is not None:
             out.write(result.stdout)
+        write_continuation(directory)
         return result.returncode, result.stderr
+
+    def calculate(
+        self,
+        atoms: Atoms | None = None,
+        properties: list[str] | tuple[str, ...] = ("energy",),
+        system_changes: list[str] | tuple[str, ...] = tuple(calculator.all_changes),
+    ) -> None:
+        """
+        Run a VASP calculation. In interactive mode, the first call starts VASP and
+        subsequent calls pass the new positions to the running VASP process.
+
+        Parameters
+        ----------
+        atoms
+            The Atoms object to run the calculation on.
+        properties
+            The properties to calculate.
+        system_changes
+            The changes to the Atoms object since the last calculation.
+
+        Returns
+        -------
+        None
+        """
+        if not self.use_interactive:
+            super().calculate(
+                atoms=atoms, properties=properties, system_changes=system_changes
+            )
+            self._record_performance()
+            return
+
+        Calculator.calculate(self, atoms, properties, system_changes)
+        check_atoms(self.atoms)
+
+        if self._process is not None and set(system_changes) - {"positions"}:
+            LOGGER.warning(
+                f"Restarting VASP because {', '.join(system_changes)} changed, but "
+                "only new positions can be passed to VASP in interactive mode."
+            )
+            self.close()
+
+        self.clear_results()
+        if self._process is None:
+            Path(self.directory, "STOPCAR").unlink(missing_ok=True)
+            self.write_input(self.atoms, properties, system_changes)
+            self._process = subprocess.Popen(
+                self.command,
+                shell=True,
+                cwd=self.directory,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+            )
+        else:
+            self._write_positions(self.atoms)
+
+        if not self._wait_for_positions():
+            errorcode = self._process.wait()
+            self._process = None
+            raise calculator.CalculationFailed(
+                f"{self.name} in {Path(self.directory).resolve()} exited "
+                f"unexpectedly with exit code {errorcode}"
+            )
+
+        # Read the results of the latest ionic step. The OUTCAR-derived properties
+        # are read once VASP is closed.
+        xml_results = dict(self._read_xml().results)
+        xml_results["forces"] = xml_results["forces"][self.resort]
+        self.results.update(xml_results)
+        self._store_param_state()
+
+    def close(self) -> None:
+        """
+        Stop a VASP process running in interactive mode and read the final results
+        from the completed output files. This is a no-op if VASP is not running.
+
+        VASP only checks for a STOPCAR within an ionic step, so the final positions
+        are passed once more with `LABORT` set. The already converged wavefunction
+        is reused and the SCF is aborted after its first electronic step. If VASP
+        still asks for new positions, it is terminated instead of being run further.
+
+        Returns
+        -------
+        None
+        """
+        if self._process is None:
+            return
+
+        Path(self.directory, "STOPCAR").write_text("LABORT = .TRUE.\n")
+        try:
+            if self._process.poll() is None:
+                self._write_positions(self.atoms)
+                if self._wait_for_positions():
+                    self._process.terminate()
+            errorcode = self._process.wait(timeout=60)
+        except (OSError, subprocess.TimeoutExpired):
+            self._process.kill()
+            errorcode = self._process.wait()
+        finally:
+            self._process = None
+
+        if self.results and errorcode == 0:
+            self.read_results()
+            self._record_performance()
+
+    def write_potcar(self, suffix: str = "", directory: str | Path = "./") -> None:
+        """
+        Write the POTCAR file. If `VASP_POTCAR_CACHE_DIR` is set, the POTCAR is
+        assembled only once for a given ordered list of pseudopotential files (keyed
+        on their paths, modification times, and sizes) and hard-linked into the
+        directory.
+
+        Parameters
+        ----------
+        suffix
+            Suffix of the POTCAR file name.
+        directory
+            The directory in which to write the POTCAR file.
+
+        Returns
+        -------
+        None
+        """
+        cache_dir = self._settings.VASP_POTCAR_CACHE_DIR
+        if not cache_dir:
+            super().write_potcar(suffix=suffix, directory=directory)
+            return
+
+        key = hashlib.sha256()
+        for filename in self.ppp_list:
+            stat = Path(filename).stat()
+            key.update(
+                f"{Path(filename).resolve()}:{stat.st_mtime_ns}:{stat.st_size}\n".encode()
+            )
+        cached_potcar = Path(cache_dir, f"POTCAR.{key.hexdigest()}")
+
+        if not cached_potcar.exists():
+            # Assemble under a unique name first so concurrent jobs never see a
+            # partially written POTCAR
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_suffix = f".{uuid4().hex}.tmp"
+            super().write_potcar(suffix=tmp_suffix, directory=cache_dir)
+            Path(cache_dir, f"POTCAR{tmp_suffix}").replace(cached_potcar)
+
+        potcar = Path(directory, f"POTCAR{suffix}")
+        potcar.unlink(missing_ok=True)
+        try:
+            potcar.hardlink_to(cached_potcar)
+        except OSError:
+            copyfile(cached_potcar, potcar)
+
+    def _record_performance(self) -> None:
+        """
+        Record the parallelization settings and timings of the completed run in the
+        `VASP_PARALLEL_HISTORY` database, if set. Failing to record them does not
+        fail the calculation.
+
+        Returns
+        -------
+        None
+        """
+        if not self._settings.VASP_PARALLEL_HISTORY:
+            return
+        try:
+            record_parallel_stats(self.directory, self._settings.VASP_PARALLEL_HISTORY)
+        except Exception:
+            LOGGER.warning(
+                "Could not record the VASP performance history.", exc_info=True
+            )
+
+    def _write_positions(self, atoms: Atoms) -> None:
+        """
+        Pass new positions to a VASP process running in interactive mode.
+
+        Parameters
+        ----------
+        atoms
+            The Atoms object with the new positions.
+
+        Returns
+        -------
+        None
+        """
+        for position in atoms.get_scaled_positions()[self.sort]:
+            self._process.stdin.write(" ".join(f"{x:19.16f}" for x in position) + "\n")
+        self._process.stdin.flush()
+
+    def _wait_for_positions(self) -> bool:
+        """
+        Wait for a VASP process running in interactive mode to ask for new
+        positions. VASP's stdout and stderr are appended to `vasp.out`.
+
+        Returns
+        -------
+        bool
+            True if VASP is waiting for new positions, or False if it exited.
+        """
+        with Path(self.directory, "vasp.out").open("a") as out:
+            for line in self._process.stdout:
+                out.write(line)
+                if "POSITIONS: reading from stdin" in line:
+                    return True
+        return False
@@ -4,34 +4,24 @@ from __future__ import annotations
 
 import os
 import shlex
+from pathlib import Path
 from typing import TYPE_CHECKING
 
-from custodian import Custodian
-from custodian.vasp.handlers import (
-    FrozenJobErrorHandler,
-    IncorrectSmearingHandler,
-    KspacingMetalHandler,
-    LargeSigmaHandler,
-    MeshSymmetryErrorHandler,
-    NonConvergingErrorHandler,
-    PositiveEnergyErrorHandler,
-    PotimErrorHandler,
-    StdErrHandler,
-    UnconvergedErrorHandler,
-    VaspErrorHandler,
-    WalltimeHandler,
-)
-from custodian.vasp.jobs import VaspJob
-from custodian.vasp.validators import VaspFilesValidator, VasprunXMLValidator
+from monty.serialization import dumpfn
 
 from quacc import QuaccDefault, get_settings
 
 if TYPE_CHECKING:
-    from pathlib import Path
-
     from src.quacc.settings import QuaccSettings
 
-    from quacc.types import DefaultSetting, VaspCustodianKwargs, VaspJobKwargs
+    from quacc.types import (
+        DefaultSetting,
+        VaspContinuationSchema,
+        VaspCustodianKwargs,
+        VaspJobKwargs,
+    )
+
+CONTINUATION_FILE = "quacc_continuation.json"
 
 
 def run_custodian(
@@ -87,6 +77,24 @@ def run_custodian(
         List of errors from each Custodian job.
     """
     # Adapted from atomate2.vasp.run.run_vasp
+    from custodian import Custodian
+    from custodian.vasp.handlers import (
+        FrozenJobErrorHandler,
+        IncorrectSmearingHandler,
+        KspacingMetalHandler,
+        LargeSigmaHandler,
+        MeshSymmetryErrorHandler,
+        NonConvergingErrorHandler,
+        PositiveEnergyErrorHandler,
+        PotimErrorHandler,
+        StdErrHandler,
+        UnconvergedErrorHandler,
+        VaspErrorHandler,
+        WalltimeHandler,
+    )
+    from custodian.vasp.jobs import VaspJob
+    from custodian.vasp.validators import VaspFilesValidator, VasprunXMLValidator
+
     settings: QuaccSettings = get_settings()
 
     # Set defaults
@@ -196,5 +204,77 @@ def run_custodian(
     return c.run()
 
 
+def write_continuation(
+    directory: str | Path, run_log: list[dict] | None = None
+) -> VaspContinuationSchema | None:
+    """
+    Write the state needed to continue a VASP run that was stopped early, either by
+    the wall-time handler of Custodian or by a STOPCAR, to a `quacc_continuation.json`
+    file in the run directory. The CONTCAR and WAVECAR are left in place.
+
+    Parameters
+    ----------
+    directory
+        The directory of the VASP run.
+    run_log
+        The run log returned by Custodian, if it was used.
+
+    Returns
+    -------
+    VaspContinuationSchema | None
+        The reason the run was stopped, the number of ionic steps that were
+        completed, the INCAR settings changed by the Custodian handlers, and the
+        errors that were corrected. None if the run was not stopped early
+        or there is no structure to continue from.
+    """
+    from pymatgen.io.vasp import Incar
+
+    directory = Path(directory)
+    errors = [
+        error
+        for run in run_log or []
+        for correction in run.get("corrections", [])
+        for error in correction.get("errors", [])
+    ]
+    if "Walltime reached" in errors:
+        reason = "walltime"
+    elif Path(directory, "STOPCAR").exists():
+        reason = "stopcar"
+    else:
+        return None
+
+    contcar = Path(directory, "CONTCAR")
+    if not contcar.exists() or contcar.stat().st_size == 0:
+        return None
+
+    oszicar = Path(directory, "OSZICAR")
+    n_ionic_steps = (
+        sum(" F= " in line for line in oszicar.read_text().splitlines())
+        if oszicar.exists()
+        else 0
+    )
+
+    # Custodian backs up the original INCAR before the handlers modify it
+    incar_changes = {}
+    if Path(directory, "INCAR.orig").exists():
+        incar = Incar.from_file(Path(directory, "INCAR"))
+        incar_orig = Incar.from_file(Path(directory, "INCAR.orig"))
+        incar_changes = {
+            key.lower(): incar.get(key)
+            for key in set(incar) | set(incar_orig)
+            if incar.get(key) != incar_orig.get(key)
+        }
+
+    continuation = {
+        "reason": reason,
+        "n_ionic_steps": n_ionic_steps,
+        "incar_changes": incar_changes,
+        "custodian_errors": [error for error in errors if error != "Walltime reached"],
+    }
+    dumpfn(continuation, Path(directory, CONTINUATION_FILE))
+
+    return continuation
+
+
 if __name__ == "__main__":
     run_custodian()
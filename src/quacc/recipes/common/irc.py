@@ -0,0 +1,85 @@
+"""Common IRC workflows."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from quacc import job, subflow
+
+if TYPE_CHECKING:
+    from ase.atoms import Atoms
+
+    from quacc import Job
+    from quacc.types import IRCPathSchema, OptSchema
+
+
+@subflow
+def irc_path_subflow(atoms: Atoms, irc_job: Job) -> IRCPathSchema:
+    """
+    Workflow consisting of:
+
+    1. Forward and reverse IRC (or quasi-IRC) branches from the same transition
+    state. The branches do not depend on each other, so they can run concurrently.
+
+    2. Joining the two branches into a single reaction path
+
+    Parameters
+    ----------
+    atoms
+        Atoms object of the transition state.
+    irc_job
+        The IRC function. It must take a `direction` keyword argument of "forward"
+        or "reverse". Any settings shared by both branches, such as an initial
+        Hessian, should already be set on it.
+
+    Returns
+    -------
+    IRCPathSchema
+        Dictionary of results. See the type-hint for the data structure.
+    """
+    forward = irc_job(atoms, direction="forward")
+    reverse = irc_job(atoms, direction="reverse")
+
+    return join_irc_paths(forward, reverse)
+
+
+@job
+def join_irc_paths(forward: OptSchema, reverse: OptSchema) -> IRCPathSchema:
+    """
+    Join the forward and reverse branches of an IRC into a single reaction path that
+    runs from the reverse endpoint through the transition state to the forward
+    endpoint. If both branches start from the same geometry, it is only included
+    once.
+
+    Parameters
+    ----------
+    forward
+        The results of the forward branch.
+    reverse
+        The results of the reverse branch.
+
+    Returns
+    -------
+    IRCPathSchema
+        Dictionary of results. See the type-hint for the data structure.
+    """
+    trajectory = reverse["trajectory"][::-1]
+    energies = [results["energy"] for results in reverse["trajectory_results"][::-1]]
+
+    start = 0
+    if len(trajectory) > 0 and np.allclose(
+        trajectory[-1].positions, forward["trajectory"][0].positions
+    ):
+        start = 1
+    trajectory += forward["trajectory"][start:]
+    energies += [results["energy"] for results in forward["trajectory_results"][start:]]
+
+    return {
+        "forward": forward,
+        "reverse": reverse,
+        "trajectory": trajectory,
+        "energies": energies,
+        "ts_index": int(np.argmax(energies)),
+    }
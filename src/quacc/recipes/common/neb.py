@@ -0,0 +1,315 @@
+"""Common NEB workflows."""
+
+from __future__ import annotations
+
+from itertools import pairwise
+from logging import getLogger
+from typing import TYPE_CHECKING
+
+import numpy as np
+from ase.calculators.singlepoint import SinglePointCalculator
+from ase.geometry import find_mic
+from ase.mep import NEB
+from ase.optimize import FIRE
+
+from quacc import subflow
+from quacc.wflow_tools.job_patterns import map_batched
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+    from ase.atoms import Atoms
+    from numpy.typing import NDArray
+
+    from quacc import Job
+    from quacc.types import DistributedNebSchema, RunSchema
+
+LOGGER = getLogger(__name__)
+
+
+@subflow
+def neb_subflow(
+    images: list[Atoms],
+    static_job: Job,
+    fmax: float = 0.05,
+    max_steps: int = 500,
+    climb: bool = True,
+    max_images: int | None = None,
+    max_angle: float = 30.0,
+    batch_size: int | None = None,
+    batch_decorator: Callable | None = None,
+    optimizer_kwargs: dict[str, Any] | None = None,
+    neb_kwargs: dict[str, Any] | None = None,
+) -> DistributedNebSchema:
+    """
+    Workflow consisting of a nudged elastic band (NEB) in which the energy and forces
+    of each image are computed by a separate job at every iteration. The NEB step
+    itself is taken by the FIRE optimizer in the orchestrating process, so the band
+    proceeds as follows:
+
+    1. Static calculations of every image whose geometry is new or has changed,
+    which can run concurrently
+
+    2. An NEB step. Images whose NEB force is already below `fmax` are frozen: they
+    are not moved and so are not recomputed in the next iteration. Their FIRE
+    velocities are zeroed, so they start from rest when they are unfrozen, which
+    happens as soon as the springs of their moving neighbors push their NEB force
+    back above `fmax`.
+
+    3. Once the band is converged, new images are inserted on either side of each
+    image where the band bends by more than `max_angle`, up to `max_images`. When no
+    more images need to be inserted, the highest-energy image is turned into a
+    climbing image (if `climb` is True) and the band is converged again.
+
+    The results of each iteration must be known before the next one can be set up,
+    so this subflow blocks on the results of its static jobs. It therefore cannot be
+    used with workflow engines that do not allow this (Covalent, Jobflow, Redun).
+
+    Parameters
+    ----------
+    images
+        The initial images of the band, including the two endpoints.
+    static_job
+        The static function. It must return a schema with the `energy` and `forces`
+        in its `results`.
+    fmax
+        Tolerance for the force on each image (eV/Å).
+    max_steps
+        Maximum number of NEB iterations.
+    climb
+        Whether to switch to a climbing-image NEB once the band is converged.
+    max_images
+        Maximum number of images, including the endpoints. Defaults to twice the
+        number of images minus one.
+    max_angle
+        Angle (in degrees) between the two segments of the band next to an image
+        above which new images are inserted around it.
+    batch_size
+        If set, the static jobs of each iteration are grouped into jobs of this many
+        images with [quacc.wflow_tools.job_patterns.map_batched][] instead of being
+        run as one job per image.
+    batch_decorator
+        The decorator to apply to the batched jobs if `batch_size` is set. The
+        decorator of `static_job` is not used for these, since `static_job` is run
+        within them.
+    optimizer_kwargs
+        Dictionary of kwargs for [ase.optimize.fire.FIRE][].
+    neb_kwargs
+        Dictionary of kwargs for [ase.mep.neb.NEB][].
+
+    Returns
+    -------
+    DistributedNebSchema
+        Dictionary of results. See the type-hint for the data structure.
+    """
+    if max_steps < 1:
+        raise ValueError(f"max_steps must be at least 1, not {max_steps}.")
+
+    optimizer_kwargs = {"logfile": None} | (optimizer_kwargs or {})
+    neb_kwargs = {"method": "improvedtangent"} | (neb_kwargs or {})
+    max_images = max_images or 2 * len(images) - 1
+
+    images = [image.copy() for image in images]
+    image_results: list[RunSchema | None] = [None] * len(images)
+    energy_profile = []
+    n_evaluations = 0
+    climbing = False
+    converged = False
+    neb = None
+
+    for n_iter in range(1, max_steps + 1):
+        pending = [i for i, result in enumerate(image_results) if result is None]
+        for i, result in zip(
+            pending,
+            _run_static_jobs(
+                static_job, [images[i] for i in pending], batch_size, batch_decorator
+            ),
+            strict=True,
+        ):
+            image_results[i] = result
+            images[i].calc = SinglePointCalculator(
+                images[i],
+                energy=result["results"]["energy"],
+                forces=result["results"]["forces"],
+            )
+        n_evaluations += len(pending)
+
+        if neb is None:
+            neb = NEB(images, climb=climbing, **neb_kwargs)
+            dyn = FIRE(neb, **optimizer_kwargs)
+        neb_forces = neb.get_forces().reshape(len(images) - 2, -1, 3)
+        energy_profile.append([image.get_potential_energy() for image in images])
+        image_fmax = np.linalg.norm(neb_forces, axis=2).max(axis=1)
+
+        if image_fmax.max() < fmax:
+            if not climbing and len(images) < max_images:
+                new_images = _insert_images(images, max_angle, max_images)
+                if len(new_images) > len(images):
+                    LOGGER.info(
+                        f"Growing the NEB from {len(images)} to {len(new_images)} images."
+                    )
+                    old_results = {
+                        id(image): result
+                        for image, result in zip(images, image_results, strict=True)
+                    }
+                    image_results = [old_results.get(id(image)) for image in new_images]
+                    images = new_images
+                    neb = None
+                    continue
+            if climb and not climbing:
+                LOGGER.info("Switching the NEB to a climbing-image NEB.")
+                climbing = True
+                neb = None
+                continue
+            converged = True
+            break
+        if n_iter == max_steps:
+            break
+
+        # Frozen images keep their geometry, so their results remain valid
+        frozen = image_fmax < fmax
+        neb_forces[frozen] = 0.0
+        old_positions = [image.get_positions() for image in images[1:-1]]
+        dyn.step(neb_forces.reshape(-1, 3))
+        dyn.v[np.repeat(frozen, neb_forces.shape[1])] = 0.0
+        for i, image in enumerate(images[1:-1], start=1):
+            if frozen[i - 1]:
+                image.set_positions(old_positions[i - 1], apply_constraint=False)
+            else:
+                image_results[i] = None
+
+    energies = [image.get_potential_energy() for image in images]
+    if not converged:
+        LOGGER.warning(f"The NEB did not converge in {max_steps} iterations.")
+
+    return {
+        "trajectory": images,
+        "energies": energies,
+        "ts_index": int(np.argmax(energies)),
+        "climbing": climbing,
+        "converged": converged,
+        "n_iterations": n_iter,
+        "n_evaluations": n_evaluations,
+        "energy_profile": energy_profile,
+        "image_results": image_results,
+    }
+
+
+def _run_static_jobs(
+    static_job: Job,
+    images: list[Atoms],
+    batch_size: int | None,
+    batch_decorator: Callable | None,
+) -> list[RunSchema]:
+    """
+    Run the static jobs of an NEB iteration and wait for their results.
+
+    Parameters
+    ----------
+    static_job
+        The static function.
+    images
+        The images to compute.
+    batch_size
+        The number of images per job, or None for one job per image.
+    batch_decorator
+        The decorator to apply to the batched jobs.
+
+    Returns
+    -------
+    list[RunSchema]
+        The results of the static jobs, in the order of the images.
+    """
+    if not images:
+        return []
+    images = [image.copy() for image in images]
+    if batch_size:
+        futures = map_batched(
+            static_job, batch_size, decorator=batch_decorator, atoms=images
+        )
+    else:
+        futures = [static_job(image) for image in images]
+
+    results = []
+    for future in futures:
+        if hasattr(future, "result"):
+            results.append(future.result())
+        elif hasattr(future, "compute"):
+            results.append(future.compute())
+        else:
+            results.append(future)
+    return results
+
+
+def _insert_images(
+    images: list[Atoms], max_angle: float, max_images: int
+) -> list[Atoms]:
+    """
+    Insert new images at the midpoints of the segments next to each image where the
+    band bends by more than `max_angle`, starting from the most bent image.
+
+    Parameters
+    ----------
+    images
+        The images of the band.
+    max_angle
+        The angle (in degrees) between the two segments next to an image above which
+        new images are inserted around it.
+    max_images
+        The maximum number of images after the insertion.
+
+    Returns
+    -------
+    list[Atoms]
+        The images of the band, with the new images (without a calculator) inserted.
+        The existing images are the same objects as in `images`.
+    """
+    segments = [_get_displacement(a, b) for a, b in pairwise(images)]
+    angles = []
+    for i in range(1, len(images) - 1):
+        left, right = segments[i - 1].ravel(), segments[i].ravel()
+        cos_angle = np.dot(left, right) / (np.linalg.norm(left) * np.linalg.norm(right))
+        angles.append((np.degrees(np.arccos(np.clip(cos_angle, -1.0, 1.0))), i))
+
+    split = set()
+    for angle, i in sorted(angles, reverse=True):
+        if angle <= max_angle:
+            break
+        for segment in (i - 1, i):
+            if len(images) + len(split | {segment}) <= max_images:
+                split.add(segment)
+
+    new_images = []
+    for i, image in enumerate(images):
+        new_images.append(image)
+        if i in split:
+            midpoint = image.copy()
+            midpoint.set_positions(
+                image.get_positions() + 0.5 * segments[i], apply_constraint=False
+            )
+            new_images.append(midpoint)
+    return new_images
+
+
+def _get_displacement(start: Atoms, end: Atoms) -> NDArray:
+    """
+    Get the displacement of each atom between two images, using the minimum image
+    convention for periodic systems.
+
+    Parameters
+    ----------
+    start
+        The first image.
+    end
+        The second image.
+
+    Returns
+    -------
+    NDArray
+        The Nx3 displacements.
+    """
+    displacement = end.get_positions() - start.get_positions()
+    if start.pbc.any():
+        displacement = find_mic(displacement, start.cell, start.pbc)[0]
+    return displacement
@@ -0,0 +1,64 @@
+"""NEB recipes for EMT."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from quacc import flow
+from quacc.recipes.common.neb import neb_subflow
+from quacc.recipes.emt.core import static_job
+from quacc.wflow_tools.customizers import customize_funcs
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+    from ase.atoms import Atoms
+
+    from quacc.types import DistributedNebSchema
+
+
+@flow
+def neb_flow(
+    images: list[Atoms],
+    neb_subflow_kwargs: dict[str, Any] | None = None,
+    job_params: dict[str, dict[str, Any]] | None = None,
+    job_decorators: dict[str, Callable | None] | None = None,
+) -> DistributedNebSchema:
+    """
+    Workflow consisting of:
+
+    1. An NEB with one static calculation per image and iteration, adaptive image
+    insertion, image freezing, and a final climbing image
+        - name: "static_job"
+        - job: [quacc.recipes.emt.core.static_job][]
+
+    Parameters
+    ----------
+    images
+        The initial images of the band, including the two endpoints.
+    neb_subflow_kwargs
+        Additional keyword arguments to pass to
+        [quacc.recipes.common.neb.neb_subflow][]. Unless set, its `batch_decorator`
+        is the decorator of the "static_job".
+    job_params
+        Custom parameters to pass to each Job in the Flow. This is a dictionary where
+        the keys are the names of the jobs and the values are dictionaries of parameters.
+    job_decorators
+        Custom decorators to apply to each Job in the Flow. This is a dictionary where
+        the keys are the names of the jobs and the values are decorators.
+
+    Returns
+    -------
+    DistributedNebSchema
+        Dictionary of results. See the type-hint for the data structure.
+    """
+    static_job_ = customize_funcs(
+        "static_job", static_job, param_swaps=job_params, decorators=job_decorators
+    )
+    job_decorators = job_decorators or {}
+    neb_subflow_kwargs = {
+        "batch_decorator": job_decorators.get("static_job") or job_decorators.get("all")
+    } | (neb_subflow_kwargs or {})
+
+    return neb_subflow(images, static_job_, **neb_subflow_kwargs)
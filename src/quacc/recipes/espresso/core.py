@@ -179,6 +179,7 @@ def ase_relax_job(
     atoms: Atoms,
     preset: str | None = "sssp_1.3.0_pbe_efficiency",
     autorestart: bool = True,
+    use_socket: bool = False,
     relax_cell: bool = False,
     opt_params: OptParams | None = None,
     copy_files: (
@@ -207,6 +208,12 @@ def ase_relax_job(
         Whether to automatically turn on the restart flag after the first
         calculation. This avoids recomputing everything from scratch at each
         step of the optimization.
+    use_socket
+        Whether to keep a single pw.x process alive across all steps of the
+        optimization by running it in i-PI socket mode, which reuses the previous
+        wavefunction and charge density without restarting pw.x. If True,
+        `autorestart` has no effect. See
+        [quacc.calculators.espresso.espresso.Espresso][] for details.
     relax_cell
         Whether to relax the cell or not.
     opt_params
@@ -249,7 +256,7 @@ def ase_relax_job(
         preset=preset,
         template=EspressoTemplate("pw", autorestart=autorestart, outdir=prev_outdir),
         calc_defaults=calc_defaults,
-        calc_swaps=calc_kwargs,
+        calc_swaps=calc_kwargs | {"use_socket": use_socket},
         opt_defaults=opt_defaults,
         opt_params=opt_params,
         additional_fields={"name": "pw.x ExternalRelax"} | (additional_fields or {}),
@@ -16,9 +16,14 @@ from ase.io.espresso import Namelist
 
 from quacc import Job, flow, job, subflow
 from quacc.calculators.espresso.espresso import EspressoTemplate
-from quacc.calculators.espresso.utils import grid_copy_files, grid_prepare_repr
+from quacc.calculators.espresso.utils import (
+    get_shared_save_dirs,
+    grid_copy_files,
+    grid_prepare_repr,
+)
 from quacc.recipes.espresso._base import run_and_summarize
 from quacc.utils.dicts import recursive_dict_merge
+from quacc.utils.files import safe_decompress_dir
 from quacc.wflow_tools.customizers import customize_funcs
 
 if TYPE_CHECKING:
@@ -43,6 +48,7 @@ def phonon_job(
         | None
     ) = None,
     prev_outdir: SourceDirectory | None = None,
+    shared_outdir: SourceDirectory | None = None,
     test_run: bool = False,
     use_phcg: bool = False,
     additional_fields: dict[str, Any] | None = None,
@@ -80,6 +86,11 @@ def phonon_job(
         The output directory of a previous calculation. If provided, Quantum Espresso
         will directly read the necessary files from this directory, eliminating the need
         to manually copy files. The directory will be ungzipped if necessary.
+    shared_outdir
+        The output directory of a previous calculation whose save directories will be
+        symlinked into this calculation rather than copied. Unlike `prev_outdir`, the
+        calculation still writes to its own directory, so many calculations can share
+        the same `shared_outdir`. The save directories must already be ungzipped.
     test_run
         If True, a test run is performed to check that the calculation input_data is correct or
         to generate some files/info if needed.
@@ -109,7 +120,9 @@ def phonon_job(
     }
 
     return run_and_summarize(
-        template=EspressoTemplate(binary, test_run=test_run, outdir=prev_outdir),
+        template=EspressoTemplate(
+            binary, test_run=test_run, outdir=prev_outdir, shared_outdir=shared_outdir
+        ),
         calc_defaults=calc_defaults,
         calc_swaps=calc_kwargs,
         additional_fields={"name": f"{binary}.x Phonon"} | (additional_fields or {}),
@@ -321,6 +334,7 @@ def grid_phonon_flow(
     ) = None,
     prev_outdir: SourceDirectory | None = None,
     nblocks: int = 1,
+    share_outdir: bool = False,
     job_params: dict[str, Any] | None = None,
     job_decorators: dict[str, Callable | None] | None = None,
 ) -> RunSchema:
@@ -348,6 +362,14 @@ def grid_phonon_flow(
     data size by a factor of nblocks, but also reducing the level of parallelization.
     In the case of nblocks = 0, each job will contain all the representations for each q-point.
 
+    Alternatively, with `share_outdir=True`, the save directories of the "ph_init_job"
+    are ungzipped once and symlinked read-only into every job instead of being copied.
+    Each job then only writes its own `_ph0` fragments, and only these fragments are
+    collected by the final recover job, so that the disk usage no longer scales with
+    n*m. This requires all jobs to run on a filesystem where the directory of the
+    "ph_init_job" is reachable at the same path, and `lqdir` to be True (the default)
+    for q-points other than Gamma to benefit from it.
+
     Consists of following jobs that can be modified:
 
     1. ph.x calculation test_run
@@ -391,6 +413,9 @@ def grid_phonon_flow(
         This will reduce the amount of data produced by a factor of nblocks.
         If nblocks = 0, each job will contain all the representations for a
         single q-point.
+    share_outdir
+        Whether the jobs should share the save directories of the "ph_init_job" via
+        symlinks rather than each getting a copy of them.
     job_params
         Custom parameters to pass to each Job in the Flow. This is a dictionary where
         the keys are the names of the jobs and the values are dictionaries of parameters.
@@ -406,7 +431,21 @@ def grid_phonon_flow(
     """
 
     @subflow
-    def _ph_recover_subflow(grid_results: list[RunSchema]) -> RunSchema:
+    def _ph_recover_subflow(
+        grid_results: list[RunSchema],
+        ph_init_job_results: RunSchema,
+        share_outdir: bool = False,
+    ) -> RunSchema:
+        if share_outdir:
+            shared_outdir = ph_init_job_results["parameters"]["input_data"]["inputph"][
+                "outdir"
+            ]
+            prev_dirs = {
+                result["dir_name"]: [Path("_ph0", "**", "*.xml.*")]
+                for result in grid_results
+            }
+            return ph_recover_job(copy_files=prev_dirs, shared_outdir=shared_outdir)
+
         prev_dirs = {}
         for result in grid_results:
             prev_dirs[result["dir_name"]] = [
@@ -424,6 +463,7 @@ def grid_phonon_flow(
         ph_init_job_results: RunSchema,
         ph_job: Job,
         nblocks: int = 1,
+        share_outdir: bool = False,
     ) -> list[RunSchema]:
         """
         This functions is a subflow used in
@@ -439,6 +479,9 @@ def grid_phonon_flow(
             The phonon job to be executed.
         nblocks
             The number of blocks for grouping representations.
+        share_outdir
+            Whether the phonon jobs share the save directories of the 'only_init'
+            job rather than copying them.
 
         Returns
         -------
@@ -452,13 +495,25 @@ def grid_phonon_flow(
             "outdir"
         ]
 
+        # Ungzip the shared save directories once rather than in every job, which
+        # would race with each other
+        shared_kwargs = {}
+        if share_outdir:
+            for save_dir in get_shared_save_dirs(prev_outdir):
+                safe_decompress_dir(save_dir)
+            shared_kwargs["shared_outdir"] = prev_outdir
+
         grid_results = []
         for qnum, qdata in ph_init_job_results["results"].items():
             ph_input_data["inputph"]["start_q"] = qnum
             ph_input_data["inputph"]["last_q"] = qnum
             repr_to_do = grid_prepare_repr(qdata["representations"], nblocks)
             files_to_copy = grid_copy_files(
-                ph_input_data, prev_outdir, qnum, qdata["qpoint"]
+                ph_input_data,
+                prev_outdir,
+                qnum,
+                qdata["qpoint"],
+                share_outdir=share_outdir,
             )
             for representation in repr_to_do:
                 ph_input_data["inputph"]["start_irr"] = representation[0]
@@ -466,6 +521,7 @@ def grid_phonon_flow(
                 ph_job_results = ph_job(
                     copy_files=deepcopy(files_to_copy),
                     input_data=deepcopy(ph_input_data),
+                    **shared_kwargs,
                 )
                 grid_results.append(ph_job_results)
 
@@ -497,10 +553,16 @@ def grid_phonon_flow(
 
     ph_init_job_results = ph_init_job(copy_files=copy_files, prev_outdir=prev_outdir)
     grid_results = _grid_phonon_subflow(
-        job_params["ph_job"]["input_data"], ph_init_job_results, ph_job, nblocks=nblocks
+        job_params["ph_job"]["input_data"],
+        ph_init_job_results,
+        ph_job,
+        nblocks=nblocks,
+        share_outdir=share_outdir,
     )
 
-    return _ph_recover_subflow(grid_results)
+    return _ph_recover_subflow(
+        grid_results, ph_init_job_results, share_outdir=share_outdir
+    )
 
 
 @job
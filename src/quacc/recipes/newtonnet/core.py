@@ -5,6 +5,7 @@ from __future__ import annotations
 from importlib.util import find_spec
 from typing import TYPE_CHECKING
 
+import numpy as np
 from ase.vibrations.data import VibrationsData
 from monty.dev import requires
 
@@ -25,6 +26,7 @@ if TYPE_CHECKING:
     from typing import Any
 
     from ase.atoms import Atoms
+    from numpy.typing import NDArray
 
     from quacc.types import (
         Filenames,
@@ -92,6 +94,7 @@ def relax_job(
     opt_params: OptParams | None = None,
     copy_files: SourceDirectory | dict[SourceDirectory, Filenames] | None = None,
     additional_fields: dict[str, Any] | None = None,
+    trajectory_hessian_every_n: int = 1,
     **calc_kwargs,
 ) -> OptSchema:
     """
@@ -108,6 +111,10 @@ def relax_job(
         Files to copy (and decompress) from source to the runtime directory.
     additional_fields
         Additional fields to add to the results dictionary.
+    trajectory_hessian_every_n
+        Only calculate the Hessian stored for every Nth frame of the trajectory,
+        plus that of the last frame. If 0, only the first and last frames get a
+        Hessian.
     **calc_kwargs
         Dictionary of custom kwargs for the NewtonNet calculator. Set a value to
         `quacc.Remove` to remove a pre-existing key entirely. For a list of available
@@ -135,7 +142,9 @@ def relax_job(
     return _add_stdev_and_hess(
         Summarize(
             additional_fields={"name": "NewtonNet Relax"} | (additional_fields or {})
-        ).opt(dyn)
+        ).opt(dyn),
+        calc,
+        hessian_every_n=trajectory_hessian_every_n,
     )
 
 
@@ -147,6 +156,7 @@ def freq_job(
     atoms: Atoms,
     temperature: float = 298.15,
     pressure: float = 1.0,
+    hessian: list[list[float]] | NDArray | None = None,
     copy_files: SourceDirectory | dict[SourceDirectory, Filenames] | None = None,
     additional_fields: dict[str, Any] | None = None,
     **calc_kwargs,
@@ -162,6 +172,10 @@ def freq_job(
         The temperature for the thermodynamic analysis.
     pressure
         The pressure for the thermodynamic analysis.
+    hessian
+        A Hessian of `atoms` that was already calculated with the same model, e.g. by
+        the Hessian provider of [quacc.recipes.newtonnet.ts.ts_job][]. If given,
+        only the energy is calculated and the Hessian is not recomputed.
     copy_files
         Files to copy (and decompress) from source to the runtime directory.
     additional_fields
@@ -180,7 +194,7 @@ def freq_job(
     calc_defaults = {
         "model_path": settings.NEWTONNET_MODEL_PATH,
         "settings_path": settings.NEWTONNET_CONFIG_PATH,
-        "hess_method": "autograd",
+        "hess_method": "autograd" if hessian is None else None,
     }
     calc_flags = recursive_dict_merge(calc_defaults, calc_kwargs)
 
@@ -190,6 +204,10 @@ def freq_job(
     summary = Summarize(
         additional_fields={"name": "NewtonNet Frequency"} | (additional_fields or {})
     ).run(final_atoms, atoms)
+    if hessian is not None:
+        summary["results"]["hessian"] = np.reshape(
+            hessian, (len(atoms), 3, len(atoms), 3)
+        )
 
     vib = VibrationsData(final_atoms, summary["results"]["hessian"])
     return VibSummarize(
@@ -204,7 +222,9 @@ def freq_job(
     )
 
 
-def _add_stdev_and_hess(summary: dict[str, Any], **calc_kwargs) -> dict[str, Any]:
+def _add_stdev_and_hess(
+    summary: dict[str, Any], calc: NewtonNet, hessian_every_n: int = 1
+) -> dict[str, Any]:
     """
     Calculate and add standard deviation values and Hessians to the summary.
 
@@ -214,14 +234,20 @@ def _add_stdev_and_hess(summary: dict[str, Any], **calc_kwargs) -> dict[str, Any
     calculated standard deviation values and Hessians to each configuration in
     the trajectory.
 
+    The frames are evaluated in memory with the already-loaded calculator, so the
+    model files are read once and no scratch directory is made per frame.
+
     Parameters
     ----------
     summary
         A dictionary containing information about the molecular trajectory.
-    **calc_kwargs
-        Custom kwargs for the NewtonNet calculator. Set a value to
-        `quacc.Remove` to remove a pre-existing key entirely. For a list of available
-        keys, refer to the `newtonnet.utils.ase_interface.MLAseCalculator` calculator.
+    calc
+        The NewtonNet calculator, typically the one used to generate the
+        trajectory.
+    hessian_every_n
+        Only calculate the Hessian for every Nth frame, counting from the first
+        frame. The Hessian of the last frame is always calculated. If 0, only the
+        first and last frames get a Hessian.
 
     Returns
     -------
@@ -229,20 +255,23 @@ def _add_stdev_and_hess(summary: dict[str, Any], **calc_kwargs) -> dict[str, Any
         The modified summary dictionary with added standard deviation and
         Hessian values.
     """
-    settings = get_settings()
-    calc_defaults = {
-        "model_path": settings.NEWTONNET_MODEL_PATH,
-        "settings_path": settings.NEWTONNET_CONFIG_PATH,
-    }
-    calc_flags = recursive_dict_merge(calc_defaults, calc_kwargs)
+    n_frames = len(summary["trajectory"])
+    hessian_frames = {0, n_frames - 1}
+    if hessian_every_n > 0:
+        hessian_frames |= set(range(0, n_frames, hessian_every_n))
+
     for i, atoms in enumerate(summary["trajectory"]):
-        calc = NewtonNet(**calc_flags)
-        results = Runner(atoms, calc).run_calc().calc.results
-        summary["trajectory_results"][i]["hessian"] = results["hessian"]
+        properties = ["energy", "forces"]
+        if i in hessian_frames:
+            properties.append("hessian")
+        calc.calculate(atoms.copy(), properties=properties)
+        results = calc.results
         summary["trajectory_results"][i]["energy_std"] = results["energy_disagreement"]
         summary["trajectory_results"][i]["forces_std"] = results["forces_disagreement"]
-        summary["trajectory_results"][i]["hessian_std"] = results[
-            "hessian_disagreement"
-        ]
+        if i in hessian_frames:
+            summary["trajectory_results"][i]["hessian"] = results["hessian"]
+            summary["trajectory_results"][i]["hessian_std"] = results[
+                "hessian_disagreement"
+            ]
 
     return summary
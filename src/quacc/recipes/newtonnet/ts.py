@@ -6,14 +6,23 @@ from importlib.util import find_spec
 from typing import TYPE_CHECKING
 
 import numpy as np
+from ase.calculators.singlepoint import SinglePointCalculator
 from ase.mep import NEB
 from monty.dev import requires
 
-from quacc import change_settings, get_settings, job, strip_decorator
+from quacc import change_settings, flow, get_settings, job, strip_decorator
+from quacc.atoms.core import get_atoms_id
+from quacc.atoms.ts import (
+    geodesic_interpolate_batch,
+    geodesic_interpolate_wrapper,
+    get_hessian_function,
+)
+from quacc.recipes.common.irc import irc_path_subflow
 from quacc.recipes.newtonnet.core import _add_stdev_and_hess, freq_job, relax_job
 from quacc.runners.ase import Runner
 from quacc.schemas.ase import Summarize
 from quacc.utils.dicts import recursive_dict_merge
+from quacc.wflow_tools.customizers import customize_funcs
 
 has_geodesic_interpolate = bool(find_spec("geodesic_interpolate"))
 has_sella = bool(find_spec("sella"))
@@ -23,10 +32,9 @@ if has_sella:
     from sella import IRC, Sella
 if has_newtonnet:
     from newtonnet.utils.ase_interface import MLAseCalculator as NewtonNet
-if has_geodesic_interpolate:
-    from quacc.atoms.ts import geodesic_interpolate_wrapper
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from typing import Any, Literal
 
     from ase.atoms import Atoms
@@ -34,6 +42,7 @@ if TYPE_CHECKING:
 
     from quacc.types import (
         GeodesicSchema,
+        IRCPathSchema,
         NebSchema,
         NewtonNetIRCSchema,
         NewtonNetQuasiIRCSchema,
@@ -54,6 +63,8 @@ def ts_job(
     freq_job_kwargs: dict[str, Any] | None = None,
     opt_params: OptParams | None = None,
     additional_fields: dict[str, Any] | None = None,
+    trajectory_hessian_every_n: int = 1,
+    custom_hessian_exact_every_n: int = 1,
     **calc_kwargs,
 ) -> NewtonNetTSSchema:
     """
@@ -64,7 +75,8 @@ def ts_job(
     atoms
         The atoms object representing the system.
     use_custom_hessian
-        Whether to use a custom Hessian matrix.
+        Whether to give Sella the NewtonNet Hessian instead of letting it estimate
+        the Hessian by iterative diagonalization.
     run_freq
         Whether to run the frequency job.
     freq_job_kwargs
@@ -74,6 +86,15 @@ def ts_job(
         of available keys, refer to [quacc.runners.ase.Runner.run_opt][].
     additional_fields
         Additional fields to add to the results dictionary.
+    trajectory_hessian_every_n
+        Only calculate the Hessian stored for every Nth frame of the trajectory,
+        plus that of the last frame. If 0, only the first and last frames get a
+        Hessian.
+    custom_hessian_exact_every_n
+        With `use_custom_hessian`, only calculate an exact NewtonNet Hessian for
+        Sella every Nth time it asks for one and use quasi-Newton updates in
+        between. The final Hessian is reused by the frequency job if neither the TS
+        nor the frequency job have custom calculator kwargs.
     **calc_kwargs
         Dictionary of custom kwargs for the NewtonNet calculator. Set a value to
         `quacc.Remove` to remove a pre-existing key entirely. For a list of available
@@ -102,18 +123,34 @@ def ts_job(
     calc_flags = recursive_dict_merge(calc_defaults, calc_kwargs)
     opt_flags = recursive_dict_merge(opt_defaults, opt_params)
 
-    if use_custom_hessian:
-        opt_flags["optimizer_kwargs"]["hessian_function"] = _get_hessian
+    hessian_provider = (
+        _HessianProvider(exact_every_n=custom_hessian_exact_every_n, **calc_kwargs)
+        if use_custom_hessian
+        else None
+    )
+    if hessian_provider:
+        opt_flags["optimizer_kwargs"]["hessian_function"] = hessian_provider
 
     calc = NewtonNet(**calc_flags)
 
     # Run the TS optimization
     dyn = Runner(atoms, calc).run_opt(**opt_flags)
     opt_ts_summary = _add_stdev_and_hess(
-        Summarize(additional_fields={"name": "NewtonNet TS"}).opt(dyn), **calc_flags
+        Summarize(additional_fields={"name": "NewtonNet TS"}).opt(dyn),
+        calc,
+        hessian_every_n=trajectory_hessian_every_n,
     )
 
     # Run a frequency calculation
+    if (
+        run_freq
+        and hessian_provider
+        and not calc_kwargs
+        and set(freq_job_kwargs) <= {"temperature", "pressure", "additional_fields"}
+    ):
+        freq_job_kwargs = freq_job_kwargs | {
+            "hessian": hessian_provider(opt_ts_summary["atoms"], exact=True)
+        }
     freq_summary = (
         strip_decorator(freq_job)(opt_ts_summary["atoms"], **freq_job_kwargs)
         if run_freq
@@ -136,6 +173,8 @@ def irc_job(
     freq_job_kwargs: dict[str, Any] | None = None,
     opt_params: OptParams | None = None,
     additional_fields: dict[str, Any] | None = None,
+    trajectory_hessian_every_n: int = 1,
+    initial_hessian: list[list[float]] | NDArray | None = None,
     **calc_kwargs,
 ) -> NewtonNetIRCSchema:
     """
@@ -156,6 +195,14 @@ def irc_job(
         of available keys, refer to [quacc.runners.ase.Runner.run_opt][].
     additional_fields
         Additional fields to add to the results dictionary.
+    trajectory_hessian_every_n
+        Only calculate the Hessian stored for every Nth frame of the trajectory,
+        plus that of the last frame. If 0, only the first and last frames get a
+        Hessian.
+    initial_hessian
+        A Hessian of `atoms` in eV/Å^2 that is given to Sella's IRC as its
+        `hessian_function`, which the IRC only calls once at `atoms`, so that it
+        does not have to estimate the initial Hessian by iterative diagonalization.
     **calc_kwargs
         Custom kwargs for the NewtonNet calculator. Set a value to
         `quacc.Remove` to remove a pre-existing key entirely. For a list of available
@@ -179,6 +226,10 @@ def irc_job(
         "optimizer_kwargs": {"dx": 0.1, "eta": 1e-4, "gamma": 0.4, "keep_going": True},
         "run_kwargs": {"direction": direction},
     }
+    if initial_hessian is not None:
+        opt_defaults["optimizer_kwargs"]["hessian_function"] = get_hessian_function(
+            atoms, initial_hessian
+        )
 
     calc_flags = recursive_dict_merge(calc_defaults, calc_kwargs)
     opt_flags = recursive_dict_merge(opt_defaults, opt_params)
@@ -193,7 +244,9 @@ def irc_job(
             Summarize(
                 additional_fields={"name": f"NewtonNet IRC: {direction}"}
                 | (additional_fields or {})
-            ).opt(dyn)
+            ).opt(dyn),
+            calc,
+            hessian_every_n=trajectory_hessian_every_n,
         )
 
     # Run frequency job
@@ -207,6 +260,53 @@ def irc_job(
     return opt_irc_summary
 
 
+@flow
+def both_directions_irc_flow(
+    atoms: Atoms,
+    initial_hessian: list[list[float]] | NDArray | None = None,
+    job_params: dict[str, dict[str, Any]] | None = None,
+    job_decorators: dict[str, Callable | None] | None = None,
+) -> IRCPathSchema:
+    """
+    Workflow consisting of:
+
+    1. Forward and reverse IRCs from the same transition state, which can run
+    concurrently
+        - name: "irc_job"
+        - job: [quacc.recipes.newtonnet.ts.irc_job][]
+
+    2. Joining of both branches into a single reaction path
+        - job: [quacc.recipes.common.irc.join_irc_paths][]
+
+    Parameters
+    ----------
+    atoms
+        Atoms object of the transition state.
+    initial_hessian
+        A Hessian of `atoms` in eV/Å^2 that is shared by both IRC branches.
+    job_params
+        Custom parameters to pass to each Job in the Flow. This is a dictionary where
+        the keys are the names of the jobs and the values are dictionaries of parameters.
+    job_decorators
+        Custom decorators to apply to each Job in the Flow. This is a dictionary where
+        the keys are the names of the jobs and the values are decorators.
+
+    Returns
+    -------
+    IRCPathSchema
+        Dictionary of results. See the type-hint for the data structure.
+    """
+    irc_job_ = customize_funcs(
+        "irc_job",
+        irc_job,
+        param_defaults={"irc_job": {"initial_hessian": initial_hessian}},
+        param_swaps=job_params,
+        decorators=job_decorators,
+    )
+
+    return irc_path_subflow(atoms, irc_job_)
+
+
 @job
 @requires(
     has_newtonnet, "NewtonNet must be installed. Refer to the quacc documentation."
@@ -272,6 +372,56 @@ def quasi_irc_job(
     return relax_summary
 
 
+@flow
+def both_directions_quasi_irc_flow(
+    atoms: Atoms,
+    initial_hessian: list[list[float]] | NDArray | None = None,
+    job_params: dict[str, dict[str, Any]] | None = None,
+    job_decorators: dict[str, Callable | None] | None = None,
+) -> IRCPathSchema:
+    """
+    Workflow consisting of:
+
+    1. Forward and reverse quasi-IRCs from the same transition state, which can run
+    concurrently
+        - name: "quasi_irc_job"
+        - job: [quacc.recipes.newtonnet.ts.quasi_irc_job][]
+
+    2. Joining of both branches into a single reaction path
+        - job: [quacc.recipes.common.irc.join_irc_paths][]
+
+    Parameters
+    ----------
+    atoms
+        Atoms object of the transition state.
+    initial_hessian
+        A Hessian of `atoms` in eV/Å^2 that is shared by the initial IRC steps of
+        both branches.
+    job_params
+        Custom parameters to pass to each Job in the Flow. This is a dictionary where
+        the keys are the names of the jobs and the values are dictionaries of parameters.
+    job_decorators
+        Custom decorators to apply to each Job in the Flow. This is a dictionary where
+        the keys are the names of the jobs and the values are decorators.
+
+    Returns
+    -------
+    IRCPathSchema
+        Dictionary of results. See the type-hint for the data structure.
+    """
+    quasi_irc_job_ = customize_funcs(
+        "quasi_irc_job",
+        quasi_irc_job,
+        param_defaults={
+            "quasi_irc_job": {"irc_job_kwargs": {"initial_hessian": initial_hessian}}
+        },
+        param_swaps=job_params,
+        decorators=job_decorators,
+    )
+
+    return irc_path_subflow(atoms, quasi_irc_job_)
+
+
 @job
 @requires(
     has_newtonnet, "NewtonNet must be installed. Refer to the quacc documentation."
@@ -436,16 +586,20 @@ def geodesic_job(
     relax_summary_r = strip_decorator(relax_job)(reactant_atoms, **relax_job_kwargs)
     relax_summary_p = strip_decorator(relax_job)(product_atoms, **relax_job_kwargs)
 
-    images = geodesic_interpolate_wrapper(
-        relax_summary_r["atoms"].copy(),
-        relax_summary_p["atoms"].copy(),
+    images = geodesic_interpolate_batch(
+        [(relax_summary_r["atoms"].copy(), relax_summary_p["atoms"].copy())],
         **geodesic_interpolate_flags,
-    )
+    )[0]
 
-    potential_energies = []
+    # Evaluate all images with one calculator
+    calc = NewtonNet(**calc_flags)
     for image in images:
-        image.calc = NewtonNet(**calc_flags)
-        potential_energies.append(image.get_potential_energy())
+        image.calc = SinglePointCalculator(
+            image,
+            energy=calc.get_potential_energy(image),
+            forces=calc.get_forces(image),
+        )
+    potential_energies = [image.get_potential_energy() for image in images]
 
     ts_index = np.argmax(potential_energies)
     ts_atoms = images[ts_index]
@@ -458,36 +612,121 @@ def geodesic_job(
     }
 
 
-def _get_hessian(atoms: Atoms, **calc_kwargs) -> NDArray:
+class _HessianProvider:
+    """
+    Provide NewtonNet Hessians to Sella's `hessian_function`. The model is loaded
+    once and exact Hessians are cached by geometry. Between exact Hessians, the last
+    Hessian is updated from the change in the gradient with Bofill's quasi-Newton
+    update, which (unlike BFGS) does not force the Hessian to be positive definite
+    and is therefore suited to transition states.
     """
-    Calculate and retrieve the Hessian matrix for the given molecular configuration.
 
-    This function takes an ASE Atoms object representing a molecular
-    configuration and uses the NewtonNet machine learning calculator to
-    calculate the Hessian matrix. The calculated Hessian matrix is then
-    returned.
+    def __init__(self, exact_every_n: int = 1, **calc_kwargs) -> None:
+        """
+        Initialize the Hessian provider.
+
+        Parameters
+        ----------
+        exact_every_n
+            Calculate an exact Hessian on the first call and on every Nth call after
+            it. The calls in between get a quasi-Newton Hessian.
+        **calc_kwargs
+            Dictionary of custom kwargs for the NewtonNet calculator. Set a value to
+            `quacc.Remove` to remove a pre-existing key entirely. For a list of
+            available keys, refer to the `newtonnet.utils.ase_interface.MLAseCalculator`
+            calculator.
+
+        Returns
+        -------
+        None
+        """
+        if exact_every_n < 1:
+            raise ValueError(f"exact_every_n must be at least 1, not {exact_every_n}.")
+        settings = get_settings()
+        calc_defaults = {
+            "model_path": settings.NEWTONNET_MODEL_PATH,
+            "settings_path": settings.NEWTONNET_CONFIG_PATH,
+            "hess_method": "autograd",
+        }
+        self.calc = NewtonNet(**recursive_dict_merge(calc_defaults, calc_kwargs))
+        self.exact_every_n = exact_every_n
+        self.n_calls = 0
+        self._cache: dict[str, tuple[NDArray, NDArray]] = {}
+        self._last: tuple[NDArray, NDArray, NDArray] | None = None
+
+    def __call__(self, atoms: Atoms, exact: bool = False) -> NDArray:
+        """
+        Get the Hessian of `atoms`.
+
+        Parameters
+        ----------
+        atoms
+            The ASE Atoms object representing the molecular configuration.
+        exact
+            Whether to calculate an exact Hessian regardless of the call count.
+
+        Returns
+        -------
+        NDArray
+            The Hessian matrix as a 2D array.
+        """
+        key = get_atoms_id(atoms)
+        if not exact:
+            self.n_calls += 1
+            exact = self._last is None or (self.n_calls - 1) % self.exact_every_n == 0
+
+        if key in self._cache:
+            gradient, hessian = self._cache[key]
+        elif exact:
+            self.calc.calculate(atoms.copy())
+            gradient = -self.calc.results["forces"].flatten()
+            hessian = self.calc.results["hessian"].reshape((-1, 3 * len(atoms)))
+            self._cache[key] = (gradient, hessian)
+        else:
+            self.calc.calculate(atoms.copy(), properties=["energy", "forces"])
+            gradient = -self.calc.results["forces"].flatten()
+            hessian = _bofill_update(
+                self._last[2],
+                atoms.positions.flatten() - self._last[0],
+                gradient - self._last[1],
+            )
+
+        self._last = (atoms.positions.flatten(), gradient, hessian)
+        return hessian.copy()
+
+
+def _bofill_update(
+    hessian: NDArray, displacement: NDArray, gradient_change: NDArray
+) -> NDArray:
+    """
+    Update a Hessian with Bofill's quasi-Newton formula, a mix of the symmetric
+    rank-one (SR1) and Powell-symmetric-Broyden (PSB) updates.
 
     Parameters
     ----------
-    atoms
-        The ASE Atoms object representing the molecular configuration.
-    **calc_kwargs
-        Dictionary of custom kwargs for the NewtonNet calculator. Set a value to
-        `quacc.Remove` to remove a pre-existing key entirely. For a list of available
-        keys, refer to the `newtonnet.utils.ase_interface.MLAseCalculator` calculator.
+    hessian
+        The Hessian at the previous geometry.
+    displacement
+        The change in the flattened positions since the previous geometry.
+    gradient_change
+        The change in the flattened gradient since the previous geometry.
 
     Returns
     -------
     NDArray
-        The calculated Hessian matrix, reshaped into a 2D array.
+        The updated Hessian.
     """
-    settings = get_settings()
-    calc_defaults = {
-        "model_path": settings.NEWTONNET_MODEL_PATH,
-        "settings_path": settings.NEWTONNET_CONFIG_PATH,
-        "hess_method": "autograd",
-    }
-    calc_flags = recursive_dict_merge(calc_defaults, calc_kwargs)
-    calc = NewtonNet(**calc_flags)
-    calc.calculate(atoms)
-    return calc.results["hessian"].reshape((-1, 3 * len(atoms)))
+    residual = gradient_change - hessian @ displacement
+    ss = displacement @ displacement
+    rs = residual @ displacement
+    rr = residual @ residual
+    if ss < 1e-12 or rr < 1e-24:
+        return hessian
+
+    sr1 = np.outer(residual, residual) / rs if abs(rs) > 1e-12 else 0.0
+    psb = (
+        np.outer(residual, displacement) + np.outer(displacement, residual)
+    ) / ss - rs * np.outer(displacement, displacement) / ss**2
+    phi = rs**2 / (rr * ss)
+
+    return hessian + phi * sr1 + (1 - phi) * psb
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from ase.calculators.orca import ORCA, OrcaProfile, OrcaTemplate
@@ -21,6 +22,7 @@ if TYPE_CHECKING:
 
 _LABEL = OrcaTemplate()._label  # skipcq: PYL-W0212
 GEOM_FILE = f"{_LABEL}.xyz"
+GBW_FILE = f"{_LABEL}.gbw"
 
 
 def run_and_summarize(
@@ -33,6 +35,7 @@ def run_and_summarize(
     block_swaps: list[str] | None = None,
     additional_fields: dict[str, Any] | None = None,
     copy_files: SourceDirectory | dict[SourceDirectory, Filenames] | None = None,
+    prev_dir: SourceDirectory | None = None,
     **calc_kwargs,
 ) -> RunSchema:
     """
@@ -60,6 +63,9 @@ def run_and_summarize(
         Any additional fields to supply to the summarizer.
     copy_files
         Files to copy (and decompress) from source to the runtime directory.
+    prev_dir
+        The directory of a prior ORCA job whose `orca.gbw` is copied in as the
+        initial guess.
     **calc_kwargs
         Any other keyword arguments to pass to the `ORCA` calculator.
 
@@ -78,9 +84,9 @@ def run_and_summarize(
         **calc_kwargs,
     )
 
-    final_atoms = Runner(atoms, calc, copy_files=copy_files).run_calc(
-        geom_file=GEOM_FILE
-    )
+    final_atoms = Runner(
+        atoms, calc, copy_files=_add_orbitals(copy_files, prev_dir)
+    ).run_calc(geom_file=GEOM_FILE)
 
     return Summarize(
         charge_and_multiplicity=(charge, spin_multiplicity),
@@ -100,6 +106,7 @@ def run_and_summarize_opt(
     opt_params: OptParams | None = None,
     additional_fields: dict[str, Any] | None = None,
     copy_files: SourceDirectory | dict[SourceDirectory, Filenames] | None = None,
+    prev_dir: SourceDirectory | None = None,
     **calc_kwargs,
 ) -> OptSchema:
     """
@@ -131,6 +138,9 @@ def run_and_summarize_opt(
         Any additional fields to supply to the summarizer.
     copy_files
         Files to copy (and decompress) from source to the runtime directory.
+    prev_dir
+        The directory of a prior ORCA job whose `orca.gbw` is copied in as the
+        initial guess.
     **calc_kwargs
         Any other keyword arguments to pass to the `ORCA` calculator.
 
@@ -150,7 +160,9 @@ def run_and_summarize_opt(
     )
 
     opt_flags = recursive_dict_merge(opt_defaults, opt_params)
-    dyn = Runner(atoms, calc, copy_files=copy_files).run_opt(**opt_flags)
+    dyn = Runner(atoms, calc, copy_files=_add_orbitals(copy_files, prev_dir)).run_opt(
+        **opt_flags
+    )
     return Summarize(
         charge_and_multiplicity=(charge, spin_multiplicity),
         additional_fields=additional_fields,
@@ -167,7 +179,10 @@ def prep_calculator(
     **calc_kwargs,
 ) -> ORCA:
     """
-    Prepare the ORCA calculator.
+    Prepare the ORCA calculator. By default (`AutoStart`), ORCA starts the SCF from
+    the orbitals in an `orca.gbw` file in the run directory when there is one, which
+    is the case for all but the first step of an ASE optimization and for jobs that
+    stage the `orca.gbw` of a prior job via `prev_dir`.
 
     Parameters
     ----------
@@ -209,3 +224,35 @@ def prep_calculator(
         orcablocks=orcablocks,
         **calc_kwargs,
     )
+
+
+def _add_orbitals(
+    copy_files: SourceDirectory | dict[SourceDirectory, Filenames] | None,
+    prev_dir: SourceDirectory | None,
+) -> SourceDirectory | dict[SourceDirectory, Filenames] | None:
+    """
+    Add the `orca.gbw` file of a prior job to the files to copy.
+
+    Parameters
+    ----------
+    copy_files
+        Files to copy (and decompress) from source to the runtime directory.
+    prev_dir
+        The directory of the prior job.
+
+    Returns
+    -------
+    SourceDirectory | dict[SourceDirectory, Filenames] | None
+        The files to copy, including the `orca.gbw` file of the prior job.
+    """
+    if prev_dir is None:
+        return copy_files
+    if isinstance(copy_files, str | Path):
+        copy_files = {copy_files: "*"}
+    copy_files = dict(copy_files or {})
+
+    filenames = copy_files.get(prev_dir, [])
+    if isinstance(filenames, str | Path):
+        filenames = [filenames]
+    copy_files[prev_dir] = [*filenames, f"{GBW_FILE}*"]
+    return copy_files
@@ -6,17 +6,27 @@ from typing import TYPE_CHECKING
 
 import psutil
 
-from quacc import job
+from quacc import flow, job
 from quacc.atoms.core import perturb
+from quacc.recipes.common.irc import irc_path_subflow
 from quacc.recipes.orca._base import run_and_summarize, run_and_summarize_opt
+from quacc.wflow_tools.customizers import customize_funcs
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from typing import Any, Literal
 
     from ase.atoms import Atoms
     from numpy.typing import NDArray
 
-    from quacc.types import Filenames, OptParams, OptSchema, RunSchema, SourceDirectory
+    from quacc.types import (
+        Filenames,
+        IRCPathSchema,
+        OptParams,
+        OptSchema,
+        RunSchema,
+        SourceDirectory,
+    )
 
 
 @job
@@ -29,6 +39,7 @@ def static_job(
     orcasimpleinput: list[str] | None = None,
     orcablocks: list[str] | None = None,
     nprocs: int | Literal["max"] = "max",
+    prev_dir: SourceDirectory | None = None,
     copy_files: SourceDirectory | dict[SourceDirectory, Filenames] | None = None,
     additional_fields: dict[str, Any] | None = None,
 ) -> RunSchema:
@@ -57,6 +68,9 @@ def static_job(
         [ase.calculators.orca.ORCA][] calculator for details on `orcablocks`.
     nprocs
         Number of processors to use. Defaults to the number of physical cores.
+    prev_dir
+        The `dir_name` of a prior ORCA job on the same or a similar structure. Its
+        `orca.gbw` is copied in, and ORCA starts the SCF from its orbitals.
     copy_files
         Files to copy (and decompress) from source to the runtime directory.
     additional_fields
@@ -82,6 +96,7 @@ def static_job(
         block_swaps=orcablocks,
         additional_fields=additional_fields,
         copy_files=copy_files,
+        prev_dir=prev_dir,
     )
 
 
@@ -96,6 +111,7 @@ def relax_job(
     orcasimpleinput: list[str] | None = None,
     orcablocks: list[str] | None = None,
     nprocs: int | Literal["max"] = "max",
+    prev_dir: SourceDirectory | None = None,
     copy_files: SourceDirectory | dict[SourceDirectory, Filenames] | None = None,
     additional_fields: dict[str, Any] | None = None,
 ) -> RunSchema:
@@ -126,6 +142,9 @@ def relax_job(
         [ase.calculators.orca.ORCA][] calculator for details on `orcablocks`.
     nprocs
         Number of processors to use. Defaults to the number of physical cores.
+    prev_dir
+        The `dir_name` of a prior ORCA job on the same or a similar structure. Its
+        `orca.gbw` is copied in, and ORCA starts the SCF from its orbitals.
     copy_files
         Files to copy (and decompress) from source to the runtime directory.
     additional_fields
@@ -155,6 +174,7 @@ def relax_job(
         block_swaps=orcablocks,
         additional_fields=additional_fields,
         copy_files=copy_files,
+        prev_dir=prev_dir,
     )
 
 
@@ -169,6 +189,7 @@ def freq_job(
     orcasimpleinput: list[str] | None = None,
     orcablocks: list[str] | None = None,
     nprocs: int | Literal["max"] = "max",
+    prev_dir: SourceDirectory | None = None,
     copy_files: SourceDirectory | dict[SourceDirectory, Filenames] | None = None,
     additional_fields: dict[str, Any] | None = None,
 ) -> RunSchema:
@@ -199,6 +220,9 @@ def freq_job(
         [ase.calculators.orca.ORCA][] calculator for details on `orcablocks`.
     nprocs
         Number of processors to use. Defaults to the number of physical cores.
+    prev_dir
+        The `dir_name` of a prior ORCA job on the same or a similar structure. Its
+        `orca.gbw` is copied in, and ORCA starts the SCF from its orbitals.
     copy_files
         Files to copy (and decompress) from source to the runtime directory.
     additional_fields
@@ -224,6 +248,7 @@ def freq_job(
         additional_fields={"name": "ORCA Vibrational Frequency Analysis"}
         | (additional_fields or {}),
         copy_files=copy_files,
+        prev_dir=prev_dir,
     )
 
 
@@ -238,6 +263,7 @@ def ase_relax_job(
     orcablocks: list[str] | None = None,
     opt_params: OptParams | None = None,
     nprocs: int | Literal["max"] = "max",
+    prev_dir: SourceDirectory | None = None,
     copy_files: SourceDirectory | dict[SourceDirectory, Filenames] | None = None,
     additional_fields: dict[str, Any] | None = None,
 ) -> OptSchema:
@@ -268,6 +294,9 @@ def ase_relax_job(
         Dictionary of optimization parameters.
     nprocs
         Number of processors to use. Defaults to the number of physical cores.
+    prev_dir
+        The `dir_name` of a prior ORCA job on the same or a similar structure. Its
+        `orca.gbw` is copied in, and ORCA starts the SCF from its orbitals.
     copy_files
         Files to copy (and decompress) from source to the runtime directory.
     additional_fields
@@ -293,6 +322,7 @@ def ase_relax_job(
         opt_params=opt_params,
         additional_fields={"name": "ORCA ASE Relax"} | (additional_fields or {}),
         copy_files=copy_files,
+        prev_dir=prev_dir,
     )
 
 
@@ -310,6 +340,7 @@ def ase_quasi_irc_job(
     orcablocks: list[str] | None = None,
     opt_params: OptParams | None = None,
     nprocs: int | Literal["max"] = "max",
+    prev_dir: SourceDirectory | None = None,
     copy_files: SourceDirectory | dict[SourceDirectory, Filenames] | None = None,
     additional_fields: dict[str, Any] | None = None,
 ) -> OptSchema:
@@ -350,6 +381,9 @@ def ase_quasi_irc_job(
         Dictionary of optimization parameters.
     nprocs
         Number of processors to use. Defaults to the number of physical cores.
+    prev_dir
+        The `dir_name` of a prior ORCA job on the same or a similar structure. Its
+        `orca.gbw` is copied in, and ORCA starts the SCF from its orbitals.
     copy_files
         Files to copy (and decompress) from source to the runtime directory.
     additional_fields
@@ -377,4 +411,52 @@ def ase_quasi_irc_job(
         opt_params=opt_params,
         additional_fields={"name": "ORCA ASE Quasi-IRC"} | (additional_fields or {}),
         copy_files=copy_files,
+        prev_dir=prev_dir,
+    )
+
+
+@flow
+def both_directions_quasi_irc_flow(
+    atoms: Atoms,
+    mode: list[list[float]] | NDArray,
+    job_params: dict[str, dict[str, Any]] | None = None,
+    job_decorators: dict[str, Callable | None] | None = None,
+) -> IRCPathSchema:
+    """
+    Workflow consisting of:
+
+    1. Forward and reverse quasi-IRCs along the same transition mode, which can run
+    concurrently
+        - name: "ase_quasi_irc_job"
+        - job: [quacc.recipes.orca.core.ase_quasi_irc_job][]
+
+    2. Joining of both branches into a single reaction path
+        - job: [quacc.recipes.common.irc.join_irc_paths][]
+
+    Parameters
+    ----------
+    atoms
+        Atoms object of the transition state.
+    mode
+        Transition mode. This should be an Nx3 matrix, where N is the number of atoms in `atoms`.
+    job_params
+        Custom parameters to pass to each Job in the Flow. This is a dictionary where
+        the keys are the names of the jobs and the values are dictionaries of parameters.
+    job_decorators
+        Custom decorators to apply to each Job in the Flow. This is a dictionary where
+        the keys are the names of the jobs and the values are decorators.
+
+    Returns
+    -------
+    IRCPathSchema
+        Dictionary of results. See the type-hint for the data structure.
+    """
+    ase_quasi_irc_job_ = customize_funcs(
+        "ase_quasi_irc_job",
+        ase_quasi_irc_job,
+        param_defaults={"ase_quasi_irc_job": {"mode": mode}},
+        param_swaps=job_params,
+        decorators=job_decorators,
     )
+
+    return irc_path_subflow(atoms, ase_quasi_irc_job_)
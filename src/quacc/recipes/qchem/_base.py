@@ -110,10 +110,17 @@ def run_and_summarize_opt(
     opt_flags = recursive_dict_merge(opt_defaults, opt_params)
 
     calc = QChem(
-        atoms, charge=charge, spin_multiplicity=spin_multiplicity, **calc_flags
+        atoms,
+        charge=charge,
+        spin_multiplicity=spin_multiplicity,
+        parse_taskdoc=False,
+        **calc_flags,
     )
     dyn = Runner(atoms, calc, copy_files=copy_files).run_opt(**opt_flags)
 
+    # Only the last step needs the full TaskDoc
+    calc.read_taskdoc()
+
     return Summarize(
         charge_and_multiplicity=(charge, spin_multiplicity),
         additional_fields=additional_fields,
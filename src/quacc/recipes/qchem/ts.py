@@ -7,23 +7,35 @@ from typing import TYPE_CHECKING
 
 from monty.dev import requires
 
-from quacc import job
+from quacc import flow, job
 from quacc.atoms.core import perturb
+from quacc.atoms.ts import get_cartesian_hessian, get_hessian_function
+from quacc.recipes.common.irc import irc_path_subflow
+from quacc.recipes.common.neb import neb_subflow
 from quacc.recipes.qchem._base import run_and_summarize_opt
-from quacc.recipes.qchem.core import _BASE_SET
+from quacc.recipes.qchem.core import _BASE_SET, static_job
 from quacc.utils.dicts import recursive_dict_merge
+from quacc.wflow_tools.customizers import customize_funcs
 
 has_sella = bool(find_spec("sella"))
 if has_sella:
     from sella import IRC, Sella
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from typing import Any, Literal
 
     from ase.atoms import Atoms
     from numpy.typing import NDArray
 
-    from quacc.types import Filenames, OptParams, OptSchema, SourceDirectory
+    from quacc.types import (
+        DistributedNebSchema,
+        Filenames,
+        IRCPathSchema,
+        OptParams,
+        OptSchema,
+        SourceDirectory,
+    )
 
 
 @job
@@ -34,6 +46,7 @@ def ts_job(
     spin_multiplicity: int = 1,
     method: str = "wb97mv",
     basis: str = "def2-svpd",
+    initial_hessian: list[list[float]] | NDArray | None = None,
     opt_params: OptParams | None = None,
     copy_files: SourceDirectory | dict[SourceDirectory, Filenames] | None = None,
     additional_fields: dict[str, Any] | None = None,
@@ -55,11 +68,20 @@ def ts_job(
         method.
     basis
         Basis set.
+    initial_hessian
+        An exact Hessian of `atoms` in eV/Å^2, e.g. `results["hessian"]` of a prior
+        [quacc.recipes.qchem.core.freq_job][]. It is given to Sella as its initial
+        Hessian (`H0`), so that Sella does not have to estimate it by iterative
+        diagonalization. Since it is a Cartesian Hessian, Sella then optimizes in
+        Cartesian rather than internal coordinates.
     opt_params
         Dictionary of custom kwargs for the optimization process. For a list
         of available keys, refer to [quacc.runners.ase.Runner.run_opt][].
     copy_files
-        Files to copy (and decompress) from source to the runtime directory.
+        Files to copy (and decompress) from source to the runtime directory. The
+        orbital coefficients of a prior job on a similar geometry can be used as the
+        initial SCF guess by copying its `53.0` file, e.g.
+        `copy_files={prior_results["dir_name"]: "53.0*"}`.
     **calc_kwargs
         Custom kwargs for the calculator. Set a value to `quacc.Remove` to remove
         a pre-existing key entirely. See [quacc.calculators.qchem.qchem.QChem][] for more
@@ -75,6 +97,11 @@ def ts_job(
         _BASE_SET, {"rem": {"job_type": "force", "method": method, "basis": basis}}
     )
     opt_defaults = {"optimizer": Sella, "optimizer_kwargs": {"order": 1}}
+    if initial_hessian is not None:
+        opt_defaults["optimizer_kwargs"] |= {
+            "H0": get_cartesian_hessian(atoms, initial_hessian),
+            "internal": False,
+        }
 
     if opt_params and opt_params.get("optimizer", Sella) is not Sella:
         raise ValueError("Only Sella should be used for TS optimization.")
@@ -101,6 +128,7 @@ def irc_job(
     direction: Literal["forward", "reverse"] = "forward",
     method: str = "wb97mv",
     basis: str = "def2-svpd",
+    initial_hessian: list[list[float]] | NDArray | None = None,
     opt_params: OptParams | None = None,
     copy_files: SourceDirectory | dict[SourceDirectory, Filenames] | None = None,
     additional_fields: dict[str, Any] | None = None,
@@ -124,11 +152,19 @@ def irc_job(
         method.
     basis
         Basis set.
+    initial_hessian
+        An exact Hessian of `atoms` in eV/Å^2, e.g. `results["hessian"]` of a prior
+        [quacc.recipes.qchem.core.freq_job][]. It is given to Sella's IRC as its
+        `hessian_function`, which the IRC only calls once at `atoms`, so that it
+        does not have to estimate the initial Hessian by iterative diagonalization.
     opt_params
         Dictionary of custom kwargs for the optimization process. For a list
         of available keys, refer to [quacc.runners.ase.Runner.run_opt][].
     copy_files
-        Files to copy (and decompress) from source to the runtime directory.
+        Files to copy (and decompress) from source to the runtime directory. The
+        orbital coefficients of a prior job on a similar geometry can be used as the
+        initial SCF guess by copying its `53.0` file, e.g.
+        `copy_files={prior_results["dir_name"]: "53.0*"}`.
     additional_fields
         Additional fields to add to the results dictionary.
     **calc_kwargs
@@ -149,6 +185,10 @@ def irc_job(
         "optimizer_kwargs": {"keep_going": True},
         "run_kwargs": {"direction": direction},
     }
+    if initial_hessian is not None:
+        opt_defaults["optimizer_kwargs"]["hessian_function"] = get_hessian_function(
+            atoms, initial_hessian
+        )
     if opt_params and opt_params.get("optimizer", IRC) is not IRC:
         raise ValueError("Only Sella's IRC should be used for IRC optimization.")
 
@@ -176,6 +216,7 @@ def quasi_irc_job(
     spin_multiplicity: int = 1,
     method: str = "wb97mv",
     basis: str = "def2-svpd",
+    initial_hessian: list[list[float]] | NDArray | None = None,
     opt_params: OptParams | None = None,
     copy_files: SourceDirectory | dict[SourceDirectory, Filenames] | None = None,
     additional_fields: dict[str, Any] | None = None,
@@ -207,11 +248,20 @@ def quasi_irc_job(
         method.
     basis
         Basis set.
+    initial_hessian
+        An exact Hessian of `atoms` in eV/Å^2, e.g. `results["hessian"]` of a prior
+        [quacc.recipes.qchem.core.freq_job][]. It is given to Sella as the initial
+        Hessian (`H0`) of the relaxation of the perturbed structure, which then runs
+        in Cartesian rather than internal coordinates. This requires Sella to be
+        the optimizer.
     opt_params
         Dictionary of custom kwargs for the optimization process. For a list
         of available keys, refer to [quacc.runners.ase.Runner.run_opt][].
     copy_files
-        Files to copy (and decompress) from source to the runtime directory.
+        Files to copy (and decompress) from source to the runtime directory. The
+        orbital coefficients of a prior job on a similar geometry can be used as the
+        initial SCF guess by copying its `53.0` file, e.g.
+        `copy_files={prior_results["dir_name"]: "53.0*"}`.
     additional_fields
         Additional fields to add to the results dictionary.
     **calc_kwargs
@@ -229,6 +279,14 @@ def quasi_irc_job(
         _BASE_SET, {"rem": {"job_type": "force", "method": method, "basis": basis}}
     )
     opt_defaults = {"optimizer": Sella} if has_sella else {}
+    if initial_hessian is not None:
+        optimizer = (opt_params or {}).get("optimizer", opt_defaults.get("optimizer"))
+        if getattr(optimizer, "__name__", None) != "Sella":
+            raise ValueError("`initial_hessian` can only be used with Sella.")
+        opt_defaults["optimizer_kwargs"] = {
+            "H0": get_cartesian_hessian(atoms, initial_hessian),
+            "internal": False,
+        }
 
     scale = perturb_magnitude if direction == "forward" else perturb_magnitude * -1
 
@@ -243,3 +301,152 @@ def quasi_irc_job(
         additional_fields={"name": "Q-Chem Quasi-IRC"} | (additional_fields or {}),
         copy_files=copy_files,
     )
+
+
+@flow
+def both_directions_irc_flow(
+    atoms: Atoms,
+    initial_hessian: list[list[float]] | NDArray | None = None,
+    job_params: dict[str, dict[str, Any]] | None = None,
+    job_decorators: dict[str, Callable | None] | None = None,
+) -> IRCPathSchema:
+    """
+    Workflow consisting of:
+
+    1. Forward and reverse IRCs from the same transition state, which can run
+    concurrently
+        - name: "irc_job"
+        - job: [quacc.recipes.qchem.ts.irc_job][]
+
+    2. Joining of both branches into a single reaction path
+        - job: [quacc.recipes.common.irc.join_irc_paths][]
+
+    Parameters
+    ----------
+    atoms
+        Atoms object of the transition state.
+    initial_hessian
+        A Hessian of `atoms` in eV/Å^2 that is shared by both IRC branches, e.g.
+        `results["hessian"]` of a prior [quacc.recipes.qchem.core.freq_job][].
+    job_params
+        Custom parameters to pass to each Job in the Flow. This is a dictionary where
+        the keys are the names of the jobs and the values are dictionaries of parameters.
+    job_decorators
+        Custom decorators to apply to each Job in the Flow. This is a dictionary where
+        the keys are the names of the jobs and the values are decorators.
+
+    Returns
+    -------
+    IRCPathSchema
+        Dictionary of results. See the type-hint for the data structure.
+    """
+    irc_job_ = customize_funcs(
+        "irc_job",
+        irc_job,
+        param_defaults={"irc_job": {"initial_hessian": initial_hessian}},
+        param_swaps=job_params,
+        decorators=job_decorators,
+    )
+
+    return irc_path_subflow(atoms, irc_job_)
+
+
+@flow
+def both_directions_quasi_irc_flow(
+    atoms: Atoms,
+    mode: list[list[float]] | NDArray,
+    initial_hessian: list[list[float]] | NDArray | None = None,
+    job_params: dict[str, dict[str, Any]] | None = None,
+    job_decorators: dict[str, Callable | None] | None = None,
+) -> IRCPathSchema:
+    """
+    Workflow consisting of:
+
+    1. Forward and reverse quasi-IRCs along the same transition mode, which can run
+    concurrently
+        - name: "quasi_irc_job"
+        - job: [quacc.recipes.qchem.ts.quasi_irc_job][]
+
+    2. Joining of both branches into a single reaction path
+        - job: [quacc.recipes.common.irc.join_irc_paths][]
+
+    Parameters
+    ----------
+    atoms
+        Atoms object of the transition state.
+    mode
+        Transition mode. This should be an Nx3 matrix, where N is the number of atoms in `atoms`.
+    initial_hessian
+        A Hessian of `atoms` in eV/Å^2 that is shared by the relaxations of both
+        branches, e.g. `results["hessian"]` of a prior
+        [quacc.recipes.qchem.core.freq_job][].
+    job_params
+        Custom parameters to pass to each Job in the Flow. This is a dictionary where
+        the keys are the names of the jobs and the values are dictionaries of parameters.
+    job_decorators
+        Custom decorators to apply to each Job in the Flow. This is a dictionary where
+        the keys are the names of the jobs and the values are decorators.
+
+    Returns
+    -------
+    IRCPathSchema
+        Dictionary of results. See the type-hint for the data structure.
+    """
+    quasi_irc_job_ = customize_funcs(
+        "quasi_irc_job",
+        quasi_irc_job,
+        param_defaults={
+            "quasi_irc_job": {"mode": mode, "initial_hessian": initial_hessian}
+        },
+        param_swaps=job_params,
+        decorators=job_decorators,
+    )
+
+    return irc_path_subflow(atoms, quasi_irc_job_)
+
+
+@flow
+def neb_flow(
+    images: list[Atoms],
+    neb_subflow_kwargs: dict[str, Any] | None = None,
+    job_params: dict[str, dict[str, Any]] | None = None,
+    job_decorators: dict[str, Callable | None] | None = None,
+) -> DistributedNebSchema:
+    """
+    Workflow consisting of:
+
+    1. An NEB with one force calculation per image and iteration, which can run
+    concurrently, adaptive image insertion, image freezing, and a final climbing
+    image
+        - name: "static_job"
+        - job: [quacc.recipes.qchem.core.static_job][]
+
+    Parameters
+    ----------
+    images
+        The initial images of the band, including the two endpoints.
+    neb_subflow_kwargs
+        Additional keyword arguments to pass to
+        [quacc.recipes.common.neb.neb_subflow][]. Unless set, its `batch_decorator`
+        is the decorator of the "static_job".
+    job_params
+        Custom parameters to pass to each Job in the Flow. This is a dictionary where
+        the keys are the names of the jobs and the values are dictionaries of parameters.
+    job_decorators
+        Custom decorators to apply to each Job in the Flow. This is a dictionary where
+        the keys are the names of the jobs and the values are decorators.
+
+    Returns
+    -------
+    DistributedNebSchema
+        Dictionary of results. See the type-hint for the data structure.
+    """
+    static_job_ = customize_funcs(
+        "static_job", static_job, param_swaps=job_params, decorators=job_decorators
+    )
+    job_decorators = job_decorators or {}
+    neb_subflow_kwargs = {
+        "batch_decorator": job_decorators.get("static_job") or job_decorators.get("all")
+    } | (neb_subflow_kwargs or {})
+
+    return neb_subflow(images, static_job_, **neb_subflow_kwargs)
@@ -33,6 +33,7 @@ def run_and_summarize(
     report_mp_corrections: bool = False,
     additional_fields: dict[str, Any] | None = None,
     copy_files: SourceDirectory | dict[SourceDirectory, Filenames] | None = None,
+    allow_continuation: bool = False,
 ) -> VaspSchema:
     """
     Base job function for VASP recipes.
@@ -55,6 +56,9 @@ def run_and_summarize(
         Additional fields to supply to the summarizer.
     copy_files
         Files to copy (and decompress) from source to the runtime directory.
+    allow_continuation
+        Whether to return the results of a run that was stopped early by the
+        wall-time handler or a STOPCAR so that it can be continued.
 
     Returns
     -------
@@ -67,7 +71,9 @@ def run_and_summarize(
     final_atoms = Runner(atoms, calc, copy_files=copy_files).run_calc()
 
     return VaspSummarize(
-        report_mp_corrections=report_mp_corrections, additional_fields=additional_fields
+        report_mp_corrections=report_mp_corrections,
+        allow_continuation=allow_continuation,
+        additional_fields=additional_fields,
     ).run(final_atoms)
 
 
@@ -115,6 +121,11 @@ def run_and_summarize_opt(
     """
     calc_flags = recursive_dict_merge(calc_defaults, calc_swaps)
     opt_flags = recursive_dict_merge(opt_defaults, opt_params)
+    if calc_flags.get("use_interactive") and opt_flags.get("relax_cell"):
+        raise ValueError(
+            "VASP's interactive mode cannot be used with `relax_cell=True`, since "
+            "VASP has to be restarted whenever the cell changes."
+        )
 
     calc = Vasp(atoms, preset=preset, **calc_flags)
     dyn = Runner(atoms, calc, copy_files=copy_files).run_opt(**opt_flags)
@@ -89,6 +89,7 @@ def relax_job(
     atoms: Atoms,
     preset: str | None = "BulkSet",
     relax_cell: bool = False,
+    allow_continuation: bool = False,
     copy_files: SourceDirectory | dict[SourceDirectory, Filenames] | None = None,
     additional_fields: dict[str, Any] | None = None,
     **calc_kwargs,
@@ -105,6 +106,11 @@ def relax_job(
     relax_cell
         True if a volume relaxation (ISIF = 3) should be performed. False if
         only the positions (ISIF = 2) should be updated.
+    allow_continuation
+        Whether to return the results of a relaxation that was stopped early by the
+        wall-time handler or a STOPCAR instead of throwing an error, so that it can be
+        resumed with [quacc.recipes.vasp.core.continue_relax_job][]. The WAVECAR is
+        written by default in this case.
     copy_files
         Files to copy (and decompress) from source to the runtime directory.
     additional_fields
@@ -126,7 +132,7 @@ def relax_job(
         "ibrion": 2,
         "isym": 0,
         "lcharg": False,
-        "lwave": False,
+        "lwave": allow_continuation,
         "nsw": 200,
         "symprec": 1e-8,
     }
@@ -137,6 +143,65 @@ def relax_job(
         calc_swaps=calc_kwargs,
         additional_fields={"name": "VASP Relax"} | (additional_fields or {}),
         copy_files=copy_files,
+        allow_continuation=allow_continuation,
+    )
+
+
+@job
+def continue_relax_job(
+    relax_results: VaspSchema,
+    additional_fields: dict[str, Any] | None = None,
+    **calc_kwargs,
+) -> VaspSchema:
+    """
+    Continue a relaxation from [quacc.recipes.vasp.core.relax_job][] that was stopped
+    early by the wall-time handler or a STOPCAR. The relaxation is resumed from the
+    last structure and the WAVECAR with the same parameters, including any changes
+    made by the Custodian handlers, for the remaining number of ionic steps. If the
+    relaxation was not stopped early, its results are returned unchanged.
+
+    Parameters
+    ----------
+    relax_results
+        Results of the relaxation to continue, which must have been run with
+        `allow_continuation=True`.
+    additional_fields
+        Additional fields to add to the results dictionary.
+    **calc_kwargs
+        Custom kwargs for the Vasp calculator. Set a value to
+        `None` to remove a pre-existing key entirely. For a list of available
+        keys, refer to the [quacc.calculators.vasp.vasp.Vasp][] calculator.
+
+    Returns
+    -------
+    VaspSchema
+        Dictionary of results from [quacc.schemas.vasp.VaspSummarize.run][].
+        See the type-hint for the data structure.
+    """
+    continuation = relax_results.get("continuation")
+    if not continuation or relax_results.get("state") == "successful":
+        return relax_results
+
+    parameters = relax_results["parameters"]
+    incar_changes = {
+        key: value
+        for key, value in continuation["incar_changes"].items()
+        if key not in ("magmom", "istart", "nsw")
+    }
+    calc_defaults = parameters | incar_changes
+    calc_defaults["istart"] = 1
+    calc_defaults["nsw"] = max(
+        parameters.get("nsw", 200) - continuation["n_ionic_steps"], 1
+    )
+
+    return run_and_summarize(
+        relax_results["atoms"],
+        preset=None,
+        calc_defaults=calc_defaults,
+        calc_swaps=calc_kwargs,
+        additional_fields={"name": "VASP Relax"} | (additional_fields or {}),
+        copy_files={relax_results["dir_name"]: ["WAVECAR*"]},
+        allow_continuation=True,
     )
 
 
@@ -147,6 +212,7 @@ def double_relax_flow(
     relax_cell: bool = True,
     relax1_kwargs: dict[str, Any] | None = None,
     relax2_kwargs: dict[str, Any] | None = None,
+    max_continuations: int = 0,
 ) -> DoubleRelaxSchema:
     """
     Double-relax a structure. This is particularly useful for a few reasons:
@@ -172,6 +238,10 @@ def double_relax_flow(
         Dictionary of custom kwargs for the first relaxation.
     relax2_kwargs
         Dictionary of custom kwargs for the second relaxation.
+    max_continuations
+        The maximum number of times each relaxation is continued with
+        [quacc.recipes.vasp.core.continue_relax_job][] if it is stopped early by the
+        wall-time handler or a STOPCAR.
 
     Returns
     -------
@@ -180,18 +250,30 @@ def double_relax_flow(
     """
     relax1_kwargs = relax1_kwargs or {}
     relax2_kwargs = relax2_kwargs or {}
+    allow_continuation = max_continuations > 0
 
     # Run first relaxation
-    summary1 = relax_job(atoms, preset=preset, relax_cell=relax_cell, **relax1_kwargs)
+    summary1 = relax_job(
+        atoms,
+        preset=preset,
+        relax_cell=relax_cell,
+        allow_continuation=allow_continuation,
+        **relax1_kwargs,
+    )
+    for _ in range(max_continuations):
+        summary1 = continue_relax_job(summary1)
 
     # Run second relaxation
     summary2 = relax_job(
         summary1["atoms"],
         preset=preset,
         relax_cell=relax_cell,
+        allow_continuation=allow_continuation,
         copy_files={summary1["dir_name"]: ["WAVECAR*"]},
         **relax2_kwargs,
     )
+    for _ in range(max_continuations):
+        summary2 = continue_relax_job(summary2)
 
     return {"relax1": summary1, "relax2": summary2}
 
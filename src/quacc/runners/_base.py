@@ -8,6 +8,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from quacc.runners.prep import calc_cleanup, calc_setup
+from quacc.utils.perf import perf_phase
 
 if TYPE_CHECKING:
     from ase.atoms import Atoms
@@ -31,6 +32,7 @@ class BaseRunner:
     atoms: Atoms | None = None
     copy_files: SourceDirectory | dict[SourceDirectory, Filenames] | None = None
 
+    @perf_phase("calc_setup")
     def setup(self) -> None:
         """
         Perform setup operations on the runtime directory.
@@ -43,6 +45,7 @@ class BaseRunner:
             self.atoms, copy_files=self.copy_files
         )
 
+    @perf_phase("calc_cleanup")
     def cleanup(self) -> None:
         """
         Perform cleanup operations on the runtime directory.
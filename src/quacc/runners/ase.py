@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from contextlib import closing, nullcontext
 from copy import deepcopy
 from importlib.util import find_spec
 from logging import getLogger
@@ -31,6 +32,7 @@ from monty.os.path import zpath
 from quacc.runners._base import BaseRunner
 from quacc.runners.prep import calc_cleanup, calc_setup, terminate
 from quacc.utils.dicts import recursive_dict_merge
+from quacc.utils.perf import perf_phase, profile_dynamics
 
 LOGGER = getLogger(__name__)
 
@@ -39,6 +41,7 @@ has_geodesic_interpolate = bool(find_spec("geodesic_interpolate"))
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from contextlib import AbstractContextManager
     from pathlib import Path
     from typing import Any
 
@@ -118,7 +121,10 @@ class Runner(BaseRunner):
 
         # Run calculation
         try:
-            self.atoms.calc.calculate(self.atoms, properties, calculator.all_changes)
+            with perf_phase("Runner.run_calc"), self._closing(self.atoms.calc):
+                self.atoms.calc.calculate(
+                    self.atoms, properties, calculator.all_changes
+                )
         except Exception as exception:
             terminate(self.tmpdir, exception)
 
@@ -226,6 +232,7 @@ class Runner(BaseRunner):
         merged_optimizer_kwargs["trajectory"] = traj
 
         # Set volume relaxation constraints, if relevant
+        calc = self.atoms.calc
         if relax_cell and self.atoms.pbc.any():
             self.atoms = FrechetCellFilter(self.atoms)
 
@@ -234,7 +241,13 @@ class Runner(BaseRunner):
         if issubclass(optimizer, MolecularDynamics):
             full_run_kwargs.pop("fmax")
         try:
-            with traj, optimizer(self.atoms, **merged_optimizer_kwargs) as dyn:
+            with (
+                perf_phase("Runner.run_opt"),
+                self._closing(calc),
+                traj,
+                optimizer(self.atoms, **merged_optimizer_kwargs) as dyn,
+                profile_dynamics(dyn, calc),
+            ):
                 if issubclass(optimizer, SciPyOptimizer | MolecularDynamics):
                     # https://gitlab.coms/ase/ase/-/issues/1475
                     # https://gitlab.com/ase/ase/-/issues/1497
@@ -286,7 +299,8 @@ class Runner(BaseRunner):
         # Run calculation
         vib = Vibrations(self.atoms, name=str(self.tmpdir / "vib"), **vib_kwargs)
         try:
-            vib.run()
+            with perf_phase("Runner.run_vib"), self._closing(self.atoms.calc):
+                vib.run()
         except Exception as exception:
             terminate(self.tmpdir, exception)
 
@@ -390,7 +404,10 @@ class Runner(BaseRunner):
         Returns
         -------
         Dynamics
-            The ASE Dynamics object following an NEB calculation.
+            The ASE Dynamics object following an NEB calculation. The energies of
+            the images at each iteration are stored in its `energy_profile`
+            attribute as an (n_iter, n_images) array, with NaN for energies that
+            were not calculated.
         """
         images = self.atoms
         run_kwargs = run_kwargs or {}
@@ -420,6 +437,7 @@ class Runner(BaseRunner):
         neb = NEB(images, **neb_kwargs)
 
         # Perform staging operations
+        calcs = [image.calc for image in images]
         for i, image in enumerate(images):
             image_tmpdir = neb_tmpdir / f"image_{i}"
             image_tmpdir.mkdir()
@@ -437,9 +455,20 @@ class Runner(BaseRunner):
 
         dyn = optimizer(neb, **optimizer_kwargs)
         dyn.attach(traj.write)
-        dyn.run(fmax, max_steps)
+
+        # Record the image energies of each iteration, so the convergence history
+        # is available without reading back the geometries
+        energy_profile = []
+        dyn.attach(
+            lambda: energy_profile.append(
+                [image.calc.results.get("energy", np.nan) for image in neb.images]
+            )
+        )
+        with perf_phase("Runner.run_neb"), profile_dynamics(dyn, calcs):
+            dyn.run(fmax, max_steps)
         traj.close()
         dyn.logfile.close()
+        dyn.energy_profile = np.array(energy_profile)
 
         calc_cleanup(None, neb_tmpdir, neb_results_dir)
         traj.filename = zpath(str(neb_results_dir / traj_filename))
@@ -447,6 +476,26 @@ class Runner(BaseRunner):
 
         return dyn
 
+    @staticmethod
+    def _closing(calc: Calculator) -> AbstractContextManager:
+        """
+        Close a calculator that keeps a persistent process alive between calls, such
+        as ASE's `SocketIOCalculator` or quacc's `Vasp` in interactive mode, once the
+        calculation is done. This ensures the process is stopped and its final
+        output files are written before the scratch directory is cleaned up.
+
+        Parameters
+        ----------
+        calc
+            The ASE calculator.
+
+        Returns
+        -------
+        AbstractContextManager
+            A context manager that calls `calc.close()` on exit, if present.
+        """
+        return closing(calc) if hasattr(calc, "close") else nullcontext()
+
     def _copy_intermediate_files(
         self, step_number: int, files_to_ignore: list[Path] | None = None
     ) -> None:
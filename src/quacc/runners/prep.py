@@ -12,6 +12,7 @@ from monty.shutil import gzip_dir
 
 from quacc import JobFailure, get_settings
 from quacc.utils.files import copy_decompress_files, make_unique_dir
+from quacc.utils.perf import get_directory_size, perf_phase
 
 if TYPE_CHECKING:
     from ase.atoms import Atoms
@@ -77,9 +78,12 @@ def calc_setup(
         if isinstance(copy_files, str | Path):
             copy_files = {copy_files: "*"}
 
-        for source_directory, filenames in copy_files.items():
-            if source_directory is not None:
-                copy_decompress_files(source_directory, filenames, tmpdir)
+        with perf_phase("calc_setup.stage_in") as record:
+            for source_directory, filenames in copy_files.items():
+                if source_directory is not None:
+                    copy_decompress_files(source_directory, filenames, tmpdir)
+            if record:
+                record["nbytes"] = get_directory_size(tmpdir)
 
     return tmpdir, job_results_dir
 
@@ -121,15 +125,19 @@ def calc_cleanup(
 
     # Gzip files in tmpdir
     if settings.GZIP_FILES:
-        gzip_dir(tmpdir)
+        with perf_phase("calc_cleanup.gzip"):
+            gzip_dir(tmpdir)
 
     # Move files from tmpdir to job_results_dir
-    if settings.CREATE_UNIQUE_DIR:
-        move(tmpdir, job_results_dir)
-    else:
-        for file_name in os.listdir(tmpdir):
-            move(tmpdir / file_name, job_results_dir / file_name)
-        rmtree(tmpdir)
+    with perf_phase("calc_cleanup.stage_out") as record:
+        if record:
+            record["nbytes"] = get_directory_size(tmpdir)
+        if settings.CREATE_UNIQUE_DIR:
+            move(tmpdir, job_results_dir)
+        else:
+            for file_name in os.listdir(tmpdir):
+                move(tmpdir / file_name, job_results_dir / file_name)
+            rmtree(tmpdir)
     LOGGER.info(f"Calculation results stored at {job_results_dir}")
 
     # Remove symlink to tmpdir
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+from contextlib import nullcontext
 from typing import TYPE_CHECKING
 
 import numpy as np
 from ase.io import read
+from ase.io.trajectory import TrajectoryReader
 from ase.vibrations.data import VibrationsData
-from emmet.core.symmetry import PointGroupData
-from pymatgen.io.ase import AseAtomsAdaptor
+from monty.io import zopen
 
 from quacc import QuaccDefault, __version__, get_settings
 from quacc.atoms.core import get_final_atoms_from_dynamics
@@ -17,6 +18,7 @@ from quacc.schemas.prep import prep_next_run
 from quacc.schemas.thermo import ThermoSummarize
 from quacc.utils.dicts import finalize_dict, recursive_dict_merge
 from quacc.utils.files import get_uri
+from quacc.utils.perf import perf_phase
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -78,6 +80,7 @@ class Summarize:
         self.additional_fields = additional_fields or {}
         self._settings = get_settings()
 
+    @perf_phase("Summarize.run")
     def run(
         self,
         final_atoms: Atoms,
@@ -156,6 +159,7 @@ class Summarize:
             store=store,
         )
 
+    @perf_phase("Summarize.opt")
     def opt(
         self,
         dyn: Optimizer,
@@ -225,6 +229,8 @@ class Summarize:
             "trajectory": atoms_trajectory,
             "trajectory_results": trajectory_results,
         }
+        if perf_opt := getattr(dyn, "perf_opt", None):
+            opt_fields["perf_opt"] = perf_opt
 
         # Create a dictionary of the inputs/outputs
         unsorted_task_doc = base_task_doc | opt_fields | self.additional_fields
@@ -236,6 +242,7 @@ class Summarize:
             store=store,
         )
 
+    @perf_phase("Summarize.md")
     def md(
         self,
         dyn: MolecularDynamics,
@@ -294,6 +301,7 @@ class Summarize:
             store=store,
         )
 
+    @perf_phase("Summarize.neb")
     def neb(
         self,
         dyn: Optimizer,
@@ -312,7 +320,8 @@ class Summarize:
         n_images
             Number of images in the NEB run.
         n_iter_return
-            Number of iterations to return. If -1, all iterations are returned.
+            Return every nth iteration, as well as the final one. If -1, only the
+            final iteration is returned.
         trajectory
             Trajectory of the NEB run, either as a Trajectory object or a list of Atoms objects.
         store
@@ -325,21 +334,21 @@ class Summarize:
         """
         store = self._settings.STORE if store == QuaccDefault else store
 
-        # Get trajectory
-        if trajectory:
-            atoms_trajectory = trajectory
-        else:
-            atoms_trajectory = read(dyn.trajectory.filename, index=":")  # type: ignore[union-attr]
-
-        if n_iter_return == -1:
-            atoms_trajectory = atoms_trajectory[-(n_images):]
-        else:
-            atoms_trajectory = _get_nth_iteration(
-                atoms_trajectory,
-                int(len(atoms_trajectory) / n_images),
-                n_images,
-                n_iter_return,
-            )
+        # Get the requested frames of the trajectory, only decoding those frames
+        # if it has to be read from disk
+        with (
+            nullcontext(trajectory)
+            if trajectory
+            else zopen(dyn.trajectory.filename, mode="rb")  # type: ignore[union-attr]
+        ) as f:
+            frames = trajectory or TrajectoryReader(f)
+            if n_iter_return == -1:
+                indices = range(len(frames) - n_images, len(frames))
+            else:
+                indices = _get_nth_iteration_indices(
+                    len(frames), n_images, n_iter_return
+                )
+            atoms_trajectory = [frames[i] for i in indices]
         trajectory_results = [atoms.calc.results for atoms in atoms_trajectory]
         ts_index = (
             np.argmax(
@@ -366,6 +375,10 @@ class Summarize:
             "trajectory_results": trajectory_results,
             "ts_atoms": ts_atoms,
         }
+        if perf_opt := getattr(dyn, "perf_opt", None):
+            opt_fields["perf_opt"] = perf_opt
+        if (energy_profile := getattr(dyn, "energy_profile", None)) is not None:
+            opt_fields["energy_profile"] = energy_profile
 
         # Create a dictionary of the inputs/outputs
         unsorted_task_doc = base_task_doc | opt_fields | self.additional_fields
@@ -415,6 +428,7 @@ class VibSummarize:
         self.additional_fields = additional_fields or {}
         self._settings = get_settings()
 
+    @perf_phase("VibSummarize.vib")
     def vib(
         self,
         is_molecule: bool = False,
@@ -483,6 +497,9 @@ class VibSummarize:
             vib_freqs = []
             vib_energies = []
         elif is_molecule:
+            from emmet.core.symmetry import PointGroupData
+            from pymatgen.io.ase import AseAtomsAdaptor
+
             is_linear = (
                 PointGroupData()
                 .from_molecule(AseAtomsAdaptor().get_molecule(atoms))
@@ -528,6 +545,7 @@ class VibSummarize:
             store=store,
         )
 
+    @perf_phase("VibSummarize.vib_and_thermo")
     def vib_and_thermo(
         self,
         thermo_method: Literal["ideal_gas", "harmonic"],
@@ -602,18 +620,17 @@ class VibSummarize:
         )
 
 
-def _get_nth_iteration(
-    neb_trajectory: list[Atoms], n_iter: int, n_images: int, interval: int
-) -> list[Atoms]:
+def _get_nth_iteration_indices(
+    n_frames: int, n_images: int, interval: int
+) -> list[int]:
     """
-    Extract every nth iteration from the NEB trajectory.
+    Get the indices of every nth iteration of the NEB trajectory, along with the
+    final iteration.
 
     Parameters
     ----------
-    neb_trajectory
-        List of configurations (length: n_iter * n_images).
-    n_iter
-        Total number of iterations.
+    n_frames
+        Number of configurations in the trajectory (n_iter * n_images).
     n_images
         Number of images per iteration.
     interval
@@ -621,16 +638,16 @@ def _get_nth_iteration(
 
     Returns
     -------
-    list[Atoms]
-        List of configurations from every nth iteration.
+    list[int]
+        Indices of the configurations from every nth iteration.
     """
-    result = []
-    start_idx, end_idx = 0, 0
-    for i in range(0, n_iter, interval):
+    indices = []
+    end_idx = 0
+    for i in range(0, n_frames // n_images, interval):
         start_idx = i * n_images
         end_idx = start_idx + n_images
 
-        result.extend(neb_trajectory[start_idx:end_idx])
-    if end_idx < len(neb_trajectory) - 1:
-        result.extend(neb_trajectory[-(n_images):])
-    return result
+        indices.extend(range(start_idx, end_idx))
+    if end_idx < n_frames - 1:
+        indices.extend(range(n_frames - n_images, n_frames))
+    return indices
@@ -4,14 +4,12 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from emmet.core.structure import MoleculeMetadata, StructureMetadata
-from pymatgen.io.ase import AseAtomsAdaptor
-
 from quacc.atoms.core import (
     copy_atoms,
     get_charge_attribute,
     get_spin_multiplicity_attribute,
 )
+from quacc.utils.perf import perf_phase
 
 if TYPE_CHECKING:
     from typing import Any
@@ -21,6 +19,7 @@ if TYPE_CHECKING:
     from quacc.types import AtomsSchema
 
 
+@perf_phase("atoms_to_metadata")
 def atoms_to_metadata(
     atoms: Atoms,
     charge_and_multiplicity: tuple[int, int] | None = None,
@@ -77,6 +76,9 @@ def atoms_to_metadata(
     # Get Atoms metadata, if requested. emmet already has built-in tools for
     # generating pymatgen Structure/Molecule metadata, so we'll just use that.
     if get_metadata:
+        from emmet.core.structure import MoleculeMetadata, StructureMetadata
+        from pymatgen.io.ase import AseAtomsAdaptor
+
         if atoms.pbc.any():
             struct = AseAtomsAdaptor().get_structure(atoms)
             metadata = StructureMetadata().from_structure(struct).model_dump()
@@ -8,14 +8,13 @@ from typing import TYPE_CHECKING
 
 from ase.thermochemistry import HarmonicThermo, IdealGasThermo
 from ase.units import invcm
-from emmet.core.symmetry import PointGroupData
-from pymatgen.io.ase import AseAtomsAdaptor
 
 from quacc import QuaccDefault, __version__, get_settings
 from quacc.atoms.core import get_spin_multiplicity_attribute
 from quacc.schemas.atoms import atoms_to_metadata
 from quacc.utils.dicts import finalize_dict
 from quacc.utils.files import get_uri
+from quacc.utils.perf import perf_phase
 
 if TYPE_CHECKING:
     from ase.atoms import Atoms
@@ -82,6 +81,7 @@ class ThermoSummarize:
         self.additional_fields = additional_fields or {}
         self._settings = get_settings()
 
+    @perf_phase("ThermoSummarize.ideal_gas")
     def ideal_gas(
         self,
         temperature: float = 298.15,
@@ -162,6 +162,7 @@ class ThermoSummarize:
             store=store,
         )
 
+    @perf_phase("ThermoSummarize.harmonic")
     def harmonic(
         self,
         temperature: float = 298.15,
@@ -249,6 +250,9 @@ class ThermoSummarize:
         # Get the spin from the Atoms object.
         spin = round((spin_multiplicity - 1) / 2, 1) if spin_multiplicity else 0
 
+        from emmet.core.symmetry import PointGroupData
+        from pymatgen.io.ase import AseAtomsAdaptor
+
         # Get symmetry for later use
         mol = AseAtomsAdaptor().get_molecule(self.atoms, charge_spin_check=False)
         point_group_data = PointGroupData().from_molecule(mol)
@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING
 from ase.io import read
 from emmet.core.tasks import TaskDoc
 from monty.os.path import zpath
+from monty.serialization import loadfn
 from pymatgen.command_line.bader_caller import bader_analysis_from_path
 from pymatgen.command_line.chargemol_caller import ChargemolAnalysis
 from pymatgen.entries.compatibility import (
@@ -19,8 +20,10 @@ from pymatgen.entries.compatibility import (
 
 from quacc import QuaccDefault, get_settings
 from quacc.atoms.core import get_final_atoms_from_dynamics
+from quacc.calculators.vasp.vasp_custodian import CONTINUATION_FILE
 from quacc.schemas.ase import Summarize
 from quacc.utils.dicts import finalize_dict, recursive_dict_merge
+from quacc.utils.perf import perf_phase
 
 if TYPE_CHECKING:
     from typing import Any
@@ -54,6 +57,7 @@ class VaspSummarize:
         run_chargemol: bool | DefaultSetting = QuaccDefault,
         check_convergence: bool | DefaultSetting = QuaccDefault,
         report_mp_corrections: bool = False,
+        allow_continuation: bool = False,
         additional_fields: dict[str, Any] | None = None,
     ) -> None:
         """
@@ -79,6 +83,10 @@ class VaspSummarize:
             settings.
         report_mp_corrections
             Whether to apply the MP corrections to the task document. Defaults to False.
+        allow_continuation
+            Whether to return the results of a run that did not converge because it was
+            stopped early by the wall-time handler or a STOPCAR instead of throwing an
+            error, so that it can be continued. Defaults to False.
         additional_fields
             Additional fields to add to the task document.
 
@@ -92,9 +100,11 @@ class VaspSummarize:
         self.run_chargemol = run_chargemol
         self.check_convergence = check_convergence
         self.report_mp_corrections = report_mp_corrections
+        self.allow_continuation = allow_continuation
         self.additional_fields = additional_fields or {}
         self._settings = get_settings()
 
+    @perf_phase("VaspSummarize.run")
     def run(
         self, final_atoms: Atoms, store: Store | None | DefaultSetting = QuaccDefault
     ) -> VaspSchema:
@@ -134,7 +144,8 @@ class VaspSummarize:
 
         # Fetch all tabulated results from VASP outputs files. Fortunately, emmet
         # already has a handy function for this
-        vasp_task_model = TaskDoc.from_directory(directory)
+        with perf_phase("TaskDoc.from_directory"):
+            vasp_task_model = TaskDoc.from_directory(directory)
 
         # Get MP corrections
         if self.report_mp_corrections:
@@ -150,11 +161,21 @@ class VaspSummarize:
         # Convert the VASP task model to a dictionary
         vasp_task_doc = vasp_task_model.model_dump()
 
+        # Get the state needed to continue a run that was stopped early
+        continuation_path = Path(zpath(str(directory / CONTINUATION_FILE)))
+        if continuation_path.exists():
+            vasp_task_doc["continuation"] = loadfn(continuation_path)
+
         # Check for calculation convergence
         if check_convergence and vasp_task_doc["state"] != "successful":
-            raise RuntimeError(
-                f"VASP calculation did not converge. Will not store task data. Refer to {directory}"
-            )
+            if self.allow_continuation and vasp_task_doc.get("continuation"):
+                LOGGER.warning(
+                    f"VASP calculation was stopped early and can be continued. Refer to {directory}"
+                )
+            else:
+                raise RuntimeError(
+                    f"VASP calculation did not converge. Will not store task data. Refer to {directory}"
+                )
         poscar_path = directory / "POSCAR"
         initial_atoms = read(zpath(str(poscar_path)))
         base_task_doc = Summarize(
@@ -210,6 +231,7 @@ class VaspSummarize:
             store=store,
         )
 
+    @perf_phase("VaspSummarize.ase_opt")
     def ase_opt(
         self,
         optimizer: Optimizer,
@@ -4,20 +4,21 @@ from __future__ import annotations
 
 import os
 from contextlib import contextmanager
-from functools import wraps
+from copy import deepcopy
+from functools import lru_cache, wraps
 from pathlib import Path
 from shutil import which
-from typing import TYPE_CHECKING, Literal, Optional, Union
+from typing import TYPE_CHECKING, Any, Literal, Optional, Union
 
 import psutil
-from maggma.core import Store
 from monty.serialization import loadfn
 from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 if TYPE_CHECKING:
     from collections.abc import Callable
-    from typing import Any
+
+    from maggma.core import Store
 
 _DEFAULT_CONFIG_FILE_PATH = Path("~", ".quacc.yaml").expanduser().resolve()
 
@@ -60,7 +61,7 @@ class QuaccSettings(BaseSettings):
     # ---------------------------
 
     WORKFLOW_ENGINE: Optional[
-        Literal["covalent", "dask", "parsl", "prefect", "redun", "jobflow"]
+        Literal["covalent", "dask", "parsl", "prefect", "redun", "jobflow", "local"]
     ] = Field(None, description=("The workflow manager to use, if any."))
 
     # ---------------------------
@@ -109,7 +110,7 @@ class QuaccSettings(BaseSettings):
     # ---------------------------
     # Data Store Settings
     # ---------------------------
-    STORE: Optional[Union[dict[str, dict], Store]] = Field(
+    STORE: Optional[Union[dict[str, dict], Any]] = Field(
         None,
         description=(
             """
@@ -132,6 +133,30 @@ class QuaccSettings(BaseSettings):
         ),
     )
 
+    # ---------------------------
+    # Performance Telemetry Settings
+    # ---------------------------
+    PERF_TELEMETRY: bool = Field(
+        False,
+        description=(
+            """
+            Whether to record the wall time, CPU time, and peak memory usage of each
+            phase of a job (e.g. staging files, running the calculator, parsing outputs)
+            and store them in the `perf` field of the resulting schema.
+            """
+        ),
+    )
+    PERF_TRACE_FILE: Optional[Path] = Field(
+        None,
+        description=(
+            """
+            If set (and `PERF_TELEMETRY` is enabled), every recorded phase is also appended
+            to this file as a Chrome trace event in JSON lines format. Use
+            `quacc.utils.perf.to_chrome_trace` to convert it for viewing in Perfetto.
+            """
+        ),
+    )
+
     # ---------------------------
     # Prefect Settings
     # ---------------------------
@@ -143,6 +168,29 @@ class QuaccSettings(BaseSettings):
         description="Whether to resolve all futures in flow results to data and fail if not possible",
     )
 
+    # ---------------------------
+    # Local Engine Settings
+    # ---------------------------
+    LOCAL_EXECUTOR: Literal["thread", "process"] = Field(
+        "thread",
+        description=(
+            """
+            Whether the local workflow engine runs jobs in a pool of threads or
+            processes. Threads are best when jobs mostly wait on external codes
+            (e.g. DFT executables); processes are best for Python-bound calculators.
+            """
+        ),
+    )
+    LOCAL_MAX_WORKERS: Optional[int] = Field(
+        None,
+        description=(
+            """
+            Number of workers (and resource slots) used by the local workflow engine.
+            If None, the number of CPUs is used.
+            """
+        ),
+    )
+
     # ---------------------------
     # ORCA Settings
     # ---------------------------
@@ -210,6 +258,18 @@ class QuaccSettings(BaseSettings):
             """
         ),
     )
+    ESPRESSO_AUTO_PARALLEL: bool = Field(
+        False,
+        description=(
+            """
+            Whether to automatically append the pool (`-nk`), task group (`-nt`),
+            and diagonalization (`-nd`) parallelization flags to the pw.x, ph.x, and
+            projwfc.x commands based on the k-points, the size of the system, and
+            the number of MPI processes in `ESPRESSO_PARALLEL_CMD`. Flags that are
+            already in `ESPRESSO_PARALLEL_CMD` take precedence.
+            """
+        ),
+    )
     ESPRESSO_PSEUDO: Optional[Path] = Field(
         None, description=("Path to a pseudopotential library for espresso.")
     )
@@ -334,6 +394,54 @@ class QuaccSettings(BaseSettings):
         Path(__file__).parent / "calculators" / "vasp" / "presets",
         description="Path to the VASP preset directory",
     )
+    VASP_POTCAR_CACHE_DIR: Optional[Path] = Field(
+        None,
+        description=(
+            """
+            Directory in which to cache the assembled POTCAR files. If set, each
+            POTCAR is assembled from the files in `VASP_PP_PATH` only once for a given
+            ordered list of setups and then hard-linked (or copied, if the cache is
+            on a different filesystem) into the job directory.
+            """
+        ),
+    )
+    VASP_PARALLEL_HISTORY: Optional[Path] = Field(
+        None,
+        description=(
+            """
+            Path to a local SQLite database of the parallelization settings and
+            timings of completed VASP runs. If set, every completed run is recorded
+            in the database, and the INCAR co-pilot recommends NCORE and KPAR based
+            on the fastest settings of similar past runs (same number of MPI ranks
+            and hybrid vs. non-hybrid, similar number of atoms and k-points) instead
+            of the sqrt(# cores) heuristic. It falls back to the heuristic if there
+            is no similar run. Unless `VASP_PARALLEL_EXPLORE` is set, only settings
+            that have already been run are ever recommended.
+            """
+        ),
+    )
+    VASP_PARALLEL_EXPLORE: bool = Field(
+        False,
+        description=(
+            """
+            Whether the INCAR co-pilot should try untried NCORE and KPAR settings
+            next to the fastest ones in `VASP_PARALLEL_HISTORY` (NCORE or KPAR halved
+            or doubled) until all of them have been run.
+            """
+        ),
+    )
+    VASP_MPI_RANKS: Optional[int] = Field(
+        None,
+        description=(
+            """
+            Total number of MPI ranks that VASP runs on, which is used by the INCAR
+            co-pilot to set NCORE and KPAR. If not set, it is taken from the
+            `-n`/`-np`/`--ntasks` or `-N` and `--ntasks-per-node` flags of
+            `VASP_PARALLEL_CMD`, and otherwise from the number of physical cores of
+            the current node.
+            """
+        ),
+    )
 
     # VASP Settings: Custodian
     VASP_USE_CUSTODIAN: bool = Field(
@@ -446,6 +554,9 @@ class QuaccSettings(BaseSettings):
         "VASP_PRESET_DIR",
         "VASP_PP_PATH",
         "VASP_VDW",
+        "VASP_POTCAR_CACHE_DIR",
+        "VASP_PARALLEL_HISTORY",
+        "PERF_TRACE_FILE",
     )
     @classmethod
     def expand_paths(cls, v: Optional[Path]) -> Optional[Path]:
@@ -464,17 +575,27 @@ class QuaccSettings(BaseSettings):
 
     @field_validator("STORE")
     @classmethod
-    def generate_store(cls, v: Union[dict[str, dict[str, Any]], Store]) -> Store:
+    def generate_store(
+        cls, v: Optional[Union[dict[str, dict[str, Any]], Store]]
+    ) -> Optional[Store]:
         """Generate the Maggma store."""
+        if v is None:
+            return v
+
+        # Maggma is slow to import, so it is only loaded when a store is used
         from maggma import stores
+        from maggma.core import Store
 
         if isinstance(v, dict):
             store_name = next(iter(v.keys()))
             store = getattr(stores, store_name)
 
             return store(**v[store_name])
-        else:
+        elif isinstance(v, Store):
             return v
+        else:
+            msg = f"STORE must be a dictionary or a Maggma Store, not {type(v)}."
+            raise ValueError(msg)
 
     @field_validator("ESPRESSO_PARALLEL_CMD")
     @classmethod
@@ -509,8 +630,10 @@ class QuaccSettings(BaseSettings):
         )
 
         new_settings = {}  # type: dict
-        if config_file_path.exists() and config_file_path.stat().st_size > 0:
-            new_settings |= loadfn(config_file_path)
+        if config_file_path.exists() and (stat := config_file_path.stat()).st_size > 0:
+            new_settings |= deepcopy(
+                _load_config_file(config_file_path, stat.st_mtime_ns, stat.st_size)
+            )
 
         new_settings.update(settings)
         return new_settings
@@ -535,6 +658,34 @@ class QuaccSettings(BaseSettings):
         return _type_handler(cls._use_custom_config_settings(settings))
 
 
+@lru_cache(maxsize=16)
+def _load_config_file(
+    config_file_path: Path,
+    mtime_ns: int,  # noqa: ARG001
+    size: int,  # noqa: ARG001
+) -> dict[str, Any]:
+    """
+    Load a YAML config file. The result is cached, and the modification time and
+    size are only used as part of the cache key so that edits to the file are
+    picked up. Callers must not modify the returned dictionary.
+
+    Parameters
+    ----------
+    config_file_path
+        Path to the YAML config file.
+    mtime_ns
+        Modification time of the file, in ns.
+    size
+        Size of the file, in bytes.
+
+    Returns
+    -------
+    dict
+        The parsed settings.
+    """
+    return loadfn(config_file_path)
+
+
 def _type_handler(settings: dict[str, Any]) -> dict[str, Any]:
     """
     Convert common strings to their proper types.
@@ -569,7 +720,7 @@ def change_settings(changes: dict[str, Any]):
     changes
         Dictionary of changes to make formatted as attribute: value.
     """
-    from quacc import _internally_set_settings, get_settings
+    from quacc import _internally_set_settings, _thread_local, get_settings
 
     if "WORKFLOW_ENGINE" in changes:
         raise ValueError(
@@ -578,13 +729,14 @@ def change_settings(changes: dict[str, Any]):
 
     settings = get_settings()
     original_values = {attr: getattr(settings, attr) for attr in changes}
+    original_overrides = dict(_thread_local.overrides)
 
     _internally_set_settings(changes=changes)
 
     try:
         yield
     finally:
-        _internally_set_settings(changes=original_values)
+        _internally_set_settings(changes=original_values, overrides=original_overrides)
 
 
 def change_settings_wrap(func: Callable, changes: dict[str, Any]) -> Callable:
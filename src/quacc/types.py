@@ -460,6 +460,32 @@ if TYPE_CHECKING:
 
     # ----------- Schema (ASE) type hints -----------
 
+    class PerfPhase(TypedDict):
+        """Type hint associated with [quacc.utils.perf.perf_phase][]"""
+
+        name: str
+        depth: int
+        start: float  # Unix timestamp
+        wall_time: float  # s
+        cpu_time: float  # s (this thread)
+        cpu_time_children: float  # s (terminated child processes)
+        max_rss: float  # MB (peak for the process)
+        nbytes: NotRequired[int]  # bytes transferred
+
+    class PerfOpt(TypedDict):
+        """Type hint associated with [quacc.utils.perf.DynamicsProfiler][]"""
+
+        n_steps: int
+        n_calls: int  # number of calculator.calculate() calls
+        n_requests: int  # number of calculator.get_property() calls
+        cache_hit_rate: float | None  # fraction of requests served from the cache
+        total_time: float  # s
+        calc_time: float  # s
+        optimizer_time: float  # s
+        step_wall_times: list[float]  # s
+        step_calc_times: list[float]  # s
+        step_n_calls: list[int]
+
     class RunSchema(AtomsSchema):
         """Schema for [quacc.schemas.ase.Summarize.run][]"""
 
@@ -469,6 +495,7 @@ if TYPE_CHECKING:
         parameters: Parameters
         results: Results
         quacc_version: str
+        perf: NotRequired[list[PerfPhase]]  # if QuaccSettings.PERF_TELEMETRY
 
     class OptSchema(RunSchema):
         """Schema for [quacc.schemas.ase.Summarize.opt][]"""
@@ -477,6 +504,8 @@ if TYPE_CHECKING:
         converged: bool
         trajectory: list[Atoms]
         trajectory_results: list[Results]
+        perf_opt: NotRequired[PerfOpt]  # if QuaccSettings.PERF_TELEMETRY
+        energy_profile: NotRequired[NDArray]  # if from Runner.run_neb
 
     class DynSchema(RunSchema):
         """Schema for [quacc.schemas.ase.Summarize.md][]"""
@@ -485,6 +514,7 @@ if TYPE_CHECKING:
         trajectory: list[Atoms]
         trajectory_log: TrajectoryLog
         trajectory_results: list[Results]
+        perf_opt: NotRequired[PerfOpt]  # if QuaccSettings.PERF_TELEMETRY
 
     class ParametersVib(TypedDict):
         delta: float
@@ -611,13 +641,46 @@ if TYPE_CHECKING:
         ddec: DDECSchema
         cm5: CM5Schema
 
+    class VaspContinuationSchema(TypedDict):
+        """Type hint associated with [quacc.calculators.vasp.vasp_custodian.write_continuation][]"""
+
+        reason: Literal["walltime", "stopcar"]
+        n_ionic_steps: int
+        incar_changes: dict[str, Any]
+        custodian_errors: list[str]
+
     class VaspSchema(RunSchema, TaskDoc):
         """Type hint associated with [quacc.schemas.vasp.VaspSummarize.run][]"""
 
         bader: BaderSchema
         chargemol: ChargemolSchema
+        continuation: VaspContinuationSchema  # when stopped early
         steps: dict[int, TaskDoc]  # when store_intermediate_results=True
 
+    # ----------- Recipe (common) type hints -----------
+
+    class IRCPathSchema(TypedDict):
+        """Type hint associated with [quacc.recipes.common.irc.irc_path_subflow][]"""
+
+        forward: OptSchema
+        reverse: OptSchema
+        trajectory: list[Atoms]
+        energies: list[float]
+        ts_index: int
+
+    class DistributedNebSchema(TypedDict):
+        """Type hint associated with [quacc.recipes.common.neb.neb_subflow][]"""
+
+        trajectory: list[Atoms]
+        energies: list[float]
+        ts_index: int
+        climbing: bool
+        converged: bool
+        n_iterations: int
+        n_evaluations: int
+        energy_profile: list[list[float]]  # one list per iteration
+        image_results: list[RunSchema]
+
     # ----------- Recipe (VASP) type hints -----------
 
     class DoubleRelaxSchema(TypedDict):
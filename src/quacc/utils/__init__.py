@@ -2,6 +2,20 @@
 
 from __future__ import annotations
 
-from quacc.atoms.core import check_charge_and_spin
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from quacc.atoms.core import check_charge_and_spin
 
 __all__ = ["check_charge_and_spin"]
+
+_LAZY_IMPORTS = {"check_charge_and_spin": "quacc.atoms.core"}
+
+
+def __getattr__(name: str):
+    """Lazily import public names so that `quacc.utils` is cheap to import."""
+    if name in _LAZY_IMPORTS:
+        return getattr(import_module(_LAZY_IMPORTS[name]), name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
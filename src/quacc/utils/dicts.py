@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING
 from monty.json import jsanitize
 from monty.serialization import dumpfn
 
+from quacc.utils.perf import perf_phase, pop_perf_phases
 from quacc.wflow_tools.db import results_to_db
 
 if TYPE_CHECKING:
@@ -189,7 +190,9 @@ def finalize_dict(
     store: Store | None = None,
 ) -> MutableMapping[str, Any]:
     """
-    Finalize a schema by cleaning it and storing it in a database and/or file.
+    Finalize a schema by cleaning it and storing it in a database and/or file. If
+    `QuaccSettings.PERF_TELEMETRY` is enabled, the performance phases recorded since
+    the last task document are added to the `perf` field.
 
     Parameters
     ----------
@@ -208,25 +211,30 @@ def finalize_dict(
         Cleaned task document
     """
 
+    if (perf := pop_perf_phases()) is not None:
+        task_doc = task_doc | {"perf": perf}
+
     cleaned_task_doc = clean_dict(task_doc)
     if directory:
         if "tmp-quacc" in str(directory):
             raise ValueError("The directory should not be a temporary directory.")
 
-        sanitized_schema = jsanitize(
-            cleaned_task_doc, enum_values=True, recursive_msonable=True
-        )
-        dumpfn(
-            sanitized_schema,
-            Path(
-                directory,
-                "quacc_results.json.gz" if gzip_file else "quacc_results.json",
-            ),
-            fmt="json",
-            indent=4,
-        )
+        with perf_phase("finalize_dict.write", keep=False):
+            sanitized_schema = jsanitize(
+                cleaned_task_doc, enum_values=True, recursive_msonable=True
+            )
+            dumpfn(
+                sanitized_schema,
+                Path(
+                    directory,
+                    "quacc_results.json.gz" if gzip_file else "quacc_results.json",
+                ),
+                fmt="json",
+                indent=4,
+            )
 
     if store:
-        results_to_db(store, task_doc)
+        with perf_phase("finalize_dict.store", keep=False):
+            results_to_db(store, task_doc)
 
     return cleaned_task_doc
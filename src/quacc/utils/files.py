@@ -26,6 +26,8 @@ if TYPE_CHECKING:
 
 LOGGER = getLogger(__name__)
 
+_YAML_CACHE: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+
 
 def check_logfile(logfile: str | Path, check_str: str) -> bool:
     """
@@ -193,6 +195,9 @@ def load_yaml_calc(yaml_path: str | Path) -> dict[str, Any]:
     YAML file. It is assumed that the parent YAML file is in the same directory as the
     child YAML file if only the filename is specified.
 
+    The parsed YAML files are cached in memory, so that repeatedly loading the same
+    (unchanged) presets is cheap.
+
     Parameters
     ----------
     yaml_path
@@ -210,7 +215,7 @@ def load_yaml_calc(yaml_path: str | Path) -> dict[str, Any]:
         raise FileNotFoundError(msg)
 
     # Load YAML file
-    config = YAML().load(yaml_path)
+    config = _load_yaml(yaml_path)
 
     # Inherit arguments from any parent YAML files but do not overwrite those in
     # the child file.
@@ -236,6 +241,32 @@ def load_yaml_calc(yaml_path: str | Path) -> dict[str, Any]:
     return config
 
 
+def _load_yaml(yaml_path: Path) -> dict[str, Any]:
+    """
+    Load a YAML file. The parsed contents are cached for the lifetime of the process
+    and reused as long as the modification time and size of the file are unchanged.
+
+    Parameters
+    ----------
+    yaml_path
+        Path to the YAML file.
+
+    Returns
+    -------
+    dict
+        A copy of the contents of the YAML file.
+    """
+    yaml_path = yaml_path.resolve()
+    stat = yaml_path.stat()
+    key = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _YAML_CACHE.get(yaml_path)
+    if cached is None or cached[0] != key:
+        cached = (key, YAML().load(yaml_path))
+        _YAML_CACHE[yaml_path] = cached
+    return deepcopy(cached[1])
+
+
 def find_recent_logfile(
     directory: Path | str, logfile_extensions: str | list[str]
 ) -> Path:
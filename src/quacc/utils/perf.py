@@ -0,0 +1,423 @@
+"""Lightweight performance telemetry for quacc jobs."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from logging import getLogger
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from typing import Any
+
+    from typing_extensions import Self
+
+    from quacc.types import PerfOpt, PerfPhase
+
+LOGGER = getLogger(__name__)
+
+_thread_local = threading.local()
+_trace_file_lock = threading.Lock()
+
+
+class PerfRecorder:
+    """
+    Collects the performance phases recorded in a given thread until they are
+    attached to a task document by `finalize_dict`.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the PerfRecorder.
+
+        Returns
+        -------
+        None
+        """
+        self.phases: list[PerfPhase] = []
+        self.depth = 0
+        self.finalized_depth = 0
+
+    def pop_phases(self) -> list[PerfPhase]:
+        """
+        Return the recorded phases and clear them from the recorder. Phases that are
+        still open (i.e. that enclose the task document being finalized) will only be
+        written to the trace file once they close.
+
+        Returns
+        -------
+        list[PerfPhase]
+            The recorded phases, in the order they finished.
+        """
+        phases, self.phases = self.phases, []
+        self.finalized_depth = self.depth
+        return phases
+
+
+def get_perf_recorder() -> PerfRecorder | None:
+    """
+    Get the performance recorder for the current thread.
+
+    Returns
+    -------
+    PerfRecorder | None
+        The recorder, or None if `QuaccSettings.PERF_TELEMETRY` is disabled.
+    """
+    from quacc import get_settings
+
+    if not get_settings().PERF_TELEMETRY:
+        return None
+    if not hasattr(_thread_local, "recorder"):
+        _thread_local.recorder = PerfRecorder()
+    return _thread_local.recorder
+
+
+def get_directory_size(directory: Path | str) -> int:
+    """
+    Get the total size of the files in a directory tree.
+
+    Parameters
+    ----------
+    directory
+        The directory.
+
+    Returns
+    -------
+    int
+        The total size in bytes.
+    """
+    total = 0
+    for root, _, files in os.walk(directory):
+        for file in files:
+            try:
+                total += os.stat(os.path.join(root, file)).st_size  # noqa: PTH116, PTH118
+            except OSError:
+                continue
+    return total
+
+
+def _get_rusage() -> tuple[float, float]:
+    """
+    Get the peak resident set size of this process and the CPU time of its
+    terminated child processes.
+
+    Returns
+    -------
+    float
+        The peak resident set size in MB, or NaN if unavailable.
+    float
+        The user + system CPU time of the child processes in seconds, or NaN if
+        unavailable.
+    """
+    if resource is None:
+        return float("nan"), float("nan")
+    self_usage = resource.getrusage(resource.RUSAGE_SELF)
+    child_usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    # ru_maxrss is in kB on Linux but in bytes on macOS
+    scale = 1024**2 if sys.platform == "darwin" else 1024
+    return (self_usage.ru_maxrss / scale, child_usage.ru_utime + child_usage.ru_stime)
+
+
+@contextmanager
+def perf_phase(name: str, keep: bool = True) -> Iterator[dict[str, Any]]:
+    """
+    Record the wall time, CPU time, and peak memory usage of a block of code. This
+    has no effect unless `QuaccSettings.PERF_TELEMETRY` is enabled. The phase is
+    stored in the `perf` field of the next task document and, if
+    `QuaccSettings.PERF_TRACE_FILE` is set, is appended to the trace file.
+
+    ```python
+    with perf_phase("stage_in") as record:
+        ...
+        record["nbytes"] = 1024
+    ```
+
+    Parameters
+    ----------
+    name
+        The name of the phase.
+    keep
+        Whether to keep the phase for the next task document. If False, the phase
+        is only written to the trace file.
+
+    Yields
+    ------
+    dict
+        The record of the phase, to which additional metadata (e.g. `nbytes`) can
+        be added. This is an empty dictionary if telemetry is disabled, so callers
+        can skip expensive bookkeeping with `if record: ...`.
+    """
+    recorder = get_perf_recorder()
+    if recorder is None:
+        yield {}
+        return
+
+    record: dict[str, Any] = {"name": name, "depth": recorder.depth}
+    start_wall = time.time()
+    start_perf = time.perf_counter()
+    start_cpu = time.thread_time()
+    _, start_cpu_children = _get_rusage()
+    recorder.depth += 1
+    try:
+        yield record
+    finally:
+        recorder.depth -= 1
+        if recorder.depth < recorder.finalized_depth:
+            # This phase enclosed the task document that was just finalized
+            keep = False
+            recorder.finalized_depth = recorder.depth
+        max_rss, end_cpu_children = _get_rusage()
+        record |= {
+            "start": start_wall,
+            "wall_time": time.perf_counter() - start_perf,
+            "cpu_time": time.thread_time() - start_cpu,
+            "cpu_time_children": end_cpu_children - start_cpu_children,
+            "max_rss": max_rss,
+        }
+        if keep:
+            recorder.phases.append(record)
+        _write_trace_event(record)
+
+
+def pop_perf_phases() -> list[PerfPhase] | None:
+    """
+    Take the phases recorded so far in the current thread, for inclusion in a task
+    document. Nothing is returned while an enclosing phase (other than the one
+    currently finalizing the document) is still open, so that nested schemas
+    (e.g. `Summarize.run` within `Summarize.opt`) do not claim the phases of the
+    outer one.
+
+    Returns
+    -------
+    list[PerfPhase] | None
+        The recorded phases, or None if telemetry is disabled or the document
+        being finalized is nested within another.
+    """
+    recorder = get_perf_recorder()
+    if recorder is None or recorder.depth > 1:
+        return None
+    return recorder.pop_phases()
+
+
+def _write_trace_event(record: dict[str, Any]) -> None:
+    """
+    Append a phase to `QuaccSettings.PERF_TRACE_FILE` as a Chrome trace event in JSON
+    lines format.
+
+    Parameters
+    ----------
+    record
+        The record of the phase.
+
+    Returns
+    -------
+    None
+    """
+    from quacc import get_settings
+
+    trace_file = get_settings().PERF_TRACE_FILE
+    if not trace_file:
+        return
+
+    event = {
+        "name": record["name"],
+        "ph": "X",
+        "ts": record["start"] * 1e6,
+        "dur": record["wall_time"] * 1e6,
+        "pid": os.getpid(),
+        "tid": threading.get_ident(),
+        "args": {
+            key: value
+            for key, value in record.items()
+            if key not in {"name", "start", "wall_time"}
+        },
+    }
+    try:
+        with _trace_file_lock, Path(trace_file).expanduser().open("a") as f:
+            f.write(json.dumps(event, default=str) + "\n")
+    except OSError as err:
+        LOGGER.warning(f"Could not write to the performance trace file: {err}")
+
+
+def to_chrome_trace(trace_file: Path | str, output_file: Path | str) -> None:
+    """
+    Convert a JSON lines trace file written via `QuaccSettings.PERF_TRACE_FILE` to
+    the Chrome trace format, which can be loaded in `chrome://tracing` or Perfetto.
+
+    Parameters
+    ----------
+    trace_file
+        The JSON lines trace file.
+    output_file
+        The Chrome trace file to write.
+
+    Returns
+    -------
+    None
+    """
+    with Path(trace_file).expanduser().open() as f:
+        events = [json.loads(line) for line in f if line.strip()]
+    with Path(output_file).expanduser().open("w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+
+class DynamicsProfiler:
+    """
+    Count and time the calculator calls made during each step of an ASE dynamics
+    run. The `calculate` and `get_property` methods of the calculator(s) are wrapped
+    for the duration of the run so that the number of actual calculations, the
+    time spent in them, and the fraction of property requests served from the
+    calculator's cache (i.e. where `check_state` found no changes) are known.
+    """
+
+    def __init__(self, calcs: list[Any]) -> None:
+        """
+        Initialize the DynamicsProfiler.
+
+        Parameters
+        ----------
+        calcs
+            The calculators to profile.
+
+        Returns
+        -------
+        None
+        """
+        self.calcs = calcs
+        self.n_calls = 0
+        self.n_requests = 0
+        self.n_request_calls = 0
+        self.calc_time = 0.0
+        self.step_wall_times: list[float] = []
+        self.step_calc_times: list[float] = []
+        self.step_n_calls: list[int] = []
+        self._originals: list[tuple[Any, str, Any]] = []
+        self._start = self._last_step = time.perf_counter()
+        self._last_calc_time = 0.0
+        self._last_n_calls = 0
+
+    def __enter__(self) -> Self:
+        for calc in self.calcs:
+            for name, wrapper in [
+                ("calculate", self._wrap_calculate),
+                ("get_property", self._wrap_get_property),
+            ]:
+                if not callable(getattr(calc, name, None)):
+                    continue
+                self._originals.append((calc, name, vars(calc).get(name)))
+                setattr(calc, name, wrapper(getattr(calc, name)))
+        self._start = self._last_step = time.perf_counter()
+        return self
+
+    def __exit__(self, *args) -> None:
+        for calc, name, original in reversed(self._originals):
+            if original is None:
+                delattr(calc, name)
+            else:
+                setattr(calc, name, original)
+        self._originals = []
+
+    def _wrap_calculate(self, calculate: Callable) -> Callable:
+        def calculate_wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return calculate(*args, **kwargs)
+            finally:
+                self.calc_time += time.perf_counter() - start
+                self.n_calls += 1
+
+        return calculate_wrapper
+
+    def _wrap_get_property(self, get_property: Callable) -> Callable:
+        def get_property_wrapper(*args, **kwargs):
+            n_calls = self.n_calls
+            try:
+                return get_property(*args, **kwargs)
+            finally:
+                self.n_requests += 1
+                self.n_request_calls += self.n_calls > n_calls
+
+        return get_property_wrapper
+
+    def step(self) -> None:
+        """
+        Record the time and calculator calls since the previous step. This is meant to
+        be attached to the dynamics object as an observer.
+
+        Returns
+        -------
+        None
+        """
+        now = time.perf_counter()
+        self.step_wall_times.append(now - self._last_step)
+        self.step_calc_times.append(self.calc_time - self._last_calc_time)
+        self.step_n_calls.append(self.n_calls - self._last_n_calls)
+        self._last_step = now
+        self._last_calc_time = self.calc_time
+        self._last_n_calls = self.n_calls
+
+    def as_dict(self) -> PerfOpt:
+        """
+        Summarize the profiled run.
+
+        Returns
+        -------
+        PerfOpt
+            The per-step and total timings and calculator call counts.
+        """
+        total_time = self._last_step - self._start
+        return {
+            "n_steps": len(self.step_wall_times),
+            "n_calls": self.n_calls,
+            "n_requests": self.n_requests,
+            "cache_hit_rate": (
+                1 - self.n_request_calls / self.n_requests if self.n_requests else None
+            ),
+            "total_time": total_time,
+            "calc_time": self.calc_time,
+            "optimizer_time": total_time - sum(self.step_calc_times),
+            "step_wall_times": self.step_wall_times,
+            "step_calc_times": self.step_calc_times,
+            "step_n_calls": self.step_n_calls,
+        }
+
+
+@contextmanager
+def profile_dynamics(dyn: Any, calcs: Any | list[Any]) -> Iterator[None]:
+    """
+    Profile the calculator calls made during each step of an ASE dynamics run. This
+    has no effect unless `QuaccSettings.PERF_TELEMETRY` is enabled, in which case the
+    results are stored in `dyn.perf_opt` when the run finishes.
+
+    Parameters
+    ----------
+    dyn
+        The ASE dynamics object.
+    calcs
+        The calculator(s) used by the dynamics object.
+
+    Yields
+    ------
+    None
+    """
+    if get_perf_recorder() is None:
+        yield
+        return
+
+    with DynamicsProfiler(calcs if isinstance(calcs, list) else [calcs]) as profiler:
+        dyn.attach(profiler.step)
+        try:
+            yield
+        finally:
+            dyn.perf_opt = profiler.as_dict()
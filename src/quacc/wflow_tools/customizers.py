@@ -78,6 +78,10 @@ def strip_decorator(func: Callable) -> Callable:
         if isinstance(func, Task):
             func = func.func
 
+    elif settings.WORKFLOW_ENGINE == "local":
+        if hasattr(func, "__wrapped__"):
+            func = func.__wrapped__
+
     return func
 
 
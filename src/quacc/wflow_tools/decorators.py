@@ -21,9 +21,9 @@ def job(_func: Callable[..., Any] | None = None, **kwargs) -> Job:
     Decorator for individual compute jobs. This is a `#!Python @job` decorator. Think of
     each `#!Python @job`-decorated function as an individual SLURM job, if that helps.
 
-    | Quacc | Covalent      | Parsl        | Dask      | Prefect | Redun  | Jobflow |
-    | ----- | ------------- | ------------ | --------- | ------- | ------ | ------- |
-    | `job` | `ct.electron` | `python_app` | `delayed` | `task`  | `task` | `job`   |
+    | Quacc | Covalent      | Parsl        | Dask      | Prefect | Redun  | Jobflow | Local    |
+    | ----- | ------------- | ------------ | --------- | ------- | ------ | ------- | -------- |
+    | `job` | `ct.electron` | `python_app` | `delayed` | `task`  | `task` | `job`   | `submit` |
 
     All `#!Python @job`-decorated functions are transformed into their corresponding
     decorator.
@@ -126,12 +126,27 @@ def job(_func: Callable[..., Any] | None = None, **kwargs) -> Job:
         add(1, 2)
         ```
 
+    === "Local"
+
+        ```python
+        from concurrent.futures import ThreadPoolExecutor
+
+
+        def add(a, b):
+            return a + b
+
+
+        with ThreadPoolExecutor() as executor:
+            executor.submit(add, 1, 2)
+        ```
+
     Parameters
     ----------
     _func
         The function to decorate. This is not meant to be supplied by the user.
     **kwargs
-        Keyword arguments to pass to the workflow engine decorator.
+        Keyword arguments to pass to the workflow engine decorator. For the local
+        workflow engine, `slots` sets the number of workers the job occupies.
 
     Returns
     -------
@@ -189,6 +204,16 @@ def job(_func: Callable[..., Any] | None = None, **kwargs) -> Job:
             return wrapper
         else:
             return task(_func, **kwargs)
+    elif settings.WORKFLOW_ENGINE == "local":
+        from quacc.wflow_tools.local_engine import get_local_engine
+
+        slots = kwargs.pop("slots", 1)
+
+        @wraps(_func)
+        def wrapper(*f_args, **f_kwargs):
+            return get_local_engine().submit(_func, f_args, f_kwargs, slots=slots)
+
+        return wrapper
     else:
         return _func
 
@@ -198,9 +223,9 @@ def flow(_func: Callable[..., Any] | None = None, **kwargs) -> Flow:
     Decorator for workflows, which consist of at least one compute job. This is a
     `#!Python @flow` decorator.
 
-    | Quacc  | Covalent     | Parsl     | Dask      | Prefect | Redun  | Jobflow   |
-    | ------ | ------------ | --------- | --------- | ------- | ------ | --------- |
-    | `flow` | `ct.lattice` | No effect | No effect | `flow`  | `task` | No effect |
+    | Quacc  | Covalent     | Parsl     | Dask      | Prefect | Redun  | Jobflow   | Local    |
+    | ------ | ------------ | --------- | --------- | ------- | ------ | --------- | -------- |
+    | `flow` | `ct.lattice` | No effect | No effect | `flow`  | `task` | No effect | `submit` |
 
     All `#!Python @flow`-decorated functions are transformed into their corresponding
     decorator.
@@ -352,6 +377,8 @@ def flow(_func: Callable[..., Any] | None = None, **kwargs) -> Flow:
         return task(_func, namespace=_func.__module__, **kwargs)
     elif settings.WORKFLOW_ENGINE == "prefect":
         return _get_prefect_wrapped_flow(_func, settings, **kwargs)
+    elif settings.WORKFLOW_ENGINE == "local":
+        return _get_local_wrapped_flow(_func)
     else:
         return _func
 
@@ -360,9 +387,9 @@ def subflow(_func: Callable[..., Any] | None = None, **kwargs) -> Subflow:
     """
     Decorator for (dynamic) sub-workflows. This is a `#!Python @subflow` decorator.
 
-    | Quacc     | Covalent                  | Parsl      | Dask      | Prefect | Redun  | Jobflow   |
-    | --------- | ------------------------- | ---------- | --------- | ------- |------- | --------- |
-    | `subflow` | `ct.electron(ct.lattice)` | `join_app` | `delayed` | `flow`  | `task` | No effect |
+    | Quacc     | Covalent                  | Parsl      | Dask      | Prefect | Redun  | Jobflow   | Local    |
+    | --------- | ------------------------- | ---------- | --------- | ------- |------- | --------- | -------- |
+    | `subflow` | `ct.electron(ct.lattice)` | `join_app` | `delayed` | `flow`  | `task` | No effect | `submit` |
 
     All `#!Python @subflow`-decorated functions are transformed into their corresponding
     decorator.
@@ -585,10 +612,37 @@ def subflow(_func: Callable[..., Any] | None = None, **kwargs) -> Subflow:
         from redun import task
 
         return task(_func, namespace=_func.__module__, **kwargs)
+    elif settings.WORKFLOW_ENGINE == "local":
+        return _get_local_wrapped_flow(_func)
     else:
         return _func
 
 
+def _get_local_wrapped_flow(func: Callable) -> Callable:
+    """
+    Wrap a `#!Python @flow` or `#!Python @subflow` for the local workflow engine.
+    Calling the wrapped function returns a `LocalFuture` that resolves once all
+    the jobs returned by the function have resolved.
+
+    Parameters
+    ----------
+    func
+        The function to wrap.
+
+    Returns
+    -------
+    callable
+        The wrapped function.
+    """
+    from quacc.wflow_tools.local_engine import get_local_engine
+
+    @wraps(func)
+    def wrapper(*f_args, **f_kwargs):
+        return get_local_engine().submit_subflow(func, f_args, f_kwargs)
+
+    return wrapper
+
+
 def _get_parsl_wrapped_func(
     func: Callable, decorator_kwargs: dict[str, Any]
 ) -> Callable:
@@ -1,37 +1,146 @@
 from __future__ import annotations
 
+import heapq
 import itertools
 from typing import TYPE_CHECKING
 
-from quacc.wflow_tools.customizers import strip_decorator
-from quacc.wflow_tools.decorators import job
+from quacc.wflow_tools.customizers import redecorate, strip_decorator
+from quacc.wflow_tools.decorators import job, subflow
 
 if TYPE_CHECKING:
     from collections.abc import Callable
-    from typing import Any
+    from typing import Any, Literal
+
+    from ase.atoms import Atoms
+
+
+def estimate_cost(
+    item: Atoms | dict[str, Any],
+    method: Literal["dft", "mlp"] = "dft",
+    kppa: float = 1000,
+) -> float:
+    """
+    A simple model of the relative cost of a calculation on a given structure,
+    for use with `partition`.
+
+    For DFT, the cost is taken to scale as natoms^3 * nkpts, where the number of
+    k-points is estimated as `kppa / natoms` (at least 1) for periodic systems and
+    1 for molecules. For machine-learned potentials, the cost scales as natoms.
+
+    Parameters
+    ----------
+    item
+        The Atoms object, or a dictionary with an "atoms" key (e.g. a quacc schema).
+    method
+        The type of calculation to estimate the cost for.
+    kppa
+        The number of k-points per reciprocal atom, used for periodic DFT systems.
+
+    Returns
+    -------
+    float
+        The estimated relative cost.
+    """
+    atoms = item["atoms"] if isinstance(item, dict) else item
+    natoms = len(atoms)
+    if method == "mlp":
+        return float(natoms)
+    if method == "dft":
+        nkpts = max(1.0, kppa / max(natoms, 1)) if atoms.pbc.any() else 1.0
+        return float(natoms) ** 3 * nkpts
+    raise ValueError(f"Unknown method: {method}. Must be 'dft' or 'mlp'.")
+
+
+def _get_partition_indices(
+    num_items: int,
+    num_partitions: int,
+    costs: list[float] | Callable[[Any], float] | None = None,
+    list_to_partition: list | None = None,
+) -> list[list[int]]:
+    """
+    Get the indices of the items in each partition.
+
+    Without costs, the items are split into contiguous chunks of roughly equal
+    length. With costs, the items are distributed with the greedy longest-processing-time
+    (LPT) heuristic: items are taken from most to least expensive and each is placed in
+    the partition with the lowest total cost so far. The result is deterministic for a
+    given set of costs, and the indices within each partition are kept in their
+    original order.
+
+    Parameters
+    ----------
+    num_items
+        The number of items to partition.
+    num_partitions
+        The number of partitions.
+    costs
+        The cost of each item, or a function that returns the cost of an item.
+    list_to_partition
+        The items, which are only needed if `costs` is a function.
+
+    Returns
+    -------
+    list[list[int]]
+        The indices of the items in each partition.
+    """
+    if costs is None:
+        k, m = divmod(num_items, num_partitions)
+        return [
+            list(range(i * k + min(i, m), (i + 1) * k + min(i + 1, m)))
+            for i in range(num_partitions)
+        ]
+
+    if callable(costs):
+        costs = [costs(item) for item in list_to_partition]
+    if len(costs) != num_items:
+        raise ValueError(
+            f"The number of costs ({len(costs)}) must match the number of items ({num_items})."
+        )
+
+    loads = [(0.0, i) for i in range(num_partitions)]
+    indices: list[list[int]] = [[] for _ in range(num_partitions)]
+    for idx in sorted(range(num_items), key=lambda j: (-costs[j], j)):
+        load, i = heapq.heappop(loads)
+        indices[i].append(idx)
+        heapq.heappush(loads, (load + costs[idx], i))
+    return [sorted(partition_indices) for partition_indices in indices]
 
 
 @job
-def partition(list_to_partition: list, num_partitions: int) -> list[Any]:
+def partition(
+    list_to_partition: list,
+    num_partitions: int,
+    costs: list[float] | Callable[[Any], float] | None = None,
+) -> list[Any]:
     """
     Given a list, partition it into n roughly equal lists
 
+    If `costs` are provided, the partitions are instead balanced by their total cost
+    via greedy longest-processing-time bin packing so that a few expensive items do
+    not all end up in the same partition. To partition several lists consistently
+    (e.g. for use with `map_partitioned_lists`), pass the same list of costs for each.
+
     Parameters
     ----------
     list_to_partition
         the list to partition
     num_partitions
         the number of partitions to output
+    costs
+        The relative cost of each item, or a function that returns the cost of an
+        item (e.g. `estimate_cost`). If None, items are split into contiguous chunks
+        of equal length.
 
     Returns
     -------
     list[Any]
         n lists constructed from a
     """
-    k, m = divmod(len(list_to_partition), num_partitions)
     return [
-        list_to_partition[i * k + min(i, m) : (i + 1) * k + min(i + 1, m)]
-        for i in range(num_partitions)
+        [list_to_partition[idx] for idx in partition_indices]
+        for partition_indices in _get_partition_indices(
+            len(list_to_partition), num_partitions, costs, list_to_partition
+        )
     ]
 
 
@@ -39,6 +148,7 @@ def map_partitioned_lists(
     func: Callable,
     num_partitions: int,
     unmapped_kwargs: dict[str, Any] | None = None,
+    dynamic: bool = False,
     **mapped_kwargs: list[list[Any]],
 ) -> list[Any]:
     """
@@ -88,6 +198,11 @@ def map_partitioned_lists(
         the length of each kwarg in mapped_kwargs
     unmapped_kwargs
         Dictionary of kwargs to pass to func that shouldn't be mapped
+    dynamic
+        If True and the local workflow engine is used, each element is submitted as
+        its own job so that workers that finish early pick up the remaining work
+        rather than each partition being run start-to-finish by a single worker.
+        This has no effect for other workflow engines.
     mapped_kwargs
         kwargs of the form key=list[...] that should be mapped over
 
@@ -97,9 +212,15 @@ def map_partitioned_lists(
         list of results from calling func(**(mapped_kwargs | unmapped_kwargs)) for each
         kwargs in mapped_kwargs
     """
+    from quacc import get_settings
 
+    mapper = (
+        map_partition_dynamic
+        if dynamic and get_settings().WORKFLOW_ENGINE == "local"
+        else map_partition
+    )
     return [
-        map_partition(
+        mapper(
             strip_decorator(func),
             unmapped_kwargs=unmapped_kwargs,
             **{k: mapped_kwargs[k][i] for k in mapped_kwargs},
@@ -133,6 +254,112 @@ def map_partition(
     return kwarg_map(func, unmapped_kwargs=unmapped_kwargs, **mapped_kwargs)
 
 
+@subflow
+def map_partition_dynamic(
+    func: Callable, unmapped_kwargs: dict[str, Any] | None = None, **mapped_kwargs
+) -> list[Any]:
+    """
+    Subflow to apply a function to each set of elements in mapped_kwargs, with each
+    call submitted as its own job.
+
+    Parameters
+    ----------
+    func
+        The function to map.
+    unmapped_kwargs
+        Dictionary of kwargs to pass to func that shouldn't be mapped
+    mapped_kwargs
+        kwargs of the form key=list[...] that should be mapped over
+
+    Returns
+    -------
+    list[Any]
+        list of results from calling func(**mapped_kwargs, **unmapped_kwargs) for each
+        kwargs in mapped_kwargs
+    """
+    return kwarg_map(job(func), unmapped_kwargs=unmapped_kwargs, **mapped_kwargs)
+
+
+def map_batched(
+    func: Callable,
+    batch_size: int,
+    unmapped_kwargs: dict[str, Any] | None = None,
+    decorator: Callable | None = None,
+    **mapped_kwargs: list[Any],
+) -> list[Any]:
+    """
+    Apply func to each element of the mapped kwargs, coalescing the calls into
+    batches that each run as a single `map_partition` job. This amortizes the
+    per-task overhead of the workflow engine for very fast jobs (e.g. EMT or LJ
+    calculations), while still returning one (future) result per element, in order.
+
+    For example:
+
+    ```python
+    @job
+    def add(a, b):
+        return a + b
+
+
+    @flow
+    def workflow():
+        return map_batched(add, 64, unmapped_kwargs={"b": 1}, a=list(range(1000)))
+    ```
+
+    will launch 16 jobs instead of 1000.
+
+    Each call of `func` runs inside its batch job, so `func` is stripped of its own
+    decorator, including one applied via `job_decorators`. Use `decorator` to
+    customize the batch jobs instead.
+
+    Parameters
+    ----------
+    func
+        The function to map.
+    batch_size
+        The maximum number of calls to run in each job.
+    unmapped_kwargs
+        Dictionary of kwargs to pass to func that shouldn't be mapped
+    decorator
+        The decorator to apply to each batch job, e.g. `job(executor="gpu")`. If
+        None, the plain `#!Python @job` decorator is used.
+    mapped_kwargs
+        kwargs of the form key=list[...] that should be mapped over. These must be
+        concrete lists (not the unresolved output of a job), since the number of
+        batches is set when the workflow is constructed.
+
+    Returns
+    -------
+    list[Any]
+        list of results from calling func(**mapped_kwargs, **unmapped_kwargs) for each
+        kwargs in mapped_kwargs
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, not {batch_size}.")
+
+    if not mapped_kwargs:
+        raise ValueError("At least one mapped kwarg must be provided.")
+
+    all_lens = [len(v) for v in mapped_kwargs.values()]
+    n_elements = all_lens[0]
+    if not all(n_elements == le for le in all_lens):
+        raise AssertionError(f"Inconsistent lengths: {all_lens}")
+
+    func = strip_decorator(func)
+    batch_job = (
+        map_partition if decorator is None else redecorate(map_partition, decorator)
+    )
+    results = []
+    for start in range(0, n_elements, batch_size):
+        batch = batch_job(
+            func,
+            unmapped_kwargs=unmapped_kwargs,
+            **{k: v[start : start + batch_size] for k, v in mapped_kwargs.items()},
+        )
+        results.extend(batch[i] for i in range(min(batch_size, n_elements - start)))
+    return results
+
+
 def kwarg_map(
     func: Callable, unmapped_kwargs: dict[str, Any] | None = None, **mapped_kwargs
 ) -> list[Any]:
@@ -170,7 +397,11 @@ def kwarg_map(
 
 
 @job
-def unpartition(lists_to_combine: list[list[Any]]) -> list[Any]:
+def unpartition(
+    lists_to_combine: list[list[Any]],
+    costs: list[float] | Callable[[Any], float] | None = None,
+    list_to_partition: list | None = None,
+) -> list[Any]:
     """
     Given a partitioned list (list of lists), recombine
     it to a single list
@@ -179,10 +410,32 @@ def unpartition(lists_to_combine: list[list[Any]]) -> list[Any]:
     ----------
     lists_to_combine
         the list of lists to recombine
+    costs
+        The costs that were passed to `partition`, if any. This can be the list of
+        costs or the same function (e.g. `estimate_cost`). They are used to restore
+        the original order of the items.
+    list_to_partition
+        The list that was passed to `partition`. This is only needed if `costs` is
+        a function.
 
     Returns
     -------
     list[Any]
         a single recombined list
     """
-    return list(itertools.chain(*lists_to_combine))
+    if costs is None:
+        return list(itertools.chain(*lists_to_combine))
+    if callable(costs) and list_to_partition is None:
+        raise ValueError(
+            "The list that was partitioned must be provided if `costs` is a function."
+        )
+
+    num_items = sum(len(items) for items in lists_to_combine)
+    all_indices = _get_partition_indices(
+        num_items, len(lists_to_combine), costs, list_to_partition
+    )
+    combined = [None] * num_items
+    for partition_indices, items in zip(all_indices, lists_to_combine, strict=True):
+        for idx, item in zip(partition_indices, items, strict=True):
+            combined[idx] = item
+    return combined
@@ -0,0 +1,602 @@
+"""A lightweight, built-in workflow engine based on `concurrent.futures`."""
+
+from __future__ import annotations
+
+import os
+import pickle
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from importlib import import_module
+from logging import getLogger
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any, Literal
+
+LOGGER = getLogger(__name__)
+
+
+class LocalFuture:
+    """
+    A reference to the eventual result of a `#!Python @job` or `#!Python @subflow`
+    run with the local workflow engine. It can be passed directly to other jobs,
+    which will wait for it to resolve, or indexed to obtain a new `LocalFuture`
+    for a subset of the result.
+    """
+
+    __slots__ = ("_future",)
+
+    def __init__(self, future: Future | None = None) -> None:
+        """
+        Initialize the LocalFuture.
+
+        Parameters
+        ----------
+        future
+            The underlying `concurrent.futures.Future`. A new one is made if not
+            provided.
+
+        Returns
+        -------
+        None
+        """
+        self._future = future or Future()
+
+    def __getitem__(self, key: Any) -> LocalFuture:
+        child = LocalFuture()
+
+        def _set_item(parent: Future) -> None:
+            try:
+                child._future.set_result(parent.result()[key])
+            except Exception as exception:
+                child._future.set_exception(exception)
+
+        self._future.add_done_callback(_set_item)
+        return child
+
+    def __repr__(self) -> str:
+        return f"LocalFuture({self._future!r})"
+
+    def result(self, timeout: float | None = None) -> Any:
+        """
+        Block until the result is available and return it.
+
+        Parameters
+        ----------
+        timeout
+            Number of seconds to wait. If None, there is no limit.
+
+        Returns
+        -------
+        Any
+            The result of the job, with any nested futures resolved.
+        """
+        return resolve_local_futures(self._future.result(timeout=timeout))
+
+    def done(self) -> bool:
+        """
+        Whether the job has finished (successfully or not).
+
+        Returns
+        -------
+        bool
+            True if the job has finished.
+        """
+        return self._future.done()
+
+    def exception(self, timeout: float | None = None) -> BaseException | None:
+        """
+        Block until the job is finished and return the exception it raised, if any.
+
+        Parameters
+        ----------
+        timeout
+            Number of seconds to wait. If None, there is no limit.
+
+        Returns
+        -------
+        BaseException | None
+            The raised exception, or None if the job was successful.
+        """
+        return self._future.exception(timeout=timeout)
+
+    def add_done_callback(self, fn: Callable[[LocalFuture], Any]) -> None:
+        """
+        Call `fn` with this future once it has finished.
+
+        Parameters
+        ----------
+        fn
+            The callback.
+
+        Returns
+        -------
+        None
+        """
+        self._future.add_done_callback(lambda _: fn(self))
+
+
+def resolve_local_futures(expr: Any) -> Any:
+    """
+    Recursively replace every `LocalFuture` in a list, tuple, set, or dictionary
+    with its result. This will block until all the futures are resolved.
+
+    Parameters
+    ----------
+    expr
+        The object to resolve.
+
+    Returns
+    -------
+    Any
+        The object with all futures replaced by their results.
+    """
+    if isinstance(expr, LocalFuture):
+        return expr.result()
+    if isinstance(expr, list | tuple | set):
+        return type(expr)(resolve_local_futures(item) for item in expr)
+    if isinstance(expr, dict):
+        return {
+            resolve_local_futures(key): resolve_local_futures(value)
+            for key, value in expr.items()
+        }
+    return expr
+
+
+def _find_local_futures(expr: Any) -> list[LocalFuture]:
+    """
+    Recursively find every `LocalFuture` in a list, tuple, set, or dictionary.
+
+    Parameters
+    ----------
+    expr
+        The object to search.
+
+    Returns
+    -------
+    list[LocalFuture]
+        The futures that were found.
+    """
+    if isinstance(expr, LocalFuture):
+        return [expr]
+    if isinstance(expr, list | tuple | set):
+        return [future for item in expr for future in _find_local_futures(item)]
+    if isinstance(expr, dict):
+        return [
+            future
+            for item in expr.items()
+            for future in _find_local_futures(list(item))
+        ]
+    return []
+
+
+class _FunctionReference:
+    """
+    A picklable reference to a `#!Python @job`-decorated function defined at the
+    top level of a module. The decorated function is re-imported in the worker
+    process and unwrapped, since the undecorated function cannot be pickled by
+    name when the module attribute refers to the decorated one.
+    """
+
+    __slots__ = ("module", "qualname")
+
+    def __init__(self, func: Callable) -> None:
+        self.module = func.__module__
+        self.qualname = func.__qualname__
+
+    def __call__(self, *args, **kwargs) -> Any:
+        func = import_module(self.module)
+        for name in self.qualname.split("."):
+            func = getattr(func, name)
+        return getattr(func, "__wrapped__", func)(*args, **kwargs)
+
+
+def _run_job(
+    func: Callable, args: tuple, kwargs: dict[str, Any], overrides: dict[str, Any]
+) -> Any:
+    """
+    Run a job in a worker, applying the settings that were active when it was
+    submitted.
+
+    Parameters
+    ----------
+    func
+        The function to run.
+    args
+        Positional arguments to the function.
+    kwargs
+        Keyword arguments to the function.
+    overrides
+        Settings changes (e.g. from `change_settings`) to apply while running.
+
+    Returns
+    -------
+    Any
+        The result of the function.
+    """
+    from quacc import change_settings
+
+    if overrides:
+        with change_settings(overrides):
+            return func(*args, **kwargs)
+    return func(*args, **kwargs)
+
+
+def _get_settings_overrides() -> dict[str, Any]:
+    """
+    Get the settings that were changed in the current thread.
+
+    Returns
+    -------
+    dict
+        The overridden settings.
+    """
+    from quacc import _thread_local, get_settings
+
+    get_settings()
+    return {
+        key: value
+        for key, value in _thread_local.overrides.items()
+        if key != "WORKFLOW_ENGINE"
+    }
+
+
+@dataclass
+class _Task:
+    """A job waiting for its dependencies and/or free resource slots."""
+
+    func: Callable
+    args: tuple
+    kwargs: dict[str, Any]
+    slots: int
+    overrides: dict[str, Any]
+    future: LocalFuture = field(default_factory=LocalFuture)
+    use_threads: bool = False
+
+
+class LocalEngine:
+    """
+    Schedule jobs on a local `ThreadPoolExecutor` or `ProcessPoolExecutor`.
+
+    Jobs are started once all of the `LocalFuture` objects in their arguments have
+    resolved and once enough resource slots are free. The total number of slots is
+    equal to the number of workers, and each job requests one slot by default.
+    Subflows are run in their own lightweight orchestration threads so that they
+    never occupy a worker.
+    """
+
+    def __init__(
+        self,
+        executor: Literal["thread", "process"] = "thread",
+        max_workers: int | None = None,
+    ) -> None:
+        """
+        Initialize the LocalEngine.
+
+        Parameters
+        ----------
+        executor
+            Whether jobs are run in a pool of threads or processes.
+        max_workers
+            The number of workers, which is also the number of resource slots.
+            Defaults to the number of CPUs.
+
+        Returns
+        -------
+        None
+        """
+        if executor not in {"thread", "process"}:
+            msg = f"Unknown executor: {executor}. Must be 'thread' or 'process'."
+            raise ValueError(msg)
+        self.executor = executor
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._lock = threading.Lock()
+        self._free_slots = self.max_workers
+        self._queue: deque[_Task] = deque()
+        self._thread_pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="quacc-local"
+        )
+        self._process_pool = (
+            ProcessPoolExecutor(max_workers=self.max_workers)
+            if executor == "process"
+            else None
+        )
+
+    def submit(
+        self, func: Callable, args: tuple, kwargs: dict[str, Any], slots: int = 1
+    ) -> LocalFuture:
+        """
+        Submit a job.
+
+        Parameters
+        ----------
+        func
+            The (undecorated) function to run.
+        args
+            Positional arguments, which may contain `LocalFuture` objects.
+        kwargs
+            Keyword arguments, which may contain `LocalFuture` objects.
+        slots
+            The number of resource slots the job occupies while running. Values
+            larger than the total number of slots are capped.
+
+        Returns
+        -------
+        LocalFuture
+            A future for the result of the job.
+        """
+        if slots < 1:
+            msg = f"A job must request at least one slot, not {slots}."
+            raise ValueError(msg)
+        task = _Task(
+            func=func,
+            args=args,
+            kwargs=kwargs,
+            slots=min(slots, self.max_workers),
+            overrides=_get_settings_overrides(),
+        )
+        if self._process_pool is not None:
+            task.func, task.use_threads = self._get_process_func(func)
+        self._when_resolved(task, self._enqueue)
+        return task.future
+
+    def submit_subflow(
+        self, func: Callable, args: tuple, kwargs: dict[str, Any]
+    ) -> LocalFuture:
+        """
+        Submit a subflow. It is run in a separate orchestration thread once its
+        arguments have resolved, and its future resolves once all of the jobs it
+        returns have resolved.
+
+        Parameters
+        ----------
+        func
+            The (undecorated) subflow function.
+        args
+            Positional arguments, which may contain `LocalFuture` objects.
+        kwargs
+            Keyword arguments, which may contain `LocalFuture` objects.
+
+        Returns
+        -------
+        LocalFuture
+            A future for the result of the subflow.
+        """
+        task = _Task(
+            func=func,
+            args=args,
+            kwargs=kwargs,
+            slots=0,
+            overrides=_get_settings_overrides(),
+        )
+
+        def _orchestrate() -> None:
+            try:
+                result = _run_job(
+                    task.func,
+                    resolve_local_futures(task.args),
+                    resolve_local_futures(task.kwargs),
+                    task.overrides,
+                )
+                task.future._future.set_result(resolve_local_futures(result))
+            except Exception as exception:
+                task.future._future.set_exception(exception)
+
+        self._when_resolved(
+            task,
+            lambda _: threading.Thread(
+                target=_orchestrate, name="quacc-local-subflow", daemon=True
+            ).start(),
+        )
+        return task.future
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shut down the worker pools.
+
+        Parameters
+        ----------
+        wait
+            Whether to wait for running jobs to finish.
+
+        Returns
+        -------
+        None
+        """
+        self._thread_pool.shutdown(wait=wait)
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=wait)
+
+    @staticmethod
+    def _when_resolved(task: _Task, callback: Callable[[_Task], None]) -> None:
+        """
+        Call `callback(task)` once all futures in the task's arguments resolve. If any
+        of them fail, the task fails with the same exception without being run.
+
+        Parameters
+        ----------
+        task
+            The task.
+        callback
+            The function to call.
+
+        Returns
+        -------
+        None
+        """
+        dependencies = _find_local_futures((task.args, task.kwargs))
+        if not dependencies:
+            callback(task)
+            return
+
+        lock = threading.Lock()
+        remaining = [len(dependencies)]
+
+        def _on_dependency_done(dependency: LocalFuture) -> None:
+            exception = dependency.exception()
+            with lock:
+                if task.future.done():
+                    return
+                if exception is not None:
+                    task.future._future.set_exception(exception)
+                    return
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            callback(task)
+
+        for dependency in dependencies:
+            dependency.add_done_callback(_on_dependency_done)
+
+    def _enqueue(self, task: _Task) -> None:
+        """
+        Queue a task whose dependencies have resolved and start whatever fits.
+
+        Parameters
+        ----------
+        task
+            The task.
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            self._queue.append(task)
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """
+        Start queued tasks, in order, for as long as there are enough free slots.
+
+        Returns
+        -------
+        None
+        """
+        to_start = []
+        with self._lock:
+            while self._queue and self._queue[0].slots <= self._free_slots:
+                task = self._queue.popleft()
+                self._free_slots -= task.slots
+                to_start.append(task)
+        for task in to_start:
+            self._start(task)
+
+    def _start(self, task: _Task) -> None:
+        """
+        Send a task to a worker pool.
+
+        Parameters
+        ----------
+        task
+            The task.
+
+        Returns
+        -------
+        None
+        """
+        pool = (
+            self._thread_pool
+            if self._process_pool is None or task.use_threads
+            else self._process_pool
+        )
+        try:
+            future = pool.submit(
+                _run_job,
+                task.func,
+                resolve_local_futures(task.args),
+                resolve_local_futures(task.kwargs),
+                task.overrides,
+            )
+        except Exception as exception:
+            self._finish(task, None, exception)
+            return
+        future.add_done_callback(lambda f: self._finish(task, f))
+
+    def _finish(
+        self, task: _Task, future: Future | None, exception: Exception | None = None
+    ) -> None:
+        """
+        Release the task's slots, record its outcome, and start queued tasks.
+
+        Parameters
+        ----------
+        task
+            The task.
+        future
+            The finished future from the worker pool.
+        exception
+            An exception raised before the task could be run.
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            self._free_slots += task.slots
+        if future is not None:
+            exception = future.exception()
+        if exception is not None:
+            task.future._future.set_exception(exception)
+        else:
+            task.future._future.set_result(future.result())
+        self._dispatch()
+
+    @staticmethod
+    def _get_process_func(func: Callable) -> tuple[Callable, bool]:
+        """
+        Get a version of `func` that can be sent to a worker process.
+
+        Parameters
+        ----------
+        func
+            The function to run.
+
+        Returns
+        -------
+        Callable
+            The function or a picklable reference to it.
+        bool
+            Whether the function must instead be run in a thread because it
+            cannot be pickled (e.g. it was defined inside another function).
+        """
+        try:
+            pickle.dumps(func)
+        except Exception:
+            qualname = getattr(func, "__qualname__", "<locals>")
+            module = getattr(func, "__module__", "__main__")
+            if "<locals>" in qualname or module == "__main__":
+                LOGGER.debug(f"{func} cannot be pickled, so it will run in a thread.")
+                return func, True
+            return _FunctionReference(func), False
+        return func, False
+
+
+_engine: LocalEngine | None = None
+_engine_lock = threading.Lock()
+
+
+def get_local_engine() -> LocalEngine:
+    """
+    Get the process-wide local workflow engine, creating it on first use based on
+    the `LOCAL_EXECUTOR` and `LOCAL_MAX_WORKERS` settings.
+
+    Returns
+    -------
+    LocalEngine
+        The local workflow engine.
+    """
+    global _engine  # noqa: PLW0603
+
+    from quacc import get_settings
+
+    with _engine_lock:
+        if _engine is None:
+            settings = get_settings()
+            _engine = LocalEngine(
+                executor=settings.LOCAL_EXECUTOR, max_workers=settings.LOCAL_MAX_WORKERS
+            )
+        return _engine
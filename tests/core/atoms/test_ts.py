@@ -14,7 +14,12 @@ from importlib.util import find_spec
 from ase.atoms import Atoms
 from ase.build import molecule
 
-from quacc.atoms.ts import geodesic_interpolate_wrapper
+from quacc.atoms.ts import (
+    geodesic_interpolate_batch,
+    geodesic_interpolate_wrapper,
+    get_cartesian_hessian,
+    get_hessian_function,
+)
 
 has_geodesic_interpolate = bool(find_spec("geodesic_interpolate"))
 
@@ -81,3 +86,59 @@ def test_geodesic_interpolate_wrapper_large_system(setup_test_environment):
     # Test with large system to trigger sweeping updates
     smoother_path = geodesic_interpolate_wrapper(molecule("C60"), molecule("C60"))
     assert len(smoother_path) == 10
+
+
+@pytest.mark.skipif(
+    not has_geodesic_interpolate,
+    reason="geodesic_interpolate function is not available",
+)
+def test_geodesic_interpolate_batch(setup_test_environment):
+    from quacc.atoms.ts import _GEODESIC_CACHE
+
+    _GEODESIC_CACHE.clear()
+    reactant, product = setup_test_environment
+
+    paths = geodesic_interpolate_batch(
+        [(reactant, product), (product, reactant), (reactant, product)],
+        max_workers=2,
+        n_images=10,
+    )
+    assert len(paths) == 3
+    assert len(_GEODESIC_CACHE) == 2
+    assert [len(path) for path in paths] == [10, 10, 10]
+    assert paths[0] is not paths[2]
+    for image1, image2 in zip(paths[0], paths[2], strict=True):
+        np.testing.assert_array_equal(image1.positions, image2.positions)
+
+    reference_path = geodesic_interpolate_wrapper(reactant, product, n_images=10)
+    for image1, image2 in zip(paths[0], reference_path, strict=True):
+        np.testing.assert_allclose(image1.positions, image2.positions)
+
+    geodesic_interpolate_batch([(reactant, product)], n_images=10)
+    assert len(_GEODESIC_CACHE) == 2
+    geodesic_interpolate_batch([(reactant, product)], n_images=12)
+    assert len(_GEODESIC_CACHE) == 3
+
+
+def test_get_hessian_function():
+    atoms = molecule("H2O")
+    hessian = np.eye(3 * len(atoms))
+    hessian_function = get_hessian_function(atoms, hessian.tolist())
+    np.testing.assert_array_equal(hessian_function(atoms), hessian)
+
+    with pytest.raises(ValueError, match="The Hessian must have a shape of"):
+        get_hessian_function(atoms, np.eye(3))
+
+
+def test_get_cartesian_hessian():
+    atoms = molecule("H2O")
+    hessian = get_cartesian_hessian(atoms, np.eye(3 * len(atoms)).tolist())
+    assert isinstance(hessian, np.ndarray)
+    np.testing.assert_array_equal(hessian, np.eye(3 * len(atoms)))
+    hessian = get_cartesian_hessian(
+        atoms, hessian.reshape(len(atoms), 3, len(atoms), 3)
+    )
+    np.testing.assert_array_equal(hessian, np.eye(3 * len(atoms)))
+
+    with pytest.raises(ValueError, match="The Hessian must have a shape of"):
+        get_cartesian_hessian(atoms, np.eye(3))
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import json
+
+from quacc.bench import run_benchmarks, write_results
+from quacc.bench.suite import get_installed_engines, run_fanout_benchmark
+
+
+def test_run_benchmarks(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    results = run_benchmarks(select="get_atoms_id", repeat=2)
+    assert list(results["benchmarks"]) == ["get_atoms_id"]
+    benchmark = results["benchmarks"]["get_atoms_id"]
+    assert len(benchmark["times"]) == 2
+    assert 0 < benchmark["min"] <= benchmark["median"]
+    assert benchmark["number"] >= 1
+
+    write_results(results, tmp_path / "bench.json")
+    assert json.loads((tmp_path / "bench.json").read_text()) == results
+
+
+def test_run_benchmarks_settings(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    results = run_benchmarks(select="get_settings*", repeat=1)
+    assert sorted(results["benchmarks"]) == [
+        "get_settings",
+        "get_settings[new_thread]",
+        "get_settings[thread_pool]",
+    ]
+    assert all(benchmark["min"] > 0 for benchmark in results["benchmarks"].values())
+
+
+def test_run_benchmarks_summarize(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    results = run_benchmarks(select="Summarize.*", repeat=1)
+    assert sorted(results["benchmarks"]) == [
+        "Summarize.md",
+        "Summarize.opt",
+        "Summarize.run",
+    ]
+    assert not list(tmp_path.iterdir())
+
+
+def test_fanout_benchmark():
+    assert get_installed_engines()[:2] == [None, "local"]
+    for engine in [None, "local"]:
+        result = run_fanout_benchmark(engine, 5)
+        assert result["engine"] == engine
+        assert result["n_jobs"] == 5
+        assert result["total_time"] > 0
+
+    results = run_benchmarks(select="flow_fanout*", engines=["local"], n_jobs=5)
+    assert list(results["benchmarks"]) == ["flow_fanout[local]"]
+
+
+def test_fanout_benchmark_bad_engine():
+    result = run_fanout_benchmark("bad", 5)
+    assert result["engine"] == "bad"
+    assert "error" in result
@@ -1,11 +1,25 @@
 from __future__ import annotations
 
+import gzip
+import sys
 from pathlib import Path
 
 import pytest
 from ase.atoms import Atoms
+from ase.build import bulk
+from ase.calculators.emt import EMT
+from ase.calculators.espresso import EspressoProfile
+from monty.shutil import gzip_dir
 
+from quacc import change_settings
 from quacc.calculators.espresso.espresso import Espresso, EspressoTemplate
+from quacc.calculators.espresso.utils import (
+    espresso_plan_parallel,
+    get_espresso_ncores,
+    grid_copy_files,
+    link_shared_save_dirs,
+)
+from quacc.runners.ase import Runner
 
 
 def test_espresso_kwargs_handler():
@@ -164,8 +178,170 @@ def test_output_handler(tmp_path, monkeypatch):
     assert str(new_parameters["input_data"]["control"]["outdir"]) != test_path
 
 
+def test_link_shared_save_dirs(tmp_path):
+    shared = tmp_path / "shared"
+    for save_dir in ["pwscf.save", "_ph0/pwscf.save", "_ph0/pwscf.q_2/pwscf.save"]:
+        Path(shared, save_dir).mkdir(parents=True)
+        Path(shared, save_dir, "wfc1.dat").write_text("wfc")
+    Path(shared, "_ph0", "pwscf.phsave").mkdir()
+
+    outdir = tmp_path / "outdir"
+    Path(outdir, "_ph0", "pwscf.q_2").mkdir(parents=True)
+    Path(outdir, "_ph0", "pwscf.q_2", "pwscf.wfc1").write_text("local")
+    link_shared_save_dirs(shared, outdir)
+
+    assert Path(outdir, "pwscf.save").is_symlink()
+    assert Path(outdir, "_ph0", "pwscf.q_2", "pwscf.save").is_symlink()
+    assert Path(outdir, "_ph0", "pwscf.q_2", "pwscf.save", "wfc1.dat").exists()
+    assert not Path(outdir, "_ph0", "pwscf.q_2").is_symlink()
+    assert not Path(outdir, "_ph0", "pwscf.save").exists()
+    assert not Path(outdir, "_ph0", "pwscf.phsave").exists()
+
+    # Linking twice is harmless and gzipping does not touch the shared files
+    link_shared_save_dirs(shared, outdir)
+    gzip_dir(outdir)
+    assert Path(shared, "pwscf.save", "wfc1.dat").read_text() == "wfc"
+    assert Path(outdir, "_ph0", "pwscf.q_2", "pwscf.wfc1.gz").exists()
+
+    ph_input_data = {"inputph": {"lqdir": True}}
+    files = grid_copy_files(ph_input_data, shared, 2, (0.5, 0, 0), share_outdir=True)
+    assert all("phsave" in str(f) for f in files[shared])
+    files = grid_copy_files(ph_input_data, shared, 2, (0.5, 0, 0))
+    assert not all("phsave" in str(f) for f in files[shared])
+
+
+def test_espresso_plan_parallel(tmp_path):
+    assert get_espresso_ncores("mpirun -np 16") == 16
+    assert get_espresso_ncores("srun --ntasks=8 --cpus-per-task 2") == 8
+    assert get_espresso_ncores("") == 1
+
+    atoms = bulk("Si")
+    parameters = {"input_data": {"system": {"ecutwfc": 30}}, "kpts": (4, 4, 4)}
+    assert espresso_plan_parallel("pw", parameters, atoms, 1) == {}
+    assert espresso_plan_parallel("pw", parameters, atoms, 16) == {"nk": 16}
+    assert espresso_plan_parallel("pw", parameters, atoms, 48) == {"nk": 24, "nd": 1}
+    assert espresso_plan_parallel("pw", {}, atoms, 8) == {"nd": 1}
+    assert espresso_plan_parallel(
+        "pw", parameters, atoms, 16, command="mpirun -np 16 pw.x -npool 4"
+    ) == {"nd": 1}
+
+    # Many processes per pool: task groups and distributed diagonalization
+    parameters = {
+        "input_data": {"system": {"ecutwfc": 30, "nbnd": 200}},
+        "kpts": (1, 1, 1),
+    }
+    plan = espresso_plan_parallel("pw", parameters, atoms, 256)
+    assert plan["nd"] == 256
+    assert plan["nt"] > 1
+    assert 256 % plan["nt"] == 0
+
+    save_dir = tmp_path / "pwscf.save"
+    save_dir.mkdir()
+    (save_dir / "data-file-schema.xml").write_text(
+        "<band_structure><lsda>true</lsda><nks>3</nks></band_structure>"
+    )
+    ph_parameters = {"input_data": {"inputph": {"outdir": tmp_path}}}
+    assert espresso_plan_parallel("ph", ph_parameters, atoms, 12) == {"nk": 6}
+    assert espresso_plan_parallel(
+        "ph", ph_parameters | {"qpts": (0, 0, 0)}, atoms, 12
+    ) == {"nk": 6}
+    assert espresso_plan_parallel(
+        "ph", ph_parameters | {"qpts": (2, 2, 2)}, atoms, 12
+    ) == {"nk": 12}
+    assert espresso_plan_parallel("matdyn", ph_parameters, atoms, 8) == {}
+    assert (
+        espresso_plan_parallel(
+            "projwfc", {"input_data": {"projwfc": {"outdir": tmp_path / "x"}}}, atoms, 8
+        )
+        == {}
+    )
+
+
+def test_espresso_auto_parallel(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    script = tmp_path / "launcher.py"
+    script.write_text("import sys\nprint(' '.join(sys.argv[1:]))\n")
+    template = EspressoTemplate("pw")
+    profile = EspressoProfile(f"{sys.executable} {script} -np 8 pw.x", tmp_path)
+    parameters = {
+        "input_data": {"system": {"ecutwfc": 30}},
+        "pseudopotentials": {"Si": "Si.upf"},
+        "kpts": (2, 2, 2),
+    }
+
+    with change_settings({"ESPRESSO_AUTO_PARALLEL": True}):
+        template.write_input(profile, tmp_path, bulk("Si"), parameters, ["energy"])
+    assert template.parallel_flags == {"nk": 4, "nd": 1}
+
+    template.execute(tmp_path, profile)
+    assert (
+        tmp_path / "pw.out"
+    ).read_text().strip() == "-np 8 pw.x -nk 4 -nd 1 -in pw.in"
+
+
 def test_bad_calculator_params():
     atoms = Atoms(symbols="LiLaOZr")
 
     with pytest.raises(NotImplementedError, match="does not support the directory"):
         Espresso(input_atoms=atoms, kpts=(1, 1, 1), directory="bad")
+
+
+FAKE_PW = """#!{python}
+import sys
+
+from ase.calculators.emt import EMT
+from ase.calculators.socketio import SocketClient
+from ase.io import read
+
+unixsocket = sys.argv[sys.argv.index("--ipi") + 1].removesuffix(":UNIX")
+atoms = read("pw.in", format="espresso-in")
+atoms.calc = EMT()
+print("Fake pw.x started")
+SocketClient(unixsocket=unixsocket).run(atoms, use_stress=True)
+"""
+
+
+def test_espresso_socket(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    fake_pw = tmp_path / "fake_pw.py"
+    fake_pw.write_text(FAKE_PW.format(python=sys.executable))
+    fake_pw.chmod(0o755)
+
+    atoms = bulk("Cu") * (2, 1, 1)
+    atoms.rattle(0.05, seed=1)
+    with change_settings(
+        {
+            "ESPRESSO_BIN_DIR": tmp_path,
+            "ESPRESSO_BINARIES": {"pw": "fake_pw.py"},
+            "ESPRESSO_PARALLEL_CMD": "",
+        }
+    ):
+        calc = Espresso(
+            input_atoms=atoms,
+            use_socket=True,
+            pseudopotentials={"Cu": "Cu.upf"},
+            input_data={"control": {"calculation": "scf", "tstress": True}},
+        )
+        dyn = Runner(atoms, calc).run_opt(relax_cell=True, fmax=0.1)
+
+    final_atoms = dyn.atoms.atoms
+    assert calc._socket_calc is None
+    assert dyn.nsteps > 1
+    assert final_atoms.calc.results["stress"].shape == (6,)
+
+    ref_atoms = final_atoms.copy()
+    ref_atoms.calc = EMT()
+    assert final_atoms.get_potential_energy() == pytest.approx(
+        ref_atoms.get_potential_energy()
+    )
+    assert final_atoms.get_forces() == pytest.approx(ref_atoms.get_forces())
+
+    # pw.x is launched once for the whole optimization
+    pw_out = Path(dyn.trajectory.filename).parent / "pw.out.gz"
+    with gzip.open(pw_out, "rt") as f:
+        assert f.read().count("Fake pw.x started") == 1
+
+
+def test_espresso_socket_bad_binary():
+    with pytest.raises(ValueError, match=r"only supported for pw\.x"):
+        Espresso(template=EspressoTemplate("ph"), use_socket=True)
@@ -4,6 +4,7 @@ import os
 from importlib.util import find_spec
 from pathlib import Path
 
+import numpy as np
 import pytest
 from ase import units
 from ase.io import read
@@ -53,6 +54,24 @@ def test_qchem_write_input_basic(tmp_path, monkeypatch, test_atoms):
         ).write_input(test_atoms)
 
 
+def test_qchem_write_input_staged_orbitals(tmp_path, monkeypatch, test_atoms):
+    from shutil import copy
+
+    monkeypatch.chdir(tmp_path)
+    copy(FILE_DIR / "examples" / "basic" / "53.0", tmp_path / "53.0")
+    calc = QChem(
+        test_atoms,
+        rem={"basis": "def2-tzvpd", "method": "wb97x-v", "job_type": "force"},
+    )
+    calc.write_input(test_atoms)
+
+    assert calc.prev_orbital_coeffs is not None
+    assert QCInput.from_file("mol.qin").rem["scf_guess"] == "read"
+    assert (tmp_path / "53.0").read_bytes() == (
+        FILE_DIR / "examples" / "basic" / "53.0"
+    ).read_bytes()
+
+
 def test_qchem_write_input_intermediate(tmp_path, monkeypatch, test_atoms):
     monkeypatch.chdir(tmp_path)
     calc = QChem(
@@ -233,6 +252,66 @@ def test_qchem_read_results_intermediate(tmp_path, monkeypatch, test_atoms):
     assert calc.prev_orbital_coeffs is not None
 
 
+@pytest.mark.skipif(has_obabel is False, reason="openbabel needed")
+def test_qchem_read_results_deferred_taskdoc(tmp_path, monkeypatch, test_atoms):
+    monkeypatch.chdir(tmp_path)
+    calc = QChem(test_atoms, parse_taskdoc=False)
+    monkeypatch.chdir(FILE_DIR / "examples" / "intermediate")
+    calc.read_results()
+
+    assert calc.results["energy"] == pytest.approx(-605.6859554025 * units.Hartree)
+    assert calc.results["forces"][0][0] == pytest.approx(-0.6955571014353796)
+    assert calc.prev_orbital_coeffs is not None
+    assert "taskdoc" not in calc.results
+
+    calc.read_taskdoc()
+    assert calc.results["taskdoc"]["output"]["final_energy"] == pytest.approx(
+        -605.6859554025
+    )
+
+
+def test_read_qchem_scratch(tmp_path):
+    from pymatgen.io.qchem.outputs import (
+        gradient_parser,
+        hessian_parser,
+        orbital_coeffs_parser,
+    )
+
+    from quacc.calculators.qchem.io import read_qchem, write_qchem
+
+    results, prev_orbital_coeffs = read_qchem(
+        FILE_DIR / "examples" / "basic", parse_taskdoc=False
+    )
+    assert isinstance(prev_orbital_coeffs, np.ndarray)
+    np.testing.assert_array_equal(
+        prev_orbital_coeffs,
+        orbital_coeffs_parser(FILE_DIR / "examples" / "basic" / "53.0"),
+    )
+    np.testing.assert_allclose(
+        results["forces"],
+        gradient_parser(FILE_DIR / "examples" / "basic" / "131.0")
+        * (-units.Hartree / units.Bohr),
+    )
+
+    results, _ = read_qchem(
+        FILE_DIR / "examples" / "freq", parse_taskdoc=False, n_atoms=14
+    )
+    np.testing.assert_allclose(
+        results["hessian"],
+        hessian_parser(FILE_DIR / "examples" / "freq" / "132.0", n_atoms=14)
+        * (units.Hartree / units.Bohr**2),
+    )
+
+    write_qchem(
+        QCInput.from_file(FILE_DIR / "examples" / "basic" / "mol.qin"),
+        tmp_path,
+        prev_orbital_coeffs=prev_orbital_coeffs,
+    )
+    assert (tmp_path / "53.0").read_bytes() == (
+        FILE_DIR / "examples" / "basic" / "53.0"
+    ).read_bytes()
+
+
 @pytest.mark.skipif(has_obabel is False, reason="openbabel needed")
 def test_qchem_read_results_advanced(tmp_path, monkeypatch, test_atoms):
     monkeypatch.chdir(tmp_path)
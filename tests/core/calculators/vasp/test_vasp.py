@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import gzip
 import os
+import sqlite3
 from copy import deepcopy
 from logging import INFO, getLogger
 from pathlib import Path
@@ -19,6 +21,13 @@ from pymatgen.io.vasp.sets import MPRelaxSet, MPScanRelaxSet
 from quacc import change_settings, get_settings
 from quacc.calculators.vasp import Vasp, presets
 from quacc.calculators.vasp.params import MPtoASEConverter
+from quacc.calculators.vasp.tuning import (
+    get_mpi_ranks,
+    get_nkpts,
+    read_parallel_stats,
+    recommend_parallel_params,
+    record_parallel_stats,
+)
 from quacc.schemas.prep import prep_next_run
 
 FILE_DIR = Path(__file__).parent
@@ -541,6 +550,156 @@ def test_ncore_aggressive():
         assert calc.int_params["ncore"] is None
 
 
+def test_parallel_history(tmp_path, monkeypatch):
+    monkeypatch.setattr("psutil.cpu_count", lambda logical=False: 32)
+    outcar = gzip.decompress((FILE_DIR / "OUTCAR_mag.gz").read_bytes()).decode()
+    database = tmp_path / "history.db"
+
+    assert read_parallel_stats(tmp_path) is None
+    for ncore, time in [(1, 10.0), (4, 5.0), (8, 7.0)]:
+        run_dir = tmp_path / f"ncore{ncore}"
+        run_dir.mkdir()
+        (run_dir / "OUTCAR").write_text(
+            outcar.replace(
+                "one band on NCORES_PER_BAND=   1 cores,   32 groups",
+                f"one band on NCORES_PER_BAND=   {ncore} cores,   {32 // ncore} groups",
+            ).replace("real time   ", f"real time {time} ignored ")
+        )
+        stats = read_parallel_stats(run_dir)
+        assert stats["ncore"] == ncore
+        assert stats["time_per_step"] == pytest.approx(time)
+        record_parallel_stats(run_dir, database)
+
+    assert stats["natoms"] == 22
+    assert stats["nbands"] == 128
+    assert stats["nkpts"] == 22
+    assert stats["ncores"] == 32
+    assert stats["kpar"] == 1
+    assert stats["lhfcalc"] is False
+
+    assert recommend_parallel_params(database, 20, 30, 32, False) == {
+        "ncore": 4,
+        "kpar": 1,
+    }
+    assert recommend_parallel_params(database, 20, 30, 32, True) is None
+    assert recommend_parallel_params(database, 100, 30, 32, False) is None
+    assert recommend_parallel_params(database, 20, 30, 16, False) is None
+    assert recommend_parallel_params(tmp_path / "missing.db", 20, 30, 32, False) is None
+
+    atoms = bulk("Cu") * (2, 2, 5)
+    with change_settings({"VASP_PARALLEL_HISTORY": database}):
+        calc = Vasp(atoms, kpts=(4, 4, 2))
+        assert calc.int_params["ncore"] == 4
+        assert calc.int_params["kpar"] == 1
+
+        calc = Vasp(atoms, kpts=(4, 4, 2), ncore=2)
+        assert calc.int_params["ncore"] == 2
+        assert calc.int_params["kpar"] is None
+
+        calc = Vasp(atoms * (4, 1, 1), kpts=(4, 4, 2))
+        assert calc.int_params["ncore"] == 8
+        assert calc.int_params["kpar"] is None
+
+    with change_settings(
+        {"VASP_PARALLEL_HISTORY": database, "VASP_PARALLEL_EXPLORE": True}
+    ):
+        calc = Vasp(atoms, kpts=(4, 4, 2))
+        assert calc.int_params["ncore"] == 2
+        assert calc.int_params["kpar"] == 1
+
+    with change_settings(
+        {"VASP_PARALLEL_HISTORY": database, "VASP_PARALLEL_CMD": "srun -n 16"}
+    ):
+        calc = Vasp(atoms, kpts=(4, 4, 2))
+        assert calc.int_params["ncore"] == 4
+        assert calc.int_params["kpar"] is None
+
+    with change_settings(
+        {
+            "VASP_PARALLEL_HISTORY": database,
+            "VASP_PARALLEL_CMD": "srun -n 16",
+            "VASP_MPI_RANKS": 32,
+        }
+    ):
+        calc = Vasp(atoms, kpts=(4, 4, 2))
+        assert calc.int_params["kpar"] == 1
+
+
+def test_parallel_history_kpts(tmp_path, monkeypatch):
+    monkeypatch.setattr("psutil.cpu_count", lambda logical=False: 16)
+    atoms = bulk("Cu")
+
+    assert get_nkpts(Vasp(atoms, kpts=(4, 4, 4)), atoms) == 8
+    assert get_nkpts(Vasp(atoms, kpts=3.5), atoms) == 3
+    assert get_nkpts(Vasp(atoms, kpts=[[0, 0, 0], [0.5, 0, 0]]), atoms) == 2
+    calc = Vasp(atoms)
+    calc.kpts = {"density": 3.5}
+    assert get_nkpts(calc, atoms) == 56
+    calc.kpts = None
+    assert get_nkpts(calc, atoms) is None
+
+    with change_settings({"VASP_PARALLEL_HISTORY": tmp_path / "history.db"}):
+        calc = Vasp(atoms, kpts=3.5)
+        assert calc.int_params["ncore"] == 4
+
+
+def test_parallel_history_explore(tmp_path):
+    outcar = gzip.decompress((FILE_DIR / "OUTCAR_mag.gz").read_bytes()).decode()
+    database = tmp_path / "history.db"
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    (run_dir / "OUTCAR").write_text(
+        outcar.replace(
+            "one band on NCORES_PER_BAND=   1 cores,   32 groups",
+            "one band on NCORES_PER_BAND=   4 cores,   8 groups",
+        )
+    )
+    record_parallel_stats(run_dir, database)
+
+    tried = {(4, 1)}
+    for _ in range(10):
+        params = recommend_parallel_params(database, 20, 30, 32, False, explore=True)
+        if (params["ncore"], params["kpar"]) in tried:
+            break
+        tried.add((params["ncore"], params["kpar"]))
+        with sqlite3.connect(database) as connection:
+            connection.execute(
+                "INSERT INTO vasp_runs (ncore, kpar, natoms, nbands, nkpts, ncores, "
+                "lhfcalc, nsteps, time_per_step) VALUES (?, ?, 22, 128, 22, 32, 0, 1, ?)",
+                (params["ncore"], params["kpar"], 100.0),
+            )
+        connection.close()
+    assert tried == {(4, 1), (8, 1), (2, 1), (4, 2)}
+    assert params == {"ncore": 4, "kpar": 1}
+    assert recommend_parallel_params(database, 20, 30, 32, False) == params
+
+
+@pytest.mark.parametrize(
+    ("parallel_cmd", "ranks"),
+    [
+        ("mpirun -np 64", 64),
+        ("srun -n 64", 64),
+        ("srun --ntasks=64 --cpu-bind=cores", 64),
+        ("srun -N 2 --ntasks-per-node 48", 96),
+        ("srun --nodes=2 --ntasks-per-node=48", 96),
+        ("mpiexec -ppn 32 -N 4", 128),
+        ("srun -N 2", None),
+        ("", None),
+    ],
+)
+def test_get_mpi_ranks(parallel_cmd, ranks):
+    assert get_mpi_ranks(parallel_cmd) == ranks
+
+
+def test_record_performance_bad_outcar(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "OUTCAR.gz").write_bytes(b"not gzipped")
+    with change_settings({"VASP_PARALLEL_HISTORY": tmp_path / "history.db"}):
+        calc = Vasp(bulk("Cu"))
+        calc.directory = str(tmp_path)
+        calc._record_performance()
+
+
 def test_ismear():
     atoms = bulk("Cu")
 
@@ -943,6 +1102,26 @@ def test_ldau_mp():
     assert parameters["magmom"] == [0.6, 0.6, 0.6, 5.0]
 
 
+def test_interactive(caplog):
+    atoms = bulk("Cu")
+    calc = Vasp(atoms, use_custodian=True, use_interactive=True, nsw=0, ibrion=2)
+    assert calc.use_custodian is False
+    assert calc.bool_params["interactive"] is True
+    assert calc.int_params["ibrion"] == -1
+    assert calc.float_params["potim"] == 0.0
+    assert calc.int_params["nsw"] == 2000
+    assert calc.int_params["isym"] == 0
+    assert "Setting IBRION = -1" in caplog.text
+
+    calc = Vasp(atoms, use_interactive=True, nsw=5000, isym=2)
+    assert calc.int_params["nsw"] == 5000
+    assert calc.int_params["isym"] == 2
+
+    calc = Vasp(atoms)
+    assert calc.bool_params["interactive"] is None
+    calc.close()
+
+
 @pytest.mark.skipif(which(get_settings().VASP_CMD), reason="VASP is installed")
 def test_run(monkeypatch, tmp_path):
     monkeypatch.chdir(tmp_path)
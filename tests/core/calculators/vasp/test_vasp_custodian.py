@@ -3,7 +3,7 @@ from __future__ import annotations
 import pytest
 from custodian import Custodian
 
-from quacc.calculators.vasp.vasp_custodian import run_custodian
+from quacc.calculators.vasp.vasp_custodian import run_custodian, write_continuation
 
 
 def mock_custodian_run(*args, **kwargs):
@@ -39,3 +39,37 @@ def test_run_vasp_custodian(monkeypatch):
 
     with pytest.raises(ValueError, match="Unknown VASP validator"):
         run_custodian(vasp_custodian_validators=["cow"])
+
+
+def test_write_continuation(tmp_path):
+    from ase.build import bulk
+    from ase.io import write
+    from monty.serialization import loadfn
+
+    write(tmp_path / "CONTCAR", bulk("Cu"), format="vasp")
+    (tmp_path / "INCAR.orig").write_text("ALGO = Fast\nNSW = 10\n")
+    (tmp_path / "INCAR").write_text("ALGO = Normal\nNSW = 10\nPOTIM = 0.1\n")
+    (tmp_path / "OSZICAR").write_text(" 1 F= -1.0 E0= -1.0\n 2 F= -1.1 E0= -1.1\n")
+    run_log = [
+        {
+            "corrections": [
+                {"errors": ["zbrent"], "actions": [], "handler": None},
+                {"errors": ["Walltime reached"], "actions": None, "handler": None},
+            ]
+        }
+    ]
+
+    assert write_continuation(tmp_path, run_log=[{"corrections": []}]) is None
+    assert not (tmp_path / "quacc_continuation.json").exists()
+
+    continuation = write_continuation(tmp_path, run_log=run_log)
+    assert continuation == {
+        "reason": "walltime",
+        "n_ionic_steps": 2,
+        "incar_changes": {"algo": "Normal", "potim": 0.1},
+        "custodian_errors": ["zbrent"],
+    }
+    assert loadfn(tmp_path / "quacc_continuation.json") == continuation
+
+    (tmp_path / "STOPCAR").write_text("LSTOP = .TRUE.")
+    assert write_continuation(tmp_path)["reason"] == "stopcar"
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import os
 import platform
 from pathlib import Path
@@ -112,3 +113,35 @@ def test_bad(runner):
     assert response.exit_code != 0
     response = runner.invoke(app, ["unset", "CONFIG_FILE"])
     assert response.exit_code != 0
+
+
+def test_bench(runner, tmp_path):
+    output = tmp_path / "bench.json"
+    response = runner.invoke(
+        app, ["bench", "--select", "get_atoms_id", "--repeat", "2", "-o", str(output)]
+    )
+    assert response.exit_code == 0
+    assert "get_atoms_id" in response.stdout
+    assert "get_atoms_id" in json.loads(output.read_text())["benchmarks"]
+
+
+def test_bench_engine(runner, tmp_path, monkeypatch):
+    monkeypatch.setenv("QUACC_WORKFLOW_ENGINE", "local")
+    output = tmp_path / "bench.json"
+    response = runner.invoke(
+        app,
+        [
+            "bench",
+            "--select",
+            "flow_fanout*",
+            "-e",
+            "None",
+            "--n-jobs",
+            "2",
+            "-o",
+            str(output),
+        ],
+    )
+    assert response.exit_code == 0
+    result = json.loads(output.read_text())["benchmarks"]["flow_fanout[None]"]
+    assert result["engine"] is None
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import pytest
+from ase.build import add_adsorbate, fcc100
+from ase.constraints import FixAtoms
+
+from quacc.recipes.emt.core import relax_job
+from quacc.recipes.emt.neb import neb_flow
+
+
+@pytest.fixture
+def hop_endpoints(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    initial = fcc100("Al", size=(2, 2, 3), vacuum=5.0)
+    add_adsorbate(initial, "Au", 1.7, "hollow")
+    initial.set_constraint(FixAtoms(mask=[atom.tag > 1 for atom in initial]))
+    final = initial.copy()
+    final[-1].x += final.cell[0, 0] / 2
+
+    return relax_job(initial)["atoms"], relax_job(final)["atoms"]
+
+
+def test_neb_flow(hop_endpoints):
+    initial, final = hop_endpoints
+    midpoint = initial.copy()
+    midpoint.positions = (initial.positions + final.positions) / 2
+
+    output = neb_flow(
+        [initial, midpoint, final],
+        neb_subflow_kwargs={"max_images": 7, "max_angle": 5.0},
+        job_params={"static_job": {"asap_cutoff": True}},
+    )
+    assert output["converged"] is True
+    assert output["climbing"] is True
+    assert len(output["trajectory"]) == 7
+    assert {len(energies) for energies in output["energy_profile"]} == {3, 5, 7}
+    assert len(output["energy_profile"]) == output["n_iterations"]
+    assert output["n_evaluations"] < 5 * output["n_iterations"]
+    assert output["energies"][output["ts_index"]] == max(output["energies"])
+    assert max(output["energies"]) - output["energies"][0] == pytest.approx(
+        0.37, abs=0.05
+    )
+    for image, result in zip(
+        output["trajectory"], output["image_results"], strict=True
+    ):
+        assert result["name"] == "EMT Static"
+        assert result["parameters"]["asap_cutoff"] is True
+        assert result["atoms"].positions == pytest.approx(image.positions)
+
+
+def test_neb_flow_batched(hop_endpoints):
+    initial, final = hop_endpoints
+    images = [initial.copy() for _ in range(5)]
+    for i, image in enumerate(images):
+        image.positions += (final.positions - initial.positions) * i / 4
+
+    called = []
+
+    def record_calls(func):
+        def wrapper(*args, **kwargs):
+            called.append(func.__name__)
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    output = neb_flow(
+        images,
+        neb_subflow_kwargs={"batch_size": 2, "climb": False},
+        job_decorators={"static_job": record_calls},
+    )
+    assert output["converged"] is True
+    assert output["climbing"] is False
+    assert len(output["trajectory"]) == 5
+    assert called.count("map_partition") >= output["n_iterations"] + 2
+
+    output = neb_flow(images, neb_subflow_kwargs={"max_steps": 2})
+    assert output["converged"] is False
+    assert output["n_iterations"] == 2
+    assert output["n_evaluations"] == 8
+    assert len(output["energies"]) == 5
+
+    with pytest.raises(ValueError, match="max_steps must be at least 1"):
+        neb_flow(images, neb_subflow_kwargs={"max_steps": 0})
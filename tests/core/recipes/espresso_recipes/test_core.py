@@ -297,6 +297,37 @@ def test_ase_relax_job(tmp_path, monkeypatch):
     assert new_input_data["control"]["calculation"] == "scf"
 
 
+def test_ase_relax_job_socket(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("OMP_NUM_THREADS", "1")
+
+    copy_decompress_files(DATA_DIR, ["Si.upf.gz"], tmp_path)
+
+    atoms = bulk("Si")
+    atoms[0].position += 0.05
+
+    pseudopotentials = {"Si": "Si.upf"}
+    input_data = {"control": {"pseudo_dir": tmp_path}}
+
+    results = ase_relax_job(
+        atoms,
+        use_socket=True,
+        input_data=input_data,
+        pseudopotentials=pseudopotentials,
+        kpts=None,
+        opt_params={"max_steps": 10, "fmax": 1.0e-1, "optimizer": BFGS},
+    )
+
+    with zopen(results["dir_name"] / "pw.out.gz", "r") as fd:
+        lines = str(fd.read())
+
+    assert lines.count("Program PWSCF") == 1
+    assert len(results["trajectory"]) == 3
+    assert_allclose(
+        results["trajectory_results"][-1]["energy"], -293.71198070497894, atol=1e-4
+    )
+
+
 def test_ase_relax_cell_job(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     monkeypatch.setenv("OMP_NUM_THREADS", "1")
@@ -17,8 +17,13 @@ from ase import Atoms
 from ase.build import molecule
 
 from quacc import _internally_set_settings
+from quacc.atoms.core import get_atoms_id
 from quacc.recipes.newtonnet.core import freq_job, relax_job, static_job
 from quacc.recipes.newtonnet.ts import (
+    _bofill_update,
+    _HessianProvider,
+    both_directions_irc_flow,
+    both_directions_quasi_irc_flow,
     geodesic_job,
     irc_job,
     neb_job,
@@ -66,6 +71,20 @@ def test_relax_job(tmp_path, monkeypatch):
     assert np.max(np.linalg.norm(output["results"]["forces"], axis=1)) < 0.01
 
 
+def test_relax_job_hessian_every_n(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    atoms = molecule("H2O")
+    output = relax_job(atoms, opt_params={"max_steps": 5}, trajectory_hessian_every_n=0)
+    trajectory_results = output["trajectory_results"]
+    assert len(trajectory_results) > 2
+    for i, results in enumerate(trajectory_results):
+        assert "energy_std" in results
+        assert "forces_std" in results
+        assert ("hessian" in results) is (i in {0, len(trajectory_results) - 1})
+    assert np.array(trajectory_results[-1]["hessian"]).size == (3 * len(atoms)) ** 2
+
+
 def test_freq_job(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     atoms = molecule("H2O")
@@ -137,6 +156,51 @@ def test_ts_job_with_custom_hessian(tmp_path, monkeypatch):
     assert "results" in output["freq_job"]
 
 
+def test_ts_job_with_quasi_newton_hessian(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    atoms = molecule("H2O")
+    output = ts_job(
+        atoms,
+        use_custom_hessian=True,
+        custom_hessian_exact_every_n=3,
+        opt_params={"max_steps": 4},
+    )
+    assert output["freq_job"]["results"]["n_imag"] >= 0
+
+
+def test_hessian_provider():
+    atoms = molecule("H2O")
+    provider = _HessianProvider(exact_every_n=2)
+    hessian = provider(atoms)
+    assert hessian.shape == (9, 9)
+    assert list(provider._cache) == [get_atoms_id(atoms)]
+
+    displaced_atoms = atoms.copy()
+    displaced_atoms.positions[0, 0] += 0.05
+    quasi_newton_hessian = provider(displaced_atoms)
+    assert len(provider._cache) == 1
+    exact_hessian = provider(displaced_atoms, exact=True)
+    assert len(provider._cache) == 2
+    assert not np.allclose(quasi_newton_hessian, exact_hessian)
+    assert np.allclose(provider(atoms), hessian)
+
+    with pytest.raises(ValueError, match="exact_every_n must be at least 1"):
+        _HessianProvider(exact_every_n=0)
+
+
+def test_bofill_update():
+    rng = np.random.default_rng(0)
+    hessian = rng.normal(size=(6, 6))
+    hessian = hessian + hessian.T
+    displacement = rng.normal(size=6)
+    gradient_change = rng.normal(size=6)
+
+    updated_hessian = _bofill_update(hessian, displacement, gradient_change)
+    assert np.allclose(updated_hessian, updated_hessian.T)
+    assert np.allclose(updated_hessian @ displacement, gradient_change)
+    assert _bofill_update(hessian, np.zeros(6), gradient_change) is hessian
+
+
 def test_irc_job_with_default_args(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     # Define test inputs
@@ -152,6 +216,34 @@ def test_irc_job_with_default_args(tmp_path, monkeypatch):
     assert output["freq_job"]["results"]["energy"] == pytest.approx(-9.517354091813969)
 
 
+def test_both_directions_irc_flow(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    atoms = molecule("H2O")
+
+    output = both_directions_irc_flow(
+        atoms,
+        initial_hessian=freq_job(atoms)["results"]["hessian"],
+        job_params={"irc_job": {"run_freq": False}},
+    )
+    assert output["trajectory"][0] == output["reverse"]["trajectory"][-1]
+    assert output["trajectory"][-1] == output["forward"]["trajectory"][-1]
+    assert len(output["energies"]) == len(output["trajectory"])
+
+
+def test_both_directions_quasi_irc_flow(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    atoms = molecule("H2O")
+
+    output = both_directions_quasi_irc_flow(
+        atoms,
+        initial_hessian=freq_job(atoms)["results"]["hessian"],
+        job_params={"quasi_irc_job": {"run_freq": False}},
+    )
+    assert output["forward"]["irc_job"]["name"] == "NewtonNet IRC: forward"
+    assert output["reverse"]["irc_job"]["name"] == "NewtonNet IRC: reverse"
+    assert len(output["energies"]) == len(output["trajectory"])
+
+
 def test_irc_job_with_custom_fmax(tmp_path, monkeypatch):
     from ase.build import molecule
 
@@ -9,6 +9,7 @@ from ase.build import molecule
 from quacc.recipes.orca.core import (
     ase_quasi_irc_job,
     ase_relax_job,
+    both_directions_quasi_irc_flow,
     freq_job,
     relax_job,
     static_job,
@@ -131,7 +132,52 @@ def test_ase_relax_job(tmp_path, monkeypatch):
     assert output.get("trajectory_results")
 
 
-@pytest.mark.skipif(os.name == "nt", reason="mpirun not available on Windows")
+def test_ase_relax_job_warm_start(tmp_path, monkeypatch):
+    from ase.calculators.orca import OrcaTemplate
+
+    from .conftest import mock_execute
+
+    monkeypatch.chdir(tmp_path)
+
+    staged_gbw = []
+
+    def mock_execute_gbw(self, directory, *args, **kwargs):
+        gbw = Path(directory, "orca.gbw")
+        staged_gbw.append(gbw.read_text() if gbw.exists() else None)
+        mock_execute(self, directory)
+        gbw.write_text(f"step {len(staged_gbw)}")
+
+    monkeypatch.setattr(OrcaTemplate, "execute", mock_execute_gbw)
+
+    atoms = molecule("H2")
+    output = ase_relax_job(atoms, opt_params={"fmax": 0.1})
+    assert len(staged_gbw) > 1
+    assert staged_gbw[0] is None
+    assert staged_gbw[1:] == [f"step {i}" for i in range(1, len(staged_gbw))]
+    assert (
+        output["parameters"]["orcasimpleinput"]
+        == "def2-tzvp engrad normalprint wb97x-d3bj xyzfile"
+    )
+    n_steps = len(staged_gbw)
+
+    staged_gbw.clear()
+    static_job(output["atoms"], prev_dir=output["dir_name"], nprocs=1)
+    assert staged_gbw == [f"step {n_steps}"]
+
+    staged_gbw.clear()
+    static_job(
+        output["atoms"],
+        prev_dir=output["dir_name"],
+        copy_files={output["dir_name"]: "orca.xyz*"},
+        nprocs=1,
+    )
+    assert staged_gbw == [f"step {n_steps}"]
+
+    staged_gbw.clear()
+    static_job(output["atoms"], nprocs=1)
+    assert staged_gbw == [None]
+
+
 def test_ase_relax_job_store(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
 
@@ -191,3 +237,35 @@ def test_ase_quasi_irc_job(tmp_path, monkeypatch):
     assert output["parameters"]["charge"] == 0
     assert output["parameters"]["mult"] == 1
     assert output["parameters"]["orcasimpleinput"] == "def2-svp engrad hf xyzfile"
+
+
+@pytest.mark.skipif(os.name == "nt", reason="mpirun not available on Windows")
+def test_both_directions_quasi_irc_flow(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    atoms = molecule("H2")
+
+    mode = [[0.0, 0.0, 0.1], [0.0, 0.0, -0.1]]
+
+    output = both_directions_quasi_irc_flow(
+        atoms,
+        mode,
+        job_params={
+            "ase_quasi_irc_job": {
+                "perturb_magnitude": 0.5,
+                "xc": "hf",
+                "basis": "def2-svp",
+                "nprocs": 1,
+            }
+        },
+    )
+    forward_atoms = output["forward"]["trajectory"][0]
+    reverse_atoms = output["reverse"]["trajectory"][0]
+    assert forward_atoms.get_distance(0, 1) > reverse_atoms.get_distance(0, 1)
+    assert len(output["trajectory"]) == len(output["forward"]["trajectory"]) + len(
+        output["reverse"]["trajectory"]
+    )
+    assert len(output["energies"]) == len(output["trajectory"])
+    assert output["trajectory"][0] == output["reverse"]["trajectory"][-1]
+    assert output["trajectory"][-1] == output["forward"]["trajectory"][-1]
+    assert output["energies"][output["ts_index"]] == max(output["energies"])
@@ -4,6 +4,7 @@ from importlib.util import find_spec
 from pathlib import Path
 from shutil import copy
 
+import numpy as np
 import pytest
 from ase import units
 from ase.calculators.lj import LennardJones
@@ -15,7 +16,13 @@ from quacc import JobFailure, _internally_set_settings
 from quacc.atoms.core import check_charge_and_spin
 from quacc.calculators.qchem import QChem
 from quacc.recipes.qchem.core import freq_job, relax_job, static_job
-from quacc.recipes.qchem.ts import irc_job, quasi_irc_job, ts_job
+from quacc.recipes.qchem.ts import (
+    both_directions_irc_flow,
+    both_directions_quasi_irc_flow,
+    irc_job,
+    quasi_irc_job,
+    ts_job,
+)
 
 has_sella = bool(find_spec("sella"))
 has_obabel = bool(find_spec("openbabel"))
@@ -250,6 +257,38 @@ def test_relax_job_v1(monkeypatch, tmp_path, test_atoms):
     assert len(output["results"]["taskdoc"]["input"]) > 1
 
 
+def test_relax_job_deferred_taskdoc(monkeypatch, tmp_path, test_atoms):
+    from emmet.core.qc_tasks import TaskDoc
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(QChem, "execute", mock_execute1)
+
+    parsed_dirs = []
+    from_directory = TaskDoc.from_directory
+
+    def mock_from_directory(dir_name, *args, **kwargs):
+        parsed_dirs.append(dir_name)
+        return from_directory(dir_name, *args, **kwargs)
+
+    monkeypatch.setattr(
+        "quacc.calculators.qchem.io.TaskDoc.from_directory", mock_from_directory
+    )
+
+    output = relax_job(
+        test_atoms,
+        charge=0,
+        spin_multiplicity=1,
+        opt_params={"optimizer": FIRE, "max_steps": 3},
+    )
+    assert len(output["trajectory"]) > 1
+    assert parsed_dirs == [output["dir_name"]]
+    assert output["results"]["energy"] == pytest.approx(-606.1616819641 * units.Hartree)
+    assert output["results"]["forces"][0][0] == pytest.approx(-1.3826330655069403)
+    assert output["results"]["taskdoc"]["output"]["final_energy"] == pytest.approx(
+        -606.1616819641
+    )
+
+
 @pytest.mark.skipif(has_sella is False, reason="Does not have Sella")
 def test_relax_job_v2(monkeypatch, tmp_path, test_atoms):
     monkeypatch.chdir(tmp_path)
@@ -350,6 +389,20 @@ def test_freq_job_v1(monkeypatch, tmp_path, test_atoms):
     assert output["results"]["taskdoc"]["output"]["enthalpy"] is not None
 
 
+def _spy_on_pes(monkeypatch):
+    from sella.peswrapper import PES
+
+    pes_kwargs = {}
+    pes_init = PES.__init__
+
+    def _pes_init(self, *args, **kwargs):
+        pes_kwargs.update(kwargs)
+        pes_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(PES, "__init__", _pes_init)
+    return pes_kwargs
+
+
 @pytest.mark.skipif(has_sella is False, reason="Does not have Sella")
 def test_ts_job_v1(monkeypatch, tmp_path, test_atoms):
     monkeypatch.chdir(tmp_path)
@@ -380,6 +433,80 @@ def test_ts_job_v1(monkeypatch, tmp_path, test_atoms):
     qcinput_nearly_equal(qcin, ref_qcin)
 
 
+def test_static_job_staged_orbitals(monkeypatch, tmp_path, test_atoms):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(QChem, "execute", mock_execute1)
+
+    output1 = static_job(test_atoms, charge=0, spin_multiplicity=1)
+    qcin = QCInput.from_file(str(Path(output1["dir_name"], "mol.qin.gz")))
+    assert "scf_guess" not in qcin.rem
+
+    output2 = static_job(
+        test_atoms,
+        charge=0,
+        spin_multiplicity=1,
+        copy_files={output1["dir_name"]: "53.0*"},
+    )
+    qcin = QCInput.from_file(str(Path(output2["dir_name"], "mol.qin.gz")))
+    assert qcin.rem["scf_guess"] == "read"
+
+
+@pytest.mark.skipif(has_sella is False, reason="Does not have Sella")
+def test_ts_job_initial_hessian(monkeypatch, tmp_path, test_atoms):
+    monkeypatch.chdir(tmp_path)
+
+    monkeypatch.setattr(QChem, "execute", mock_execute5)
+    freq_output = freq_job(test_atoms, charge=0, spin_multiplicity=1)
+
+    pes_kwargs = _spy_on_pes(monkeypatch)
+    monkeypatch.setattr(QChem, "execute", mock_execute1)
+    output = ts_job(
+        test_atoms,
+        charge=0,
+        spin_multiplicity=1,
+        initial_hessian=freq_output["results"]["hessian"],
+        copy_files={freq_output["dir_name"]: "53.0*"},
+        opt_params={"max_steps": 1},
+    )
+    assert output["results"]["energy"] == pytest.approx(-606.1616819641 * units.Hartree)
+    assert pes_kwargs["H0"] == pytest.approx(
+        np.array(freq_output["results"]["hessian"])
+    )
+    assert pes_kwargs["hessian_function"] is None
+    qcin = QCInput.from_file(str(Path(output["dir_name"], "mol.qin.gz")))
+    assert qcin.rem["scf_guess"] == "read"
+
+
+@pytest.mark.skipif(has_sella is False, reason="Does not have Sella")
+def test_irc_job_initial_hessian(monkeypatch, tmp_path, test_atoms):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(QChem, "read_results", mock_read)
+    monkeypatch.setattr(QChem, "execute", mock_execute4)
+
+    hessian = np.eye(3 * len(test_atoms))
+    hessian_calls = []
+
+    def _hessian_function(atoms):
+        hessian_calls.append(atoms.get_positions())
+        return hessian
+
+    monkeypatch.setattr(
+        "quacc.recipes.qchem.ts.get_hessian_function", lambda *_: _hessian_function
+    )
+    output = irc_job(
+        test_atoms,
+        charge=0,
+        spin_multiplicity=1,
+        direction="reverse",
+        basis="def2-tzvpd",
+        initial_hessian=hessian,
+        opt_params={"max_steps": 2},
+    )
+    assert output["atoms"] != test_atoms
+    assert len(hessian_calls) == 1
+    assert hessian_calls[0] == pytest.approx(test_atoms.get_positions())
+
+
 @pytest.mark.skipif(has_sella is False, reason="Does not have Sella")
 def test_ts_job_v2(monkeypatch, tmp_path, test_atoms):
     monkeypatch.chdir(tmp_path)
@@ -518,6 +645,24 @@ def test_irc_job_v1(monkeypatch, tmp_path, test_atoms):
     assert output["parameters"]["spin_multiplicity"] == 1
 
 
+@pytest.mark.skipif(has_sella is False, reason="Does not have Sella")
+def test_both_directions_irc_flow(monkeypatch, tmp_path, test_atoms):
+    monkeypatch.chdir(tmp_path)
+
+    monkeypatch.setattr(QChem, "read_results", mock_read)
+    monkeypatch.setattr(QChem, "execute", mock_execute4)
+
+    output = both_directions_irc_flow(
+        test_atoms,
+        initial_hessian=np.eye(3 * len(test_atoms)),
+        job_params={"irc_job": {"basis": "def2-tzvpd", "opt_params": {"max_steps": 1}}},
+    )
+    assert output["forward"]["atoms"] != output["reverse"]["atoms"]
+    assert output["trajectory"][0] == output["reverse"]["trajectory"][-1]
+    assert output["trajectory"][-1] == output["forward"]["trajectory"][-1]
+    assert len(output["energies"]) == len(output["trajectory"])
+
+
 @pytest.mark.skipif(has_sella is False, reason="Does not have Sella")
 def test_irc_job_v2(tmp_path, monkeypatch, test_atoms):
     monkeypatch.chdir(tmp_path)
@@ -629,3 +774,48 @@ def test_quasi_irc_job(monkeypatch, tmp_path, test_qirc_atoms):
     qcin = QCInput.from_file(str(Path(output["dir_name"], "mol.qin.gz")))
     ref_qcin = QCInput.from_file(str(QCHEM_DIR / "mol.qin.qirc_reverse"))
     qcinput_nearly_equal(qcin, ref_qcin)
+
+    pes_kwargs = _spy_on_pes(monkeypatch)
+    output = quasi_irc_job(
+        test_qirc_atoms,
+        mode,
+        charge=charge,
+        spin_multiplicity=spin_multiplicity,
+        initial_hessian=np.eye(3 * len(test_qirc_atoms)),
+        opt_params={"max_steps": 2},
+    )
+    assert output["atoms"] != test_qirc_atoms
+    assert pes_kwargs["H0"] == pytest.approx(np.eye(3 * len(test_qirc_atoms)))
+
+    with pytest.raises(ValueError, match="can only be used with Sella"):
+        quasi_irc_job(
+            test_qirc_atoms,
+            mode,
+            charge=charge,
+            spin_multiplicity=spin_multiplicity,
+            initial_hessian=np.eye(3 * len(test_qirc_atoms)),
+            opt_params={"optimizer": FIRE},
+        )
+
+
+@pytest.mark.skipif(has_sella is False, reason="Does not have Sella")
+def test_both_directions_quasi_irc_flow(monkeypatch, tmp_path, test_qirc_atoms):
+    monkeypatch.chdir(tmp_path)
+
+    monkeypatch.setattr(QChem, "read_results", mock_read)
+    monkeypatch.setattr(QChem, "execute", mock_execute4)
+
+    mode = np.zeros((len(test_qirc_atoms), 3))
+    mode[6] = [0.751, -0.378, 0.186]
+    pes_kwargs = _spy_on_pes(monkeypatch)
+    output = both_directions_quasi_irc_flow(
+        test_qirc_atoms,
+        mode,
+        initial_hessian=np.eye(3 * len(test_qirc_atoms)),
+        job_params={"quasi_irc_job": {"opt_params": {"max_steps": 2}}},
+    )
+    assert pes_kwargs["H0"] == pytest.approx(np.eye(3 * len(test_qirc_atoms)))
+    assert output["forward"]["trajectory"][0] != output["reverse"]["trajectory"][0]
+    assert output["trajectory"][0] == output["reverse"]["trajectory"][-1]
+    assert output["trajectory"][-1] == output["forward"]["trajectory"][-1]
+    assert len(output["energies"]) == len(output["trajectory"])
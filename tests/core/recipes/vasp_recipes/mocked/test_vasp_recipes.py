@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import gzip
 import os
+import sys
 
 import pytest
 
@@ -45,6 +47,24 @@ FILE_DIR = Path(__file__).parent
 MOCKED_DIR = FILE_DIR / "mocked_vasp_runs"
 
 
+def test_static_job_potcar_cache(tmp_path, patch_metallic_taskdoc):
+    cache_dir = tmp_path / "potcar_cache"
+    atoms = bulk("Al")
+
+    output = static_job(atoms)
+    reference = gzip.decompress(Path(output["dir_name"], "POTCAR.gz").read_bytes())
+
+    with change_settings({"VASP_POTCAR_CACHE_DIR": cache_dir}):
+        outputs = [static_job(atoms), static_job(atoms)]
+    assert len(list(cache_dir.iterdir())) == 1
+    for output in outputs:
+        potcar = Path(output["dir_name"], "POTCAR.gz")
+        assert gzip.decompress(potcar.read_bytes()) == reference
+
+    # Gzipping the job directory does not touch the cached POTCAR
+    assert next(cache_dir.iterdir()).read_bytes() == reference
+
+
 def test_static_job(patch_metallic_taskdoc):
     atoms = bulk("Al")
 
@@ -152,6 +172,63 @@ def test_doublerelax_flow(patch_metallic_taskdoc):
     assert double_relax_flow(atoms, relax1_kwargs={"kpts": [1, 1, 1]})
 
 
+def test_doublerelax_flow_continuation(monkeypatch, patch_metallic_taskdoc):
+    from emmet.core.tasks import TaskState
+
+    from quacc.calculators.vasp.vasp import Vasp
+    from quacc.calculators.vasp.vasp_custodian import write_continuation
+
+    from .conftest import MOCK_METALLIC_TASKDOC, mock_run
+
+    def mock_walltime_run(self, *args, **kwargs):
+        mock_run(self)
+        if self.int_params["istart"] == 1:
+            return None, None
+        directory = Path(self.directory)
+        (directory / "INCAR.orig").write_text((directory / "INCAR").read_text())
+        with (directory / "INCAR").open("a") as f:
+            f.write("ALGO = Normal\n")
+        (directory / "OSZICAR").write_text(" 1 F= -1.0 E0= -1.0\n" * 5)
+        (directory / "WAVECAR").write_text("wavecar")
+        write_continuation(
+            directory, run_log=[{"corrections": [{"errors": ["Walltime reached"]}]}]
+        )
+        return None, None
+
+    def mock_stopped_taskdoc(dir_name, *args, **kwargs):
+        if list(Path(dir_name).glob("quacc_continuation.json*")):
+            return MOCK_METALLIC_TASKDOC.model_copy(update={"state": TaskState.FAILED})
+        return MOCK_METALLIC_TASKDOC
+
+    monkeypatch.setattr(Vasp, "_run", mock_walltime_run)
+    monkeypatch.setattr(
+        "quacc.schemas.vasp.TaskDoc.from_directory", mock_stopped_taskdoc
+    )
+
+    atoms = bulk("Al")
+    with pytest.raises(RuntimeError, match="did not converge"):
+        relax_job(atoms)
+
+    output = relax_job(atoms, allow_continuation=True)
+    assert output["parameters"]["lwave"] is True
+    assert output["continuation"] == {
+        "reason": "walltime",
+        "n_ionic_steps": 5,
+        "incar_changes": {"algo": "Normal"},
+        "custodian_errors": [],
+    }
+
+    output = double_relax_flow(atoms, relax_cell=False, max_continuations=1)
+    for relax in ["relax1", "relax2"]:
+        assert "continuation" not in output[relax]
+        assert output[relax]["parameters"]["istart"] == 1
+        assert output[relax]["parameters"]["nsw"] == 195
+        assert output[relax]["parameters"]["algo"] == "normal"
+        assert output[relax]["parameters"]["isif"] == 2
+        assert output[relax]["parameters"]["encut"] == 520
+        assert Path(output[relax]["dir_name"], "WAVECAR.gz").exists()
+
+
 def test_ase_relax_job(patch_metallic_taskdoc):
     atoms = bulk("Al")
 
@@ -165,6 +242,90 @@ def test_ase_relax_job(patch_metallic_taskdoc):
     assert len(output["trajectory_results"]) > 1
 
 
+FAKE_INTERACTIVE_VASP = """
+import sys
+from pathlib import Path
+
+natoms = sum(int(n) for n in Path("POSCAR").read_text().splitlines()[6].split())
+n_steps = 0
+while not Path("STOPCAR").exists():
+    print("POSITIONS: reading from stdin", flush=True)
+    for _ in range(natoms):
+        sys.stdin.readline()
+    n_steps += 1
+Path("n_steps").write_text(str(n_steps))
+"""
+
+
+def mock_read_xml(self):
+    from ase.calculators.lj import LennardJones
+
+    atoms = self.atoms[self.sort]
+    atoms.calc = LennardJones()
+    atoms.get_forces()
+    return atoms.calc
+
+
+def test_ase_relax_job_interactive(patch_metallic_taskdoc, monkeypatch, tmp_path):
+    from quacc.calculators.vasp.vasp import Vasp
+
+    monkeypatch.setattr(Vasp, "_read_xml", mock_read_xml)
+    fake_vasp = tmp_path / "fake_vasp.py"
+    fake_vasp.write_text(FAKE_INTERACTIVE_VASP)
+    fake_vasp_cmd = f"{sys.executable} {fake_vasp}"
+
+    atoms = bulk("Al") * (2, 1, 1)
+    atoms.rattle(0.1, seed=1)
+    with change_settings(
+        {
+            "VASP_PARALLEL_CMD": "",
+            "VASP_CMD": fake_vasp_cmd,
+            "VASP_GAMMA_CMD": fake_vasp_cmd,
+            "GZIP_FILES": False,
+        }
+    ):
+        output = ase_relax_job(atoms, use_interactive=True)
+
+    assert output["parameters"]["interactive"] is True
+    assert output["parameters"]["ibrion"] == -1
+    assert output["parameters"]["nsw"] == 2000
+    assert output["parameters"]["isym"] == 0
+    assert output["parameters_opt"]["fmax"] == 0.01
+
+    n_calcs = len(output["trajectory_results"])
+    assert n_calcs > 1
+    n_steps = int(Path(output["dir_name"], "n_steps").read_text())
+    assert n_steps == n_calcs
+    assert Path(output["dir_name"], "vasp.out").exists()
+    assert not Path(output["dir_name"], "custodian.json").exists()
+
+    with pytest.raises(ValueError, match="interactive mode cannot be used"):
+        ase_relax_job(atoms, relax_cell=True, use_interactive=True)
+
+
+def test_interactive_close_terminates(monkeypatch, tmp_path):
+    from quacc.calculators.vasp.vasp import Vasp
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(Vasp, "_read_xml", mock_read_xml)
+    fake_vasp = tmp_path / "fake_vasp.py"
+    fake_vasp.write_text(FAKE_INTERACTIVE_VASP.replace('Path("STOPCAR")', 'Path("X")'))
+    fake_vasp_cmd = f"{sys.executable} {fake_vasp}"
+
+    atoms = bulk("Al") * (2, 1, 1)
+    with change_settings({"VASP_PARALLEL_CMD": "", "VASP_GAMMA_CMD": fake_vasp_cmd}):
+        atoms.calc = Vasp(atoms, preset="BulkSet", use_interactive=True, kpts=(1, 1, 1))
+        atoms.get_forces()
+        atoms.rattle(0.1, seed=1)
+        atoms.get_forces()
+        process = atoms.calc._process
+        atoms.calc.close()
+
+    assert atoms.calc._process is None
+    assert process.returncode != 0
+    assert not Path("n_steps").exists()
+
+
 def test_ase_relax_job2(patch_metallic_taskdoc):
     atoms = bulk("Al")
 
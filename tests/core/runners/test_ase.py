@@ -305,6 +305,8 @@ def test_run_neb(monkeypatch, tmp_path):
 
     assert traj[-1].calc.results is not None
     assert not os.path.exists(tmp_path / "opt.log")
+    assert dyn.energy_profile.shape == (len(traj) // len(images), len(images))
+    assert dyn.energy_profile[-1, 1] == traj[-len(images) + 1].get_potential_energy()
 
 
 def test_run_neb2():
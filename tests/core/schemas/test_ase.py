@@ -9,12 +9,14 @@ from ase.build import bulk, molecule
 from ase.calculators.emt import EMT
 from ase.io import read
 from ase.mep import NEB
+from ase.mep.neb import NEBOptimizer
 from ase.optimize import BFGS
 from ase.vibrations import Vibrations
 from maggma.stores import MemoryStore
 from monty.json import MontyDecoder, jsanitize
 from monty.serialization import loadfn
 
+from quacc.runners.ase import Runner
 from quacc.schemas.ase import Summarize, VibSummarize
 
 FILE_DIR = Path(__file__).parent
@@ -453,3 +455,32 @@ def test_summarize_neb(monkeypatch, tmp_path):
     ts_atoms = neb_summary["ts_atoms"]
     ts_atoms.calc = EMT()
     assert ts_atoms.get_potential_energy() == pytest.approx(1.1603536513693768, 1e-4)
+
+
+def test_summarize_neb_from_file(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+
+    images = read(FILE_DIR / "test_files" / "geodesic_path.xyz", index=":")
+    dyn = Runner(images, EMT()).run_neb(
+        optimizer=NEBOptimizer, neb_kwargs={"method": "aseneb", "precon": None}
+    )
+    full_trajectory = read(dyn.trajectory.filename, index=":")
+    n_iter = len(full_trajectory) // len(images)
+    assert n_iter > 3
+
+    neb_summary = Summarize().neb(dyn, len(images), n_iter_return=2)
+    expected_indices = [
+        i
+        for i in range(len(full_trajectory))
+        if (i // len(images)) % 2 == 0 or i // len(images) == n_iter - 1
+    ]
+    assert len(neb_summary["trajectory"]) == len(expected_indices)
+    for atoms, i in zip(neb_summary["trajectory"], expected_indices, strict=True):
+        assert atoms == full_trajectory[i]
+
+    neb_summary = Summarize().neb(dyn, len(images))
+    assert neb_summary["trajectory"] == full_trajectory[-len(images) :]
+    assert neb_summary["energy_profile"].shape == (n_iter, len(images))
+    assert neb_summary["energy_profile"][-1, 1:-1] == pytest.approx(
+        [results["energy"] for results in neb_summary["trajectory_results"][1:-1]]
+    )
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from ase.build import bulk
 from maggma.stores import MemoryStore
 
-from quacc import change_settings
+from quacc import change_settings, get_settings
 from quacc.recipes.emt.core import relax_job, static_job
 from quacc.settings import QuaccSettings
 
@@ -81,3 +82,118 @@ def test_yaml(tmp_path, monkeypatch):
         f.write(f"SCRATCH_DIR: {p}")
     monkeypatch.setenv("QUACC_CONFIG_FILE", os.path.join(tmp_path, "quacc_test.yaml"))
     assert p.expanduser().resolve() == QuaccSettings().SCRATCH_DIR
+
+
+def test_base_settings_cached(tmp_path, monkeypatch):
+    from quacc import _get_base_settings
+
+    config_file = tmp_path / "quacc_test.yaml"
+    config_file.write_text("GZIP_FILES: false")
+    monkeypatch.setenv("QUACC_CONFIG_FILE", str(config_file))
+
+    _, base1 = _get_base_settings()
+    _, base2 = _get_base_settings()
+    assert base1 is base2
+    assert base1.GZIP_FILES is False
+
+    # Invalidated when the config file changes
+    config_file.write_text("GZIP_FILES: true\nLOG_LEVEL: DEBUG")
+    os.utime(config_file, ns=(0, 0))
+    _, base3 = _get_base_settings()
+    assert base3 is not base1
+    assert base3.GZIP_FILES is True
+
+    # Invalidated when a QUACC_ environment variable changes
+    monkeypatch.setenv("QUACC_CHECK_CONVERGENCE", "false")
+    _, base4 = _get_base_settings()
+    assert base4 is not base3
+    assert base4.CHECK_CONVERGENCE is False
+
+
+def test_thread_settings_overlay(tmp_path, monkeypatch):
+    from quacc import _get_base_settings, _internally_set_settings, get_settings
+
+    config_file = tmp_path / "quacc_test.yaml"
+    config_file.write_text("GZIP_FILES: false")
+    monkeypatch.setenv("QUACC_CONFIG_FILE", str(config_file))
+
+    try:
+        _internally_set_settings(reset=True)
+        settings = get_settings()
+        _, base = _get_base_settings()
+        assert settings is not base
+        assert settings.ESPRESSO_BINARIES is not base.ESPRESSO_BINARIES
+
+        with change_settings({"CHECK_CONVERGENCE": False}):
+            assert get_settings().CHECK_CONVERGENCE is False
+            assert base.CHECK_CONVERGENCE is True
+
+            # Overrides survive a refresh from the config file
+            config_file.write_text("GZIP_FILES: true")
+            os.utime(config_file, ns=(0, 0))
+            assert get_settings().GZIP_FILES is True
+            assert get_settings().CHECK_CONVERGENCE is False
+
+        assert get_settings().CHECK_CONVERGENCE is True
+
+        # Restored values are not pinned as overrides
+        config_file.write_text("GZIP_FILES: true\nCHECK_CONVERGENCE: false")
+        os.utime(config_file, ns=(1, 1))
+        assert get_settings().CHECK_CONVERGENCE is False
+    finally:
+        monkeypatch.delenv("QUACC_CONFIG_FILE")
+        _internally_set_settings(reset=True)
+
+
+def test_change_settings_restores_in_place():
+    settings = get_settings()
+    with change_settings({"GZIP_FILES": False}):
+        assert get_settings() is settings
+        assert settings.GZIP_FILES is False
+    assert settings.GZIP_FILES is True
+
+
+def test_settings_threads_cached(tmp_path, monkeypatch):
+    """The base settings are only constructed once per config file and environment."""
+    import quacc
+    from quacc import _internally_set_settings
+
+    config_file = tmp_path / "quacc_test.yaml"
+    config_file.write_text("GZIP_FILES: false\nSTORE: null")
+    monkeypatch.setenv("QUACC_CONFIG_FILE", str(config_file))
+
+    n_constructed = 0
+
+    class CountingSettings(QuaccSettings):
+        def __init__(self, **kwargs):
+            nonlocal n_constructed
+            n_constructed += 1
+            super().__init__(**kwargs)
+
+    def _access_settings():
+        for _ in range(20):
+            assert get_settings().GZIP_FILES is False
+        with change_settings({"CHECK_CONVERGENCE": False}):
+            assert get_settings().CHECK_CONVERGENCE is False
+
+    def _run_in_threads():
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for future in [executor.submit(_access_settings) for _ in range(50)]:
+                future.result()
+
+    monkeypatch.setattr(quacc, "QuaccSettings", CountingSettings)
+    try:
+        _internally_set_settings(reset=True)
+        _run_in_threads()
+        assert n_constructed == 1
+
+        os.utime(config_file, ns=(1, 1))
+        _run_in_threads()
+        assert n_constructed == 2
+
+        monkeypatch.setenv("QUACC_CHECK_CONVERGENCE", "true")
+        _run_in_threads()
+        assert n_constructed == 3
+    finally:
+        monkeypatch.undo()
+        _internally_set_settings(reset=True)
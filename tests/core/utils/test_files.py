@@ -12,6 +12,7 @@ from quacc.utils.files import (
     check_logfile,
     copy_decompress_files,
     find_recent_logfile,
+    load_yaml_calc,
     make_unique_dir,
 )
 
@@ -244,3 +245,22 @@ def test_find_recent_logfile_only_checks_files_matching_the_extension_when_file_
 
     actual = find_recent_logfile(tmp_path, logfile_extensions=".log")
     assert actual is None
+
+
+def test_load_yaml_calc_cache(tmp_path):
+    parent = tmp_path / "parent.yaml"
+    child = tmp_path / "child.yaml"
+    parent.write_text("inputs:\n  encut: 400\n  ismear: 0\n")
+    child.write_text("parent: parent\ninputs:\n  encut: 520\n")
+
+    config = load_yaml_calc(child)
+    assert config == {"inputs": {"encut": 520, "ismear": 0}}
+
+    # Modifying the returned config does not modify the cache
+    config["inputs"]["encut"] = 1
+    assert load_yaml_calc(child)["inputs"]["encut"] == 520
+
+    # Changes to a parent file are picked up
+    parent.write_text("inputs:\n  encut: 400\n  ismear: -5\n")
+    os.utime(parent, ns=(0, parent.stat().st_mtime_ns + 1_000_000))
+    assert load_yaml_calc(child)["inputs"]["ismear"] == -5
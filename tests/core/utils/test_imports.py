@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ["custodian", "emmet", "maggma", "phonopy", "pymatgen"]
+IMPORT_TIME_BUDGET = 2.0  # seconds
+
+
+def _import_in_subprocess(tmp_path, statement: str) -> dict:
+    config_file = tmp_path / "empty.yaml"
+    config_file.touch()
+    env = os.environ | {
+        "QUACC_CONFIG_FILE": str(config_file),
+        "QUACC_RESULTS_DIR": str(tmp_path),
+    }
+    env.pop("QUACC_SCRATCH_DIR", None)
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"heavy = sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules)\n"
+        "print(json.dumps({'elapsed': elapsed, 'heavy': heavy}))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        cwd=tmp_path,
+        env=env,
+        text=True,
+    )
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def test_import_quacc_is_lazy(tmp_path):
+    result = _import_in_subprocess(tmp_path, "import quacc")
+    assert result["heavy"] == []
+
+
+def test_import_quacc_time_budget(tmp_path):
+    result = _import_in_subprocess(tmp_path, "import quacc")
+    assert result["elapsed"] < IMPORT_TIME_BUDGET
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import quacc.utils",
+        "import quacc.calculators.vasp",
+        "import quacc.calculators.qchem",
+        "import quacc.calculators.espresso",
+        "import quacc.schemas.ase",
+        "import quacc.recipes.emt.core",
+        "import quacc.recipes.lj.core",
+    ],
+)
+def test_submodules_are_lazy(tmp_path, statement):
+    result = _import_in_subprocess(tmp_path, statement)
+    assert result["heavy"] == []
+
+
+def test_lazy_attributes():
+    from quacc.calculators.espresso import Espresso
+    from quacc.calculators.qchem import QChem
+    from quacc.calculators.vasp import Vasp
+    from quacc.utils import check_charge_and_spin
+
+    assert Vasp.__name__ == "Vasp"
+    assert QChem.__name__ == "QChem"
+    assert Espresso.__name__ == "Espresso"
+    assert callable(check_charge_and_spin)
+
+    import quacc.utils
+
+    with pytest.raises(AttributeError, match="has no attribute"):
+        quacc.utils.not_a_real_name  # noqa: B018
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from ase.build import bulk
+from ase.calculators.emt import EMT
+from ase.optimize import BFGSLineSearch
+
+from quacc import change_settings
+from quacc.runners.ase import Runner
+from quacc.schemas.ase import Summarize
+from quacc.utils.perf import (
+    DynamicsProfiler,
+    get_directory_size,
+    get_perf_recorder,
+    perf_phase,
+    pop_perf_phases,
+    to_chrome_trace,
+)
+
+
+def test_perf_disabled(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert get_perf_recorder() is None
+    with perf_phase("test") as record:
+        assert record == {}
+    assert pop_perf_phases() is None
+
+    atoms = Runner(bulk("Cu"), EMT()).run_calc()
+    assert "perf" not in Summarize().run(atoms, atoms)
+
+
+def test_perf_phase(tmp_path):
+    with change_settings({"PERF_TELEMETRY": True}):
+        pop_perf_phases()
+        with perf_phase("outer"):
+            with perf_phase("middle"):
+                with perf_phase("inner") as record:
+                    record["nbytes"] = 10
+                assert pop_perf_phases() is None
+            phases = pop_perf_phases()
+        assert [phase["name"] for phase in phases] == ["inner", "middle"]
+        assert phases[0]["depth"] == 2
+        assert phases[0]["nbytes"] == 10
+        assert phases[1]["wall_time"] >= phases[0]["wall_time"] >= 0
+        assert phases[1]["max_rss"] > 0
+
+        # The enclosing phase is not carried over to the next document
+        assert pop_perf_phases() == []
+        with perf_phase("next"):
+            pass
+        assert [phase["name"] for phase in pop_perf_phases()] == ["next"]
+
+    (tmp_path / "dir").mkdir()
+    (tmp_path / "dir" / "file").write_text("1234")
+    assert get_directory_size(tmp_path) == 4
+
+
+def test_perf_schema(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    trace_file = tmp_path / "trace.jsonl"
+    with change_settings({"PERF_TELEMETRY": True, "PERF_TRACE_FILE": trace_file}):
+        pop_perf_phases()
+        runner = Runner(bulk("Cu"), EMT(), copy_files={tmp_path: "*.jsonl"})
+        atoms = runner.run_calc()
+        results = Summarize().run(atoms, atoms)
+
+        dyn = Runner(bulk("Cu"), EMT()).run_opt()
+        opt_results = Summarize().opt(dyn)
+
+    names = [phase["name"] for phase in results["perf"]]
+    for name in [
+        "calc_setup",
+        "calc_setup.stage_in",
+        "Runner.run_calc",
+        "calc_cleanup.gzip",
+        "calc_cleanup.stage_out",
+        "calc_cleanup",
+        "atoms_to_metadata",
+    ]:
+        assert name in names
+    assert all(phase["nbytes"] >= 0 for phase in results["perf"] if "nbytes" in phase)
+
+    opt_names = [phase["name"] for phase in opt_results["perf"]]
+    assert "Runner.run_opt" in opt_names
+    assert "Summarize.run" in opt_names
+    assert "Runner.run_calc" not in opt_names
+
+    events = [json.loads(line) for line in trace_file.read_text().splitlines()]
+    event_names = {event["name"] for event in events}
+    assert {"Runner.run_calc", "Summarize.run", "finalize_dict.write"} <= event_names
+    assert all(event["ph"] == "X" for event in events)
+
+    to_chrome_trace(trace_file, tmp_path / "trace.json")
+    chrome_trace = json.loads((tmp_path / "trace.json").read_text())
+    assert len(chrome_trace["traceEvents"]) == len(events)
+
+
+def test_perf_bad_trace_file(tmp_path, caplog):
+    with change_settings(
+        {"PERF_TELEMETRY": True, "PERF_TRACE_FILE": tmp_path / "missing" / "t.jsonl"}
+    ):
+        pop_perf_phases()
+        with perf_phase("test"):
+            pass
+        assert pop_perf_phases()[0]["name"] == "test"
+    assert "Could not write" in caplog.text
+
+
+@pytest.mark.parametrize("telemetry", [True, False])
+@pytest.mark.parametrize("trace", [True, False])
+def test_perf_phase_many(tmp_path, telemetry, trace):
+    trace_file = tmp_path / "trace.jsonl"
+    with change_settings(
+        {"PERF_TELEMETRY": telemetry, "PERF_TRACE_FILE": trace_file if trace else None}
+    ):
+        pop_perf_phases()
+        for i in range(100):
+            with perf_phase(f"test{i}"):
+                pass
+        phases = pop_perf_phases()
+
+    if telemetry:
+        assert [phase["name"] for phase in phases] == [f"test{i}" for i in range(100)]
+    else:
+        assert phases is None
+    if telemetry and trace:
+        assert len(trace_file.read_text().splitlines()) == 100
+    else:
+        assert not trace_file.exists()
+
+
+def test_perf_opt(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with change_settings({"PERF_TELEMETRY": True}):
+        calc = EMT()
+        dyn = Runner(bulk("Cu") * (2, 1, 1), calc).run_opt(
+            relax_cell=True, optimizer=BFGSLineSearch
+        )
+        results = Summarize().opt(dyn, check_convergence=False)
+
+    perf_opt = results["perf_opt"]
+    n_steps = perf_opt["n_steps"]
+    assert n_steps == len(perf_opt["step_wall_times"]) == len(perf_opt["step_n_calls"])
+    assert sum(perf_opt["step_n_calls"]) == perf_opt["n_calls"] > 0
+    assert perf_opt["n_requests"] >= perf_opt["n_calls"]
+    assert 0 <= perf_opt["cache_hit_rate"] <= 1
+    assert perf_opt["calc_time"] <= perf_opt["total_time"]
+    assert perf_opt["optimizer_time"] >= 0
+    assert "calculate" not in vars(calc)
+    assert "get_property" not in vars(calc)
+
+
+def test_perf_opt_disabled(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    dyn = Runner(bulk("Cu"), EMT()).run_opt()
+    assert not hasattr(dyn, "perf_opt")
+    assert "perf_opt" not in Summarize().opt(dyn)
+
+
+def test_dynamics_profiler():
+    atoms = bulk("Cu")
+    atoms.calc = EMT()
+    with DynamicsProfiler([atoms.calc]) as profiler:
+        atoms.get_potential_energy()
+        atoms.get_potential_energy()
+        profiler.step()
+        atoms.rattle()
+        atoms.get_forces()
+        profiler.step()
+    summary = profiler.as_dict()
+    assert summary["n_calls"] == 2
+    assert summary["n_requests"] == 3
+    assert summary["cache_hit_rate"] == pytest.approx(1 / 3)
+    assert summary["step_n_calls"] == [1, 1]
+    assert atoms.get_potential_energy() < 0
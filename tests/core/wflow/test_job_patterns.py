@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import numpy as np
 import pytest
+from ase.build import bulk, molecule
 
 from quacc import job
 from quacc.wflow_tools.job_patterns import (
+    estimate_cost,
     kwarg_map,
+    map_batched,
     map_partition,
     map_partitioned_lists,
     partition,
@@ -97,3 +100,105 @@ def test_map_partition():
     ]
     with pytest.raises(AssertionError):
         kwarg_map(test_fun, a=[1, 2, 3], b=[1, 2])
+
+
+def test_estimate_cost():
+    atoms = bulk("Cu") * (2, 2, 2)
+    assert estimate_cost(atoms, method="mlp") == 8
+    assert estimate_cost(atoms) == pytest.approx(8**3 * 1000 / 8)
+    assert estimate_cost({"atoms": atoms}, kppa=1) == 8**3
+    assert estimate_cost(molecule("H2O")) == 27
+    with pytest.raises(ValueError, match="Unknown method"):
+        estimate_cost(atoms, method="bad")
+
+
+def test_partition_costs():
+    costs = [1, 1, 1, 1, 1, 1, 10, 1, 1, 10]
+    items = list(range(len(costs)))
+    partitioned = partition(items, 2, costs=costs)
+    assert partitioned == [[0, 2, 4, 6, 7], [1, 3, 5, 8, 9]]
+    assert [sum(costs[i] for i in p) for p in partitioned] == [14, 14]
+    assert partition(items, 2) == [[0, 1, 2, 3, 4], [5, 6, 7, 8, 9]]
+    assert unpartition(partitioned, costs=costs) == items
+
+    partitioned_cost_fn = partition(items, 2, costs=lambda i: costs[i])
+    assert partitioned_cost_fn == partitioned
+    assert unpartition(
+        [[10 * i for i in part] for part in partitioned_cost_fn],
+        costs=lambda i: costs[i],
+        list_to_partition=items,
+    ) == [10 * i for i in items]
+    with pytest.raises(ValueError, match="must be provided if `costs` is a function"):
+        unpartition(partitioned_cost_fn, costs=lambda i: costs[i])
+    with pytest.raises(ValueError, match="must match the number of items"):
+        unpartition(partitioned, costs=costs[:-1])
+
+    with pytest.raises(ValueError, match="must match the number of items"):
+        partition(items, 2, costs=[1, 2])
+
+
+def test_map_partitioned_lists_costs():
+    atoms_list = [bulk("Cu") * (n, 1, 1) for n in [1, 8, 1, 1, 8, 1]]
+    costs = [estimate_cost(atoms, method="mlp") for atoms in atoms_list]
+
+    def natoms(atoms, label, const=0):
+        return (len(atoms) + const, label)
+
+    result = map_partitioned_lists(
+        natoms,
+        2,
+        unmapped_kwargs={"const": 1},
+        dynamic=True,
+        atoms=partition(atoms_list, 2, costs=costs),
+        label=partition(list("abcdef"), 2, costs=costs),
+    )
+    assert unpartition(result, costs=costs) == [
+        (2, "a"),
+        (9, "b"),
+        (2, "c"),
+        (2, "d"),
+        (9, "e"),
+        (2, "f"),
+    ]
+    assert sorted(sum(r[0] for r in part) for part in result) == [13, 13]
+
+
+def test_map_batched():
+    @job
+    def add(a, b, c=0):
+        return a + b + c
+
+    result = map_batched(
+        add, 4, unmapped_kwargs={"c": 1}, a=list(range(10)), b=list(range(10))
+    )
+    assert result == [2 * i + 1 for i in range(10)]
+    assert map_batched(add, 20, a=[1, 2], b=[3, 4]) == [4, 6]
+
+    with pytest.raises(AssertionError, match="Inconsistent lengths"):
+        map_batched(add, 2, a=[1, 2, 3], b=[1, 2])
+    with pytest.raises(ValueError, match="at least 1"):
+        map_batched(add, 0, a=[1], b=[1])
+    with pytest.raises(ValueError, match="At least one mapped kwarg"):
+        map_batched(add, 2, unmapped_kwargs={"a": 1, "b": 2})
+
+
+def test_map_batched_decorator():
+    n_batches = 0
+
+    def count_batches(func):
+        def wrapper(*args, **kwargs):
+            nonlocal n_batches
+            n_batches += 1
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    @job
+    def add(a, b):
+        return a + b
+
+    result = map_batched(
+        add, 3, decorator=count_batches, a=list(range(7)), b=list(range(7))
+    )
+    assert result == [2 * i for i in range(7)]
+    assert n_batches == 3
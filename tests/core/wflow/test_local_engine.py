@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import operator
+import threading
+
+import pytest
+
+from quacc import change_settings, get_settings
+from quacc.wflow_tools.local_engine import (
+    LocalEngine,
+    LocalFuture,
+    resolve_local_futures,
+)
+
+
+@pytest.fixture
+def engine():
+    engine = LocalEngine(max_workers=2)
+    yield engine
+    engine.shutdown()
+
+
+def test_local_engine_dependencies(engine):
+    first = engine.submit(operator.add, (1, 2), {})
+    second = engine.submit(operator.mul, (first, 3), {})
+    assert isinstance(second, LocalFuture)
+    assert second.result() == 9
+    nested = engine.submit(sum, ([first, second],), {})
+    assert nested.result() == 12
+
+
+def test_local_engine_getitem(engine):
+    future = engine.submit(dict, (), {"a": [1, 2, 3]})
+    assert future["a"][1].result() == 2
+    assert resolve_local_futures({"x": [future["a"]]}) == {"x": [[1, 2, 3]]}
+
+
+def test_local_engine_failure(engine):
+    failed = engine.submit(operator.truediv, (1, 0), {})
+    dependent = engine.submit(operator.add, (failed, 1), {})
+    with pytest.raises(ZeroDivisionError):
+        dependent.result()
+    assert engine.submit(operator.add, (1, 1), {}).result() == 2
+
+
+def test_local_engine_slots(engine):
+    running = []
+    peak = []
+    lock = threading.Lock()
+
+    def track(slots):
+        with lock:
+            running.append(slots)
+            peak.append(sum(running))
+        threading.Event().wait(0.05)
+        with lock:
+            running.remove(slots)
+        return slots
+
+    futures = [engine.submit(track, (2,), {}, slots=2) for _ in range(2)]
+    futures += [engine.submit(track, (1,), {}) for _ in range(4)]
+    futures.append(engine.submit(track, (2,), {}, slots=10))
+    assert [future.result() for future in futures] == [2, 2, 1, 1, 1, 1, 2]
+    assert max(peak) <= engine.max_workers
+
+    with pytest.raises(ValueError, match="at least one slot"):
+        engine.submit(track, (1,), {}, slots=0)
+
+
+def test_local_engine_subflow(engine):
+    def fan_out(vals):
+        return [engine.submit(operator.add, (val, 1), {}) for val in vals]
+
+    vals = engine.submit(list, (range(3),), {})
+    assert engine.submit_subflow(fan_out, (vals,), {}).result() == [1, 2, 3]
+
+
+def test_local_engine_settings(engine):
+    def get_scratch_dir():
+        return get_settings().SCRATCH_DIR
+
+    with change_settings({"SCRATCH_DIR": "/tmp/quacc-local"}):
+        future = engine.submit(get_scratch_dir, (), {})
+    assert str(future.result()) == "/tmp/quacc-local"
+
+
+def test_local_engine_process():
+    engine = LocalEngine(executor="process", max_workers=2)
+    first = engine.submit(operator.add, (1, 2), {})
+    assert engine.submit(operator.mul, (first, 3), {}).result() == 9
+
+    # Functions that cannot be pickled are run in a thread instead
+    def add(a, b):
+        return a + b
+
+    assert engine.submit(add, (first, 1), {}).result() == 4
+    engine.shutdown()
+
+
+def test_local_engine_bad_executor():
+    with pytest.raises(ValueError, match="Unknown executor"):
+        LocalEngine(executor="bad")
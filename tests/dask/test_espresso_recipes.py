@@ -244,6 +244,41 @@ def test_phonon_grid_v2(tmp_path, monkeypatch):
         assert key in grid_results["results"][1]
 
 
+def test_phonon_grid_shared_outdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("OMP_NUM_THREADS", "1")
+
+    copy_decompress_files(DATA_DIR, ["Si.upf.gz"], tmp_path)
+
+    ph_loose = {"inputph": {"tr2_ph": 1e-6, "lqdir": True}}
+
+    relax_output = client.compute(
+        relax_job(
+            bulk("Si"),
+            input_data={
+                "electrons": {"conv_thr": 1.0e-1},
+                "control": {"pseudo_dir": tmp_path},
+            },
+            pseudopotentials={"Si": "Si.upf"},
+            kspacing=0.5,
+        )
+    ).result()
+    job_params = {"ph_job": {"input_data": ph_loose, "qpts": (2, 2, 2)}}
+
+    future = grid_phonon_flow(
+        prev_outdir=relax_output["dir_name"], share_outdir=True, job_params=job_params
+    )
+    grid_results = client.compute(future).result()
+
+    for key in ["eqpoints", "freqs", "representations"]:
+        assert key in grid_results["results"][1]
+
+    save_dir = Path(grid_results["dir_name"], "pwscf.save")
+    assert save_dir.is_symlink()
+    assert save_dir.resolve() == Path(relax_output["dir_name"], "pwscf.save").resolve()
+    assert Path(save_dir, "data-file-schema.xml").exists()
+
+
 def test_pp_concurrent_inplace(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     monkeypatch.setenv("OMP_NUM_THREADS", "1")
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from quacc import flow, job, strip_decorator, subflow
+from quacc.wflow_tools.local_engine import LocalFuture
+
+
+def test_local_decorators(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    @job
+    def add(a, b):
+        return a + b
+
+    @job
+    def mult(a, b):
+        return a * b
+
+    @job
+    def make_more(val):
+        return [val] * 3
+
+    @subflow
+    def add_distributed(vals, c):
+        return [add(val, c) for val in vals]
+
+    @subflow
+    def add_distributed2(vals, c, op):
+        return [op(val, c) for val in vals]
+
+    @flow
+    def workflow(a, b, c):
+        return mult(add(a, b), c)
+
+    @flow
+    def dynamic_workflow(a, b, c):
+        result1 = add(a, b)
+        result2 = make_more(result1)
+        return add_distributed(result2, c)
+
+    @flow
+    def dynamic_workflow2(a, b, c):
+        result1 = add(a, b)
+        result2 = make_more(result1)
+        return add_distributed2(result2, c, add)
+
+    @flow
+    def dynamic_workflow3(a, b, c):
+        result1 = add(a, b)
+        result2 = make_more(result1)
+        result3 = add_distributed(result2, c)
+        result4 = add_distributed(result3, c)
+        return add(result4[0], c)
+
+    assert isinstance(add(1, 2), LocalFuture)
+    assert add(1, 2).result() == 3
+    assert mult(1, 2).result() == 2
+    assert workflow(1, 2, 3).result() == 9
+    assert dynamic_workflow(1, 2, 3).result() == [6, 6, 6]
+    assert dynamic_workflow2(1, 2, 3).result() == [6, 6, 6]
+    assert dynamic_workflow3(1, 2, 3).result() == 12
+
+
+def test_local_decorators_args(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    @job()
+    def add(a, b):
+        return a + b
+
+    @job(slots=2)
+    def mult(a, b):
+        return a * b
+
+    @job()
+    def make_more(val):
+        return [val] * 3
+
+    @subflow()
+    def add_distributed(vals, c):
+        return [add(val, c) for val in vals]
+
+    @flow()
+    def workflow(a, b, c):
+        return mult(add(a, b), c)
+
+    @flow()
+    def dynamic_workflow(a, b, c):
+        result1 = add(a, b)
+        result2 = make_more(result1)
+        return add_distributed(result2, c)
+
+    assert add(1, 2).result() == 3
+    assert mult(1, 2).result() == 2
+    assert workflow(1, 2, 3).result() == 9
+    assert dynamic_workflow(1, 2, 3).result() == [6, 6, 6]
+
+
+def test_local_strip_decorator():
+    @job
+    def add(a, b):
+        return a + b
+
+    assert strip_decorator(add)(1, 2) == 3
+
+
+def test_local_concurrency():
+    barrier = threading.Barrier(2, timeout=10)
+
+    @job
+    def wait(val):
+        barrier.wait()
+        return val
+
+    start = time.perf_counter()
+    futures = [wait(1), wait(2)]
+    assert [future.result() for future in futures] == [1, 2]
+    assert time.perf_counter() - start < 10
+
+
+def test_local_failure_propagates():
+    @job
+    def fail():
+        raise ValueError("bad job")
+
+    @job
+    def add_one(val):
+        return val + 1
+
+    with pytest.raises(ValueError, match="bad job"):
+        add_one(fail()).result()
+
+
+def test_local_map_partitioned_lists_dynamic():
+    from quacc.wflow_tools.job_patterns import (
+        map_partitioned_lists,
+        partition,
+        unpartition,
+    )
+
+    costs = [1, 5, 1, 1, 5, 1]
+
+    def double(val):
+        return 2 * val
+
+    @flow
+    def workflow(vals):
+        partitioned = partition(vals, 2, costs=costs)
+        result = map_partitioned_lists(double, 2, dynamic=True, val=partitioned)
+        return unpartition(result, costs=costs)
+
+    assert workflow(list(range(6))).result() == [0, 2, 4, 6, 8, 10]
+
+
+def test_local_map_batched():
+    from quacc.wflow_tools.job_patterns import map_batched
+
+    @job
+    def add(a, b):
+        return a + b
+
+    futures = map_batched(add, 3, a=list(range(7)), b=list(range(7)))
+    assert len(futures) == 7
+    assert all(isinstance(future, LocalFuture) for future in futures)
+    assert [future.result() for future in futures] == [2 * i for i in range(7)]